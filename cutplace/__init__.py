@@ -8,7 +8,7 @@ accessible through a Python API.
 from cutplace.errors import Location
 from cutplace.interface import Cid
 from cutplace.ranges import Range
-from cutplace.validio import Reader, Writer, validate, rows
+from cutplace.validio import Reader, Writer, validate, rows, async_rows
 from cutplace._version import get_versions
 
 #: Package version information.
@@ -24,5 +24,6 @@ __all__ = [
     'Writer',
     'validate',
     'rows',
+    'async_rows',
     '__version__'
 ]
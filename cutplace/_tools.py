@@ -24,13 +24,16 @@ import errno
 import logging
 import os
 import io
+import tempfile
 import token
 import tokenize
 
 import six
+from six.moves import cPickle as pickle
 
 from cutplace import _compat
 
+_log = logging.getLogger("cutplace")
 
 #: Mapping for value of :option:`--log` to logging level.
 LOG_LEVEL_NAME_TO_LEVEL_MAP = {
@@ -151,6 +154,16 @@ def is_comma_token(some_token):
     return (some_token[0] == token.OP) and (some_token[1] == ",")
 
 
+def is_op_token(some_token, operator):
+    """
+    True if ``some_token`` is a token that represents ``operator``, for
+    example ``'('``.
+    """
+    assert some_token
+    assert operator
+    return (some_token[0] == token.OP) and (some_token[1] == operator)
+
+
 def with_suffix(path, suffix=''):
     """
     Same as ``path`` but with suffix changed to ``suffix``.
@@ -177,3 +190,39 @@ def length_of_int(int_value):
     assert isinstance(int_value, six.integer_types), 'value=%r' % int_value
 
     return len(six.text_type(int_value))
+
+
+def write_pickled(target_path, objects_to_pickle):
+    """
+    Write each of ``objects_to_pickle`` to ``target_path`` using
+    :py:func:`pickle.dump`. Writing to a temporary file first ensures that
+    concurrent processes either find the old file or the new one.
+
+    :raises EnvironmentError: if the file cannot be written
+    :raises pickle.PicklingError: if an object cannot be pickled
+    """
+    assert target_path is not None
+    assert objects_to_pickle is not None
+
+    target_folder = os.path.dirname(target_path) or os.curdir
+    if not os.path.exists(target_folder):
+        os.makedirs(target_folder)
+    temp_fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(target_path) + '_', suffix='.tmp', dir=target_folder)
+    try:
+        with io.open(temp_fd, 'wb') as temp_file:
+            for object_to_pickle in objects_to_pickle:
+                pickle.dump(object_to_pickle, temp_file, pickle.HIGHEST_PROTOCOL)
+        if six.PY2:  # pragma: no cover
+            # Python 2 has no os.replace() and cannot rename to an existing file on Windows.
+            if os.path.exists(target_path):
+                os.remove(target_path)
+            os.rename(temp_path, target_path)
+        else:
+            os.replace(temp_path, target_path)
+        temp_path = None
+    finally:
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except (EnvironmentError, OSError) as error:
+                _log.debug('cannot remove temporary file "%s": %s', temp_path, error)
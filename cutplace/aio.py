@@ -0,0 +1,370 @@
+"""
+Validated input and output of delimited data using :py:mod:`asyncio`.
+
+Unlike the rest of cutplace, this module requires Python 3.6 or later
+because it uses asynchronous generators. Consequently it is not imported by
+``import cutplace``; use :py:func:`cutplace.async_rows` or import it
+explicitly.
+"""
+# Copyright (C) 2009-2015 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import asyncio
+import codecs
+import io
+
+from cutplace import data
+from cutplace import errors
+from cutplace import rowio
+from cutplace import validio
+
+#: Number of bytes :py:class:`AsyncReader` processes at once and
+#: :py:class:`AsyncWriter` collects before passing them on to its target.
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+
+class AsyncReader(validio.BaseValidator):
+    def __init__(self, cid_or_path, source, on_error='raise', validate_until=None, buffer_size=None):
+        """
+        An asynchronous iterator that produces possibly validated rows of
+        delimited data read from ``source`` conforming to ``cid_or_path``.
+
+        ``source`` can be an :py:class:`asyncio.StreamReader` or any other
+        object with a coroutine ``read(n)``, or an asynchronous iterable.
+        Either way it has to provide chunks of :py:class:`bytes`, which are
+        decoded using the encoding of the CID, or chunks of :py:class:`str`.
+
+        Chunks are only read when the rows of the previous chunks have been
+        processed, so a slow consumer of :py:meth:`~.rows` slows down
+        reading from ``source``. Large chunks are processed in parts of
+        ``buffer_size`` bytes and control is passed back to the event loop
+        after each part.
+
+        The rows of a part can be read as soon as it contains a line
+        delimiter outside of quotes. Similar to
+        :py:func:`cutplace.rowio.delimited_chunks` this requires the data
+        format to use a doubled quote character to escape quotes, otherwise
+        all data are read before the first row is produced. Furthermore
+        quote characters must only be used to quote whole items, otherwise
+        the data might be split within a quoted item and result in a
+        :py:exc:`cutplace.errors.DataFormatError`.
+
+        :param str on_error: same as ``on_error`` for \
+          :py:class:`cutplace.validio.Reader`
+        :param validate_until: same as ``validate_until`` for \
+          :py:class:`cutplace.validio.Reader`
+        :param buffer_size: maximum number of bytes or characters \
+          processed at once; ``None`` means :py:const:`DEFAULT_BUFFER_SIZE`
+        :type buffer_size: int or None
+        :raises NotImplementedError: if the data format is not delimited
+        """
+        assert cid_or_path is not None
+        assert source is not None
+        assert on_error in validio._VALID_ON_ERROR_CHOICES, 'on_error=%r' % on_error
+        assert (validate_until is None) or (validate_until >= 0)
+        assert (buffer_size is None) or (buffer_size >= 1), 'buffer_size=%r' % buffer_size
+
+        super(AsyncReader, self).__init__(cid_or_path)
+        data_format = self.cid.data_format
+        if data_format.format != data.FORMAT_DELIMITED:
+            raise NotImplementedError('data_format=%r' % data_format.format)
+        try:
+            source_path = source.name
+        except AttributeError:
+            source_path = '<io>'
+        self._location = errors.Location(source_path, has_cell=True)
+        # Character ending a record unless it is within quotes.
+        self._newline = '\r' if data_format.line_delimiter == '\r' else '\n'
+        self._source = source
+        self._on_error = on_error
+        self._validate_until = validate_until
+        self._buffer_size = buffer_size if buffer_size is not None else DEFAULT_BUFFER_SIZE
+        self.accepted_rows_count = None
+        self.rejected_rows_count = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Simply call :py:meth:`~.close()`.
+        """
+        self.close()
+
+    @property
+    def on_error(self):
+        return self._on_error
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    async def _source_parts(self):
+        """
+        Chunks read from ``source`` split into parts of at most
+        :py:attr:`~.buffer_size` bytes or characters.
+        """
+        if hasattr(self._source, 'read'):
+            chunk = await self._source.read(self.buffer_size)
+            while chunk:
+                yield chunk
+                chunk = await self._source.read(self.buffer_size)
+        else:
+            async for chunk in self._source:
+                for part_start in range(0, len(chunk), self.buffer_size):
+                    yield chunk[part_start:part_start + self.buffer_size]
+
+    def _decoded(self, decoder, part, line_count_before, pending_texts, final=False):
+        """
+        ``part`` decoded to :py:class:`str` with the location of possible
+        errors pointing at the line after ``line_count_before`` lines plus
+        the lines in ``pending_texts`` and in ``part`` before the error.
+        """
+        try:
+            return decoder.decode(part, final)
+        except UnicodeError as error:
+            line_count = line_count_before \
+                + sum(pending_text.count(self._newline) for pending_text in pending_texts) \
+                + part[:error.start].decode(self.cid.data_format.encoding, 'replace').count(self._newline)
+            raise errors.DataFormatError(
+                'cannot decode delimited data: %s' % error, errors.Location(self._location.file_path).copy_at(line_count))
+
+    def _raw_rows(self, text, line_count_before):
+        """
+        Rows in ``text``, which must end at a record boundary, with the
+        location of possible errors pointing at the line after
+        ``line_count_before`` lines.
+        """
+        try:
+            with io.StringIO(text, newline='') as text_stream:
+                for row in rowio.delimited_rows(text_stream, self.cid.data_format):
+                    yield row
+        except errors.DataFormatError as error:
+            raise errors.DataFormatError(
+                error.message,
+                errors.Location(self._location.file_path).copy_at(line_count_before + error.location.line))
+
+    async def _record_texts(self):
+        """
+        Texts read from ``source`` each ending at a record boundary, except
+        possibly the last one.
+        """
+        data_format = self.cid.data_format
+        quote = data_format.quote_character
+        newline = self._newline
+        is_splittable = (data_format.escape_character == quote)
+        # Texts read since the last record boundary.
+        pending_texts = []
+        # Is the end of ``pending_texts`` within quotes?
+        is_quoted = False
+        line_count_before = 0
+        decoder = codecs.getincrementaldecoder(data_format.encoding)()
+        async for part in self._source_parts():
+            text = self._decoded(decoder, part, line_count_before, pending_texts) if isinstance(part, bytes) else part
+            record_end = -1
+            if is_splittable:
+                last_newline_position = text.rfind(newline)
+                if last_newline_position == -1:
+                    is_quoted ^= (text.count(quote) % 2 == 1)
+                else:
+                    is_quoted ^= (text.count(quote, 0, last_newline_position) % 2 == 1)
+                    if not is_quoted:
+                        record_end = last_newline_position + 1
+                    is_quoted ^= (text.count(quote, last_newline_position) % 2 == 1)
+            if record_end == -1:
+                pending_texts.append(text)
+            else:
+                pending_texts.append(text[:record_end])
+                record_text = ''.join(pending_texts)
+                yield record_text, line_count_before
+                line_count_before += record_text.count(newline)
+                pending_texts = [text[record_end:]]
+            # Let other tasks run between parts.
+            await asyncio.sleep(0)
+        pending_texts.append(self._decoded(decoder, b'', line_count_before, pending_texts, True))
+        record_text = ''.join(pending_texts)
+        if record_text:
+            yield record_text, line_count_before
+
+    async def rows(self):
+        """
+        Data rows of ``source``, which can be iterated using ``async for``.
+
+        Like :py:meth:`cutplace.validio.Reader.rows`, broken data still cause
+        a stop even with ``on_error`` set to ``'continue'`` or ``'yield'``.
+        Call :py:meth:`~.close()` or use ``async with`` to also validate
+        the checks at the end of the data.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
+        self.accepted_rows_count = 0
+        self.rejected_rows_count = 0
+        for check in self.cid.check_map.values():
+            check.reset()
+        header_row_count = self.cid.data_format.header
+        compiled_row_validator = self._compiled_row_validator
+        is_raising_field_errors = self.on_error in ('raise', 'yield')
+        row_count = 0
+        self._location.set_line(0)
+        async for record_text, line_count_before in self._record_texts():
+            for row in self._raw_rows(record_text, line_count_before):
+                row_count += 1
+                try:
+                    is_after_header_row = (row_count > header_row_count)
+                    is_before_validate_until = (self._validate_until is None) or (row_count <= self._validate_until)
+                    broken_field = None
+                    if is_after_header_row and is_before_validate_until:
+                        broken_field = compiled_row_validator.broken_field(row, self._location)
+                        if broken_field is None:
+                            compiled_row_validator.check_row(row, self._location)
+                        elif is_raising_field_errors:
+                            compiled_row_validator.raise_broken_row(row, broken_field, self._location)
+                    if broken_field is None:
+                        self.accepted_rows_count += 1
+                        yield row
+                    else:
+                        self.rejected_rows_count += 1
+                        if self.on_error == 'record':
+                            yield compiled_row_validator.error_record(row, broken_field, self._location)
+                except errors.DataError as error:
+                    if self.on_error == 'raise':
+                        raise
+                    self.rejected_rows_count += 1
+                    if self.on_error == 'yield':
+                        yield error
+                    elif self.on_error == 'record':
+                        yield errors.DataErrorRecord(
+                            self._location.file_path, self._location.line, None, None, None, error)
+                    else:
+                        assert self.on_error == 'continue'
+                self._location.advance_line()
+
+
+class AsyncWriter(object):
+    def __init__(self, cid, target, buffer_size=None):
+        """
+        A writer that validates rows like :py:class:`cutplace.validio.Writer`
+        and passes them on to ``target`` using the encoding of ``cid``.
+
+        ``target`` can be an :py:class:`asyncio.StreamWriter` or any other
+        object with a method ``write(data)`` accepting :py:class:`bytes`
+        and a coroutine ``drain()``. Once the rows written amount to at
+        least ``buffer_size`` bytes, they are passed on to ``target``
+        followed by waiting for ``drain()``. This way a slow ``target``
+        slows down the writer instead of data piling up in memory.
+        ``target`` is not closed by :py:meth:`~.close`.
+
+        :param buffer_size: number of bytes to collect before passing \
+          them on; ``None`` means :py:const:`DEFAULT_BUFFER_SIZE`
+        :type buffer_size: int or None
+        :raises NotImplementedError: if the data format is neither \
+          delimited nor fixed
+        """
+        assert cid is not None
+        assert target is not None
+        assert (buffer_size is None) or (buffer_size >= 1), 'buffer_size=%r' % buffer_size
+
+        self._target = target
+        self._buffer_size = buffer_size if buffer_size is not None else DEFAULT_BUFFER_SIZE
+        self._data_buffer = io.BytesIO()
+        self._text_buffer = io.TextIOWrapper(self._data_buffer, encoding=cid.data_format.encoding, newline='', write_through=True)
+        self._writer = validio.Writer(cid, self._text_buffer)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Simply call :py:meth:`~.close()`.
+        """
+        await self.close()
+
+    @property
+    def cid(self):
+        return self._writer.cid
+
+    @property
+    def location(self):
+        """
+        Same as :py:attr:`cutplace.validio.Writer.location`.
+        """
+        return self._writer.location
+
+    @property
+    def buffer_size(self):
+        return self._buffer_size
+
+    async def _flush(self):
+        """
+        Pass on all rows written so far to the target and wait until it
+        is ready for more.
+        """
+        self._text_buffer.flush()
+        data_to_write = self._data_buffer.getvalue()
+        if data_to_write:
+            self._data_buffer.seek(0)
+            self._data_buffer.truncate()
+            self._target.write(data_to_write)
+            await self._target.drain()
+
+    async def write_row(self, row_to_write):
+        """
+        Validate and write ``row_to_write``.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
+        assert row_to_write is not None
+
+        self._writer.write_row(row_to_write)
+        if self._data_buffer.tell() >= self.buffer_size:
+            await self._flush()
+
+    async def write_rows(self, rows_to_write):
+        assert rows_to_write is not None
+
+        for row_to_write in rows_to_write:
+            await self.write_row(row_to_write)
+
+    async def close(self, check_at_end=True):
+        """
+        Same as :py:meth:`cutplace.validio.Writer.close` but also pass on
+        the remaining rows to the target. When called a second time, do
+        nothing.
+        """
+        if self._text_buffer is not None:
+            try:
+                self._writer.close(check_at_end)
+            finally:
+                await self._flush()
+                self._text_buffer = None
+                self._data_buffer = None
+
+
+async def async_rows(cid_or_path, source, on_error='raise', validate_until=None, buffer_size=None):
+    """
+    Same as :py:func:`cutplace.validio.rows` but reading delimited data from
+    ``source`` using :py:class:`AsyncReader`, so the rows have to be
+    iterated using ``async for``.
+    """
+    assert cid_or_path is not None
+    assert source is not None
+
+    async with AsyncReader(cid_or_path, source, on_error, validate_until, buffer_size) as reader:
+        async for row in reader.rows():
+            yield row
@@ -27,8 +27,9 @@ import argparse
 import logging
 import sys
 
+from six.moves import cPickle as pickle
+
 from cutplace import errors
-from cutplace import gui
 from cutplace import interface
 from cutplace import validio
 from cutplace import rowio
@@ -40,9 +41,15 @@ DEFAULT_CID_ENCODING = 'utf-8'
 DEFAULT_LOG_LEVEL = 'info'
 assert DEFAULT_LOG_LEVEL in _tools.LOG_LEVEL_NAME_TO_LEVEL_MAP
 DEFAULT_VALIDATE_UNTIL = -1
+DEFAULT_JOBS = 1
 
 _log = logging.getLogger("cutplace")
 
+# Settings used by `_validated_data_path()` in worker processes.
+_worker_cid = None
+_worker_validate_until = None
+_worker_log_record_collector = None
+
 
 class CutplaceApp(object):
     """
@@ -62,6 +69,13 @@ class CutplaceApp(object):
         self.last_validation_was_ok = False
         self.all_validations_were_ok = True
         self.validate_until = None
+        self.jobs = DEFAULT_JOBS
+        self.is_cid_cached = False
+        self.cid_cache_folder = None
+        self.plugins_folder = None
+        #: List of tuples ``(data_path, accepted_rows_count, rejected_rows_count)``
+        #: for each data file validated in the order of validation.
+        self.validation_results = []
 
     def set_options(self, argv):
         """
@@ -73,9 +87,19 @@ class CutplaceApp(object):
         version = '%(prog)s ' + __version__
 
         parser = argparse.ArgumentParser(description=description)
+        parser.add_argument(
+            '--cid-cache', action='store_true', dest='is_cid_cached',
+            help='cache the compiled CID-FILE to read it faster next time')
+        parser.add_argument(
+            '--cid-cache-folder', metavar='FOLDER', dest='cid_cache_folder',
+            help='folder to store the CID cache in; implies --cid-cache (default: next to CID-FILE)')
         parser.add_argument(
             '--gui', '--g', action='store_true', dest='is_gui',
             help='provide a graphical user interface to set CID-FILE and DATA-FILE')
+        parser.add_argument(
+            '-j', '--jobs', metavar='COUNT', dest='jobs', default=DEFAULT_JOBS, type=int,
+            help='number of processes to validate multiple data files or a single delimited or fixed data file in parallel '
+            '(default: %d)' % DEFAULT_JOBS)
         parser.add_argument(
             '--log', metavar='LEVEL', choices=sorted(_tools.LOG_LEVEL_NAME_TO_LEVEL_MAP.keys()), dest='log_level',
             default=DEFAULT_LOG_LEVEL, help='set log level to LEVEL (default: %s)' % DEFAULT_LOG_LEVEL)
@@ -106,11 +130,20 @@ class CutplaceApp(object):
                 self.validate_until = args.validate_until
             else:
                 parser.error('option --until is %d but must be at least -1' % args.validate_until)
+        if args.jobs < 1:
+            parser.error('option --jobs is %d but must be at least 1' % args.jobs)
+        self.jobs = args.jobs
+        self.is_cid_cached = args.is_cid_cached or (args.cid_cache_folder is not None)
+        self.cid_cache_folder = args.cid_cache_folder
+        self.plugins_folder = args.plugins_folder
         if args.plugins_folder is not None:
             interface.import_plugins(args.plugins_folder)
         if args.data_paths is not None:
             self.data_paths = args.data_paths
         if args.is_gui:
+            # Import the GUI only when needed because importing tkinter takes a while.
+            from cutplace import gui
+
             if not gui.has_tk:
                 parser.error('tkinter package must be installed in order for --gui to work')
         if args.cid_path is not None:
@@ -127,10 +160,13 @@ class CutplaceApp(object):
         application from ``cid_path``.
         """
         assert cid_path is not None
-        new_cid = interface.Cid()
         _log.info('read CID from "%s"', cid_path)
-        cid_rows = rowio.auto_rows(cid_path)
-        new_cid.read(cid_path, cid_rows)
+        if self.is_cid_cached:
+            new_cid = interface.cached_cid(cid_path, self.cid_cache_folder)
+        else:
+            new_cid = interface.Cid()
+            cid_rows = rowio.auto_rows(cid_path)
+            new_cid.read(cid_path, cid_rows)
         self.cid = new_cid
         self.cid_path = cid_path
 
@@ -143,17 +179,149 @@ class CutplaceApp(object):
         assert self.cid is not None
         assert (self.validate_until is None) or (self.validate_until >= 0)
 
-        _log.info('validate "%s"', data_path)
+        accepted_rows_count, rejected_rows_count = _validate_and_log(
+            self.cid, data_path, self.validate_until, self.jobs)
+        self._add_validation_result(data_path, accepted_rows_count, rejected_rows_count)
 
+    def validate_all(self, data_paths):
+        """
+        Validate all data files in ``data_paths`` using
+        :py:meth:`~.validate`.
+
+        If :py:attr:`jobs` is greater than 1 and there are multiple data
+        files, they are validated in parallel by a pool of processes, each
+        validating one data file at a time. The log messages of each data
+        file are still grouped together and in the order of
+        ``data_paths``.
+
+        :raises EnvironmentError: if a data file cannot be read
+        """
+        assert data_paths is not None
+        assert self.cid is not None
+
+        if (self.jobs > 1) and (len(data_paths) >= 2):
+            self._validate_all_in_parallel(data_paths)
+        else:
+            for data_path in data_paths:
+                try:
+                    self.validate(data_path)
+                except (EnvironmentError, OSError) as error:
+                    raise EnvironmentError("cannot read data file %r: %s" % (data_path, error))
+
+    def _validate_all_in_parallel(self, data_paths):
+        # Import here because most validations do not need multiple processes.
+        import multiprocessing
+
+        assert data_paths
+
+        process_count = min(self.jobs, len(data_paths))
+        _log.debug('validate %d data files using %d processes', len(data_paths), process_count)
+        # Pass the CID pickled so the worker can import the plugins it might need before unpickling it.
+        pickled_cid = pickle.dumps(self.cid, pickle.HIGHEST_PROTOCOL)
+        pool = multiprocessing.Pool(
+            process_count, _init_validation_worker,
+            (pickled_cid, self.plugins_folder, self.validate_until, _log.getEffectiveLevel()))
         try:
-            with validio.Reader(self.cid, data_path, validate_until=self.validate_until) as reader:
-                reader.validate_rows()
-            _log.info('  accepted %d rows', reader.accepted_rows_count)
-        except errors.CutplaceError as error:
-            _log.error('  %s', error)
+            for data_path, accepted_rows_count, rejected_rows_count, log_records, environment_error_message \
+                    in pool.imap(_validated_data_path, data_paths):
+                for log_record in log_records:
+                    _log.handle(log_record)
+                if environment_error_message is not None:
+                    raise EnvironmentError("cannot read data file %r: %s" % (data_path, environment_error_message))
+                self._add_validation_result(data_path, accepted_rows_count, rejected_rows_count)
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _add_validation_result(self, data_path, accepted_rows_count, rejected_rows_count):
+        self.validation_results.append((data_path, accepted_rows_count, rejected_rows_count))
+        self.last_validation_was_ok = (rejected_rows_count == 0)
+        if not self.last_validation_was_ok:
             self.all_validations_were_ok = False
 
 
+def _validate_and_log(cid, data_path, validate_until, jobs):
+    """
+    Validate the data file ``data_path`` against ``cid`` and log the
+    result.
+
+    :return: tuple ``(accepted_rows_count, rejected_rows_count)`` where \
+      ``rejected_rows_count`` is 1 if the data are broken because \
+      validation stops at the first error
+    :raises EnvironmentError: if ``data_path`` cannot be read
+    """
+    _log.info('validate "%s"', data_path)
+    reader = None
+    rejected_rows_count = 0
+    try:
+        with validio.Reader(cid, data_path, validate_until=validate_until, jobs=jobs) as reader:
+            reader.validate_rows()
+        _log.info('  accepted %d rows', reader.accepted_rows_count)
+    except errors.CutplaceError as error:
+        _log.error('  %s', error)
+        rejected_rows_count = 1
+    accepted_rows_count = (reader.accepted_rows_count or 0) if reader is not None else 0
+    return accepted_rows_count, rejected_rows_count
+
+
+class _LogRecordCollector(logging.Handler):
+    """
+    Logging handler that collects all records so a worker process can pass
+    them to the main process.
+    """
+    def __init__(self):
+        # NOTE: We cannot use `super()` here because ``Handler`` is an old style class under Python 2.
+        logging.Handler.__init__(self)
+        self.log_records = []
+
+    def emit(self, record):
+        # Resolve the message and exception now because they might not be picklable.
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        self.log_records.append(record)
+
+
+def _init_validation_worker(pickled_cid, plugins_folder, validate_until, log_level):
+    """
+    Set up a worker process for :py:func:`_validated_data_path`.
+    """
+    global _worker_cid, _worker_log_record_collector, _worker_validate_until
+    _worker_log_record_collector = _LogRecordCollector()
+    _log.handlers = [_worker_log_record_collector]
+    _log.propagate = False
+    _log.setLevel(log_level)
+    if plugins_folder is not None:
+        interface.import_plugins(plugins_folder)
+    _worker_cid = pickle.loads(pickled_cid)
+    _worker_validate_until = validate_until
+
+
+def _validated_data_path(data_path):
+    """
+    Validate ``data_path`` in a worker process set up by
+    :py:func:`_init_validation_worker`.
+
+    :return: tuple ``(data_path, accepted_rows_count, rejected_rows_count, \
+      log_records, environment_error_message)`` where \
+      ``environment_error_message`` is ``None`` unless ``data_path`` could \
+      not be read
+    """
+    del _worker_log_record_collector.log_records[:]
+    accepted_rows_count = 0
+    rejected_rows_count = 0
+    environment_error_message = None
+    try:
+        accepted_rows_count, rejected_rows_count = _validate_and_log(
+            _worker_cid, data_path, _worker_validate_until, 1)
+    except (EnvironmentError, OSError) as error:
+        environment_error_message = '%s' % error
+    log_records = list(_worker_log_record_collector.log_records)
+    return data_path, accepted_rows_count, rejected_rows_count, log_records, environment_error_message
+
+
 def process(argv=None):
     """
     Do whatever the command line options ``argv`` request. In case of error,
@@ -174,17 +342,21 @@ def process(argv=None):
     cutplace_app = CutplaceApp()
     cutplace_app.set_options(argv)
     if cutplace_app.is_gui:
+        from cutplace import gui
+
         data_path = cutplace_app.data_paths[0] if len(cutplace_app.data_paths) >= 1 else None
         gui.open_gui(cutplace_app.cid_path, data_path)
     elif cutplace_app.is_create_sql:
         cid_reader = interface.Cid()
         sql.write_create(cutplace_app.cid_path, cid_reader)
     elif cutplace_app.data_paths:
-        for data_path in cutplace_app.data_paths:
-            try:
-                cutplace_app.validate(data_path)
-            except (EnvironmentError, OSError) as error:
-                raise EnvironmentError("cannot read data file %r: %s" % (data_path, error))
+        cutplace_app.validate_all(cutplace_app.data_paths)
+        if (cutplace_app.jobs > 1) and (len(cutplace_app.validation_results) >= 2):
+            _log.info(
+                'validated %d data files: accepted %d rows, rejected %d files',
+                len(cutplace_app.validation_results),
+                sum(accepted_rows_count for _, accepted_rows_count, _ in cutplace_app.validation_results),
+                sum(1 for _, _, rejected_rows_count in cutplace_app.validation_results if rejected_rows_count))
         if not cutplace_app.all_validations_were_ok:
             result = 1
     return result
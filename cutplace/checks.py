@@ -21,6 +21,15 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import copy
+import decimal
+import hashlib
+import itertools
+import math
+import os
+import sqlite3
+import struct
+import sys
+import tempfile
 import tokenize
 
 import six
@@ -31,6 +40,35 @@ from cutplace import _compat
 from cutplace import _tools
 from cutplace._compat import python_2_unicode_compatible
 
+#: Approximate number of bytes of memory :py:class:`IsUniqueCheck` may use
+#: to remember row keys before moving them to a temporary database on disk.
+DEFAULT_UNIQUE_KEYS_MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Approximate number of bytes a dict needs for each item in addition to its key and value.
+_ESTIMATED_DICT_BYTES_PER_ITEM = 64
+
+# Keyword for the option at the start of an `IsUnique` rule to specify the memory budget in megabytes.
+_UNIQUE_MEMORY_KEYWORD = "memory"
+
+# Number of row keys in each part yielded by `IsUniqueCheck.snapshot_state_parts()`.
+_ROW_KEYS_PER_STATE_PART = 10000
+
+#: Mode for :py:class:`DistinctCountCheck` to remember all distinct values.
+DISTINCT_COUNT_EXACT = "exact"
+#: Mode for :py:class:`DistinctCountCheck` to remember only a digest of each
+#: distinct value, which is exact except for the extremely unlikely case of
+#: two values having the same 128 bit digest.
+DISTINCT_COUNT_HASHED = "hashed"
+#: Mode for :py:class:`DistinctCountCheck` to estimate the number of
+#: distinct values using a HyperLogLog sketch, which needs only a few
+#: kilobytes of memory regardless of the number of values.
+DISTINCT_COUNT_APPROXIMATE = "approximate"
+_DISTINCT_COUNT_MODES = (DISTINCT_COUNT_EXACT, DISTINCT_COUNT_HASHED, DISTINCT_COUNT_APPROXIMATE)
+
+#: Default relative standard error for distinct counts in mode
+#: :py:data:`DISTINCT_COUNT_APPROXIMATE`.
+DEFAULT_DISTINCT_COUNT_ERROR_RATE = 0.01
+
 
 @python_2_unicode_compatible
 class AbstractCheck(object):
@@ -105,6 +143,56 @@ class AbstractCheck(object):
         """
         pass
 
+    def snapshot_state(self):
+        """
+        A picklable copy of the internal state collected by
+        :py:meth:`check_row` so far, which can be passed to
+        :py:meth:`merge_state` of another instance of the same check. This
+        allows to validate parts of the data (shards) with separate checks,
+        for example in different processes, and combine the results later.
+
+        By default there is no state, which is represented by ``None``.
+        """
+        return None
+
+    def merge_state(self, other_state, location=None):
+        """
+        Merge ``other_state``, which was obtained by :py:meth:`snapshot_state`
+        of another instance of the same check, into the current state.
+
+        States have to be merged in the order of the data they were
+        collected from, so that error messages can refer to the first
+        occurrence of a conflicting value.
+
+        :param location: location to refer to in case the conflict cannot \
+          be attributed to a row of ``other_state``
+        :raises cutplace.errors.CheckError: if ``other_state`` conflicts \
+          with the current state
+        """
+        assert other_state is None, \
+            '%s must implement merge_state() to merge state: %r' % (self.__class__.__name__, other_state)
+
+    def snapshot_state_parts(self):
+        """
+        Same as :py:meth:`snapshot_state` but as an iterable of picklable
+        parts to be passed to :py:meth:`merge_state_parts`. This allows to
+        store large states, for example in a checkpoint, one part after
+        another instead of building them in memory at once.
+
+        By default, the only part is the result of :py:meth:`snapshot_state`.
+        """
+        return [self.snapshot_state()]
+
+    def merge_state_parts(self, other_state_parts, location=None):
+        """
+        Same as :py:meth:`merge_state` but for the parts of a state obtained
+        by :py:meth:`snapshot_state_parts`.
+        """
+        assert other_state_parts is not None
+
+        for other_state in other_state_parts:
+            self.merge_state(other_state, location)
+
     def __str__(self):
         return "%s(%r, %r)" % (self.__class__.__name__, self.description, self.rule)
 
@@ -162,19 +250,38 @@ class AbstractCheck(object):
 class IsUniqueCheck(AbstractCheck):
     """
     Check to ensure that all rows are unique concerning certain key fields.
+
+    The check remembers the keys found and the line number of their first
+    occurrence. Once these exceed ``memory_budget`` bytes, they move to a
+    temporary database on disk and from then on the check looks up keys
+    using a digest. If ``memory_budget`` is ``None``,
+    :py:data:`DEFAULT_UNIQUE_KEYS_MEMORY_BUDGET` is used. Alternatively the
+    rule can start with the memory budget in megabytes, for example
+    ``memory(64) branch_id, customer_id``, which takes precedence.
     """
-    def __init__(self, description, rule, available_field_names, location=None):
+    def __init__(self, description, rule, available_field_names, location=None, memory_budget=None):
+        assert (memory_budget is None) or (memory_budget >= 0)
         super(IsUniqueCheck, self).__init__(description, rule, available_field_names, location)
 
         self._field_names_to_check = []
-        self._row_key_to_location_map = None
-        self.reset()
+        self._memory_budget = memory_budget
+        self._row_key_store = None
 
-        # Extract field names to check from rule.
         rule_read_line = _compat.token_io_readline(rule)
         toky = tokenize.generate_tokens(rule_read_line)
-        after_comma = True
         next_token = next(toky)
+
+        # Obtain optional memory budget.
+        if (next_token[0] == tokenize.NAME) and (next_token[1] == _UNIQUE_MEMORY_KEYWORD):
+            token_after_keyword = next(toky)
+            if _tools.is_op_token(token_after_keyword, '('):
+                self._memory_budget = self._memory_budget_in_megabytes(toky) * 1024 * 1024
+                next_token = next(toky)
+            else:
+                toky = itertools.chain([token_after_keyword], toky)
+
+        # Extract field names to check from rule.
+        after_comma = True
         unique_field_names = set()
         while not _tools.is_eof_token(next_token):
             token_type = next_token[0]
@@ -202,34 +309,346 @@ class IsUniqueCheck(AbstractCheck):
         if not len(self._field_names_to_check):
             raise errors.InterfaceError(
                 "rule must contain at least one field name to check for uniqueness", self.location_of_rule)
+        self.reset()
+
+    def _memory_budget_in_megabytes(self, toky):
+        """
+        The number of megabytes in the rest of the option
+        ``memory(megabytes)`` read from ``toky``.
+        """
+        megabytes_token = next(toky)
+        closing_token = next(toky)
+        megabytes = None
+        if (megabytes_token[0] == tokenize.NUMBER) and _tools.is_op_token(closing_token, ')'):
+            try:
+                megabytes = int(megabytes_token[1])
+            except ValueError:
+                pass
+        if megabytes is None:
+            raise errors.InterfaceError(
+                "memory for unique keys must be a number of megabytes, for example %s(64), but found: %r"
+                % (_UNIQUE_MEMORY_KEYWORD, megabytes_token[1]), self.location_of_rule)
+        return megabytes
+
+    @property
+    def memory_budget(self):
+        """
+        Approximate number of bytes of memory the check may use to remember
+        row keys before moving them to disk or ``None`` for
+        :py:data:`DEFAULT_UNIQUE_KEYS_MEMORY_BUDGET`.
+        """
+        return self._memory_budget
 
     def reset(self):
-        self._row_key_to_location_map = {}
+        if self._row_key_store is not None:
+            self._row_key_store.close()
+        memory_budget = self._memory_budget
+        if memory_budget is None:
+            memory_budget = DEFAULT_UNIQUE_KEYS_MEMORY_BUDGET
+        self._row_key_store = _RowKeyStore(memory_budget)
+        self._data_location = None
 
     def check_row(self, field_name_to_value_map, location):
         row_key = tuple(field_name_to_value_map[field_name] for field_name in self._field_names_to_check)
-        see_also_location = self._row_key_to_location_map.get(row_key)
-        if see_also_location is not None:
+        see_also_line = self._row_key_store.line_of(row_key)
+        if see_also_line is not None:
             raise errors.CheckError(
                 "values for %r must be unique: %s" % (self._field_names_to_check, row_key), location,
-                see_also_message="location of first occurrence", see_also_location=see_also_location)
+                see_also_message="location of first occurrence",
+                see_also_location=_location_at_line(location, see_also_line))
+        self._row_key_store.add(row_key, location.line)
+        if self._data_location is None:
+            self._data_location = copy.copy(location)
+
+    def cleanup(self):
+        self._row_key_store.close()
+
+    def snapshot_state(self):
+        """
+        A tuple of the location of the data checked so far (or ``None`` if
+        there was no data) and a map of the digests of all row keys found to
+        the line of their first occurrence.
+        """
+        return self._data_location, dict(self._row_key_store.items())
+
+    def merge_state(self, other_state, location=None):
+        assert other_state is not None
+
+        other_data_location, other_row_key_digest_to_line_map = other_state
+        self._merge_row_keys(other_data_location, other_row_key_digest_to_line_map.items(), location)
+
+    def snapshot_state_parts(self):
+        """
+        Same as :py:meth:`snapshot_state` but with the location of the data
+        as first part followed by lists of tuples ``(row_key_digest, line)``.
+        Row keys already moved to disk are read from there one part at a
+        time.
+        """
+        yield self._data_location
+        row_keys = self._row_key_store.items()
+        while True:
+            row_keys_part = list(itertools.islice(row_keys, _ROW_KEYS_PER_STATE_PART))
+            if not row_keys_part:
+                break
+            yield row_keys_part
+
+    def merge_state_parts(self, other_state_parts, location=None):
+        assert other_state_parts is not None
+
+        other_state_parts = iter(other_state_parts)
+        other_data_location = next(other_state_parts)
+        self._merge_row_keys(other_data_location, itertools.chain.from_iterable(other_state_parts), location)
+
+    def _merge_row_keys(self, other_data_location, other_row_keys, location):
+        """
+        Merge ``other_row_keys``, which are tuples ``(row_key_digest, line)``
+        found in the data at ``other_data_location``. In case of duplicates,
+        the one that occurred first in the other data is reported once all
+        row keys have been merged, so the row keys can be processed in any
+        order. Because the other data only provide digests, the error
+        message cannot include the values of the duplicate key.
+        """
+        if self._data_location is None:
+            self._data_location = other_data_location if location is None else copy.copy(location)
+        first_duplicate = None
+        for row_key_digest, line in other_row_keys:
+            see_also_line = self._row_key_store.line_of_digest(row_key_digest)
+            if see_also_line is None:
+                self._row_key_store.add_digest(row_key_digest, line)
+            elif (first_duplicate is None) or (line < first_duplicate[0]):
+                first_duplicate = (line, see_also_line)
+        if first_duplicate is not None:
+            line, see_also_line = first_duplicate
+            raise errors.CheckError(
+                "values for %r must be unique" % self._field_names_to_check,
+                _location_at_line(other_data_location, line),
+                see_also_message="location of first occurrence",
+                see_also_location=_location_at_line(self._data_location, see_also_line))
+
+
+def _row_key_digest(row_key):
+    """
+    A compact digest of ``row_key`` that is the same for equal keys even
+    across different processes.
+    """
+    normalized_row_key = tuple(
+        value.normalize() if isinstance(value, decimal.Decimal) else value for value in row_key)
+    return hashlib.sha1(repr(normalized_row_key).encode('utf-8')).digest()
+
+
+def _location_at_line(location, line):
+    assert location is not None
+    assert line is not None
+
+    result = copy.copy(location)
+    result.set_line(line)
+    return result
+
+
+class _RowKeyStore(object):
+    """
+    Map of row keys to the line of their first occurrence that keeps the
+    keys in memory until they exceed ``memory_budget`` (in bytes). After
+    that, all keys move to a temporary SQLite database on disk.
+
+    Initially, the keys themselves are used to look up lines. Once keys
+    move to disk or digests of another store are added, only digests as
+    computed by :py:func:`_row_key_digest` are kept.
+    """
+    def __init__(self, memory_budget):
+        assert memory_budget is not None
+        assert memory_budget >= 0
+
+        self._memory_budget = memory_budget
+        self._bytes_in_memory = 0
+        self._row_key_to_line_map = {}
+        self._digest_to_line_map = None
+        self._database_path = None
+        self._database = None
+
+    @property
+    def is_on_disk(self):
+        """
+        ``True`` if the memory budget was exceeded and some keys have been
+        moved to a temporary database.
+        """
+        return self._database is not None
+
+    @property
+    def has_digests(self):
+        """
+        ``True`` if keys are looked up using their digest.
+        """
+        return self._digest_to_line_map is not None
+
+    def line_of(self, row_key):
+        """
+        The line where ``row_key`` occurred first or ``None`` if it did not
+        occur yet.
+        """
+        if self._digest_to_line_map is None:
+            result = self._row_key_to_line_map.get(row_key)
         else:
-            self._row_key_to_location_map[row_key] = copy.copy(location)
+            result = self.line_of_digest(_row_key_digest(row_key))
+        return result
+
+    def line_of_digest(self, digest):
+        """
+        Same as :py:meth:`line_of` but for the digest of a row key.
+        """
+        self._use_digests()
+        result = self._digest_to_line_map.get(digest)
+        if (result is None) and (self._database is not None):
+            line_row = self._database.execute(
+                'select line from row_keys where digest = ?', (sqlite3.Binary(digest),)).fetchone()
+            if line_row is not None:
+                result = line_row[0]
+        return result
+
+    def add(self, row_key, line):
+        """
+        Remember that ``row_key`` occurred first in ``line``.
+        """
+        assert row_key is not None
+        assert line is not None
+
+        if self._digest_to_line_map is None:
+            self._row_key_to_line_map[row_key] = line
+            self._bytes_in_memory += _estimated_bytes_of_item(row_key, line)
+            if self._bytes_in_memory > self._memory_budget:
+                self._move_to_disk()
+        else:
+            self.add_digest(_row_key_digest(row_key), line)
+
+    def add_digest(self, digest, line):
+        """
+        Same as :py:meth:`add` but for the digest of a row key.
+        """
+        assert digest is not None
+        assert line is not None
+
+        self._use_digests()
+        self._digest_to_line_map[digest] = line
+        self._bytes_in_memory += _estimated_bytes_of_item(digest, line)
+        if self._bytes_in_memory > self._memory_budget:
+            self._move_to_disk()
+
+    def items(self):
+        """
+        All digests with the line of their first occurrence as tuples
+        ``(digest, line)``.
+        """
+        if self._digest_to_line_map is None:
+            for row_key, line in self._row_key_to_line_map.items():
+                yield _row_key_digest(row_key), line
+        else:
+            for digest_and_line in self._digest_to_line_map.items():
+                yield digest_and_line
+            if self._database is not None:
+                for digest, line in self._database.execute('select digest, line from row_keys'):
+                    yield bytes(digest), line
+
+    def _use_digests(self):
+        """
+        Replace the keys in memory by their digests unless this already
+        happened.
+        """
+        if self._digest_to_line_map is None:
+            self._digest_to_line_map = {}
+            self._bytes_in_memory = 0
+            for row_key, line in self._row_key_to_line_map.items():
+                digest = _row_key_digest(row_key)
+                self._digest_to_line_map[digest] = line
+                self._bytes_in_memory += _estimated_bytes_of_item(digest, line)
+            self._row_key_to_line_map = {}
+
+    def _move_to_disk(self):
+        self._use_digests()
+        if self._database is None:
+            database_fd, self._database_path = tempfile.mkstemp(prefix='cutplace_unique_', suffix='.db')
+            os.close(database_fd)
+            self._database = sqlite3.connect(self._database_path)
+            # The database is temporary anyway, so do not waste time on keeping it consistent.
+            self._database.execute('pragma journal_mode = off')
+            self._database.execute('pragma synchronous = off')
+            self._database.execute('create table row_keys (digest blob primary key, line integer)')
+        self._database.executemany(
+            'insert into row_keys (digest, line) values (?, ?)',
+            ((sqlite3.Binary(digest), line) for digest, line in self._digest_to_line_map.items()))
+        self._database.commit()
+        self._digest_to_line_map = {}
+        self._bytes_in_memory = 0
+
+    def close(self):
+        """
+        Forget all keys and remove the temporary database if there is one.
+        """
+        self._row_key_to_line_map = {}
+        self._digest_to_line_map = None
+        self._bytes_in_memory = 0
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+            os.remove(self._database_path)
+            self._database_path = None
+
+
+def _estimated_bytes_of_item(key, line):
+    """
+    Approximate number of bytes a dict needs to map ``key``, which is a
+    row key or its digest, to ``line``.
+    """
+    result = _ESTIMATED_DICT_BYTES_PER_ITEM + sys.getsizeof(key) + sys.getsizeof(line)
+    if isinstance(key, tuple):
+        for value in key:
+            result += sys.getsizeof(value)
+    return result
 
 
 class DistinctCountCheck(AbstractCheck):
     """
     Check to ensure that the number of different values in a field matches an expression.
+
+    The ``mode`` specifies how to keep track of distinct values and can be
+    one of :py:data:`DISTINCT_COUNT_EXACT`, :py:data:`DISTINCT_COUNT_HASHED`
+    or :py:data:`DISTINCT_COUNT_APPROXIMATE`. Alternatively the rule can
+    start with the name of the mode, for example
+    ``approximate customer_id >= 1000000``, which takes precedence. For
+    approximate counts, ``error_rate`` is the expected relative standard
+    error; if it is ``None``, :py:data:`DEFAULT_DISTINCT_COUNT_ERROR_RATE` is
+    used. The rule can specify it after the mode, for example
+    ``approximate(0.05) customer_id >= 1000000``.
     """
     _COUNT_NAME = "count"
 
-    def __init__(self, description, rule, available_field_names, location=None):
+    def __init__(self, description, rule, available_field_names, location=None, mode=None, error_rate=None):
+        assert (mode is None) or (mode in _DISTINCT_COUNT_MODES), 'mode=%r' % mode
+        assert (error_rate is None) or (0 < error_rate < 1), 'error_rate=%r' % error_rate
         super(DistinctCountCheck, self).__init__(description, rule, available_field_names, location)
 
         rule_read_line = _compat.token_io_readline(rule)
         tokens = tokenize.generate_tokens(rule_read_line)
         first_token = next(tokens)
 
+        # Obtain optional mode and error rate.
+        self._mode = DISTINCT_COUNT_EXACT if mode is None else mode
+        self._error_rate = DEFAULT_DISTINCT_COUNT_ERROR_RATE if error_rate is None else error_rate
+        if (first_token[0] == tokenize.NAME) and (first_token[1] in _DISTINCT_COUNT_MODES):
+            second_token = next(tokens)
+            if _tools.is_op_token(second_token, '('):
+                if first_token[1] != DISTINCT_COUNT_APPROXIMATE:
+                    raise errors.InterfaceError(
+                        "only mode %r can have an error rate but found: %r"
+                        % (DISTINCT_COUNT_APPROXIMATE, first_token[1]), self.location_of_rule)
+                self._error_rate = self._error_rate_in_rule(tokens)
+                second_token = next(tokens)
+            elif (second_token[0] != tokenize.NAME) or (second_token[1] not in available_field_names):
+                # The first token is a field name that happens to be the same as a mode.
+                second_token = None
+            if second_token is not None:
+                self._mode = first_token[1]
+                first_token = second_token
+
         # Obtain and validate field to count.
         if first_token[0] != tokenize.NAME:
             raise errors.InterfaceError(
@@ -242,15 +661,55 @@ class DistinctCountCheck(AbstractCheck):
 
         # Build and test Python expression for validation.
         self._expression = DistinctCountCheck._COUNT_NAME + rule[column_where_field_name_ends:]
-        self._distinct_value_to_count_map = None
+        self._distinct_counter = None
         self.reset()
         self._eval()
 
+    def _error_rate_in_rule(self, tokens):
+        """
+        The error rate in the rest of ``approximate(error_rate)`` read from
+        ``tokens``.
+        """
+        error_rate_token = next(tokens)
+        closing_token = next(tokens)
+        error_rate = None
+        if (error_rate_token[0] == tokenize.NUMBER) and _tools.is_op_token(closing_token, ')'):
+            try:
+                error_rate = float(error_rate_token[1])
+            except ValueError:
+                pass
+        if (error_rate is None) or not (0 < error_rate < 1):
+            raise errors.InterfaceError(
+                "error rate must be a number between 0 and 1, for example %s(0.05), but found: %r"
+                % (DISTINCT_COUNT_APPROXIMATE, error_rate_token[1]), self.location_of_rule)
+        return error_rate
+
+    @property
+    def mode(self):
+        """
+        The mode used to keep track of distinct values, for example
+        :py:data:`DISTINCT_COUNT_EXACT`.
+        """
+        return self._mode
+
+    @property
+    def error_rate(self):
+        """
+        The expected relative standard error of approximate counts.
+        """
+        return self._error_rate
+
     def reset(self):
-        self._distinct_value_to_count_map = {}
+        if self._mode == DISTINCT_COUNT_EXACT:
+            self._distinct_counter = _ExactDistinctCounter()
+        elif self._mode == DISTINCT_COUNT_HASHED:
+            self._distinct_counter = _HashedDistinctCounter()
+        else:
+            assert self._mode == DISTINCT_COUNT_APPROXIMATE, 'mode=%r' % self._mode
+            self._distinct_counter = _ApproximateDistinctCounter(self._error_rate)
 
     def _distinct_count(self):
-        return len(self._distinct_value_to_count_map)
+        return self._distinct_counter.count()
 
     def _eval(self):
         """
@@ -269,13 +728,127 @@ class DistinctCountCheck(AbstractCheck):
         return result
 
     def check_row(self, field_name_to_value_map, location):
-        value = field_name_to_value_map[self._field_name_to_count]
+        self._distinct_counter.add(field_name_to_value_map[self._field_name_to_count])
+
+    def snapshot_state(self):
+        """
+        A copy of the data needed to count the distinct values found so
+        far; the actual type depends on :py:attr:`mode`.
+        """
+        return self._distinct_counter.snapshot_state()
+
+    def merge_state(self, other_state, location=None):
+        assert other_state is not None
+
+        self._distinct_counter.merge_state(other_state)
+
+    def check_at_end(self, location):
+        if not self._eval():
+            if self._mode == DISTINCT_COUNT_APPROXIMATE:
+                distinct_count_text = "about %d" % self._distinct_count()
+            else:
+                distinct_count_text = "%d" % self._distinct_count()
+            raise errors.CheckError(
+                "distinct count is %s but check requires: %r" % (distinct_count_text, self._expression), location)
+
+
+class _ExactDistinctCounter(object):
+    """
+    Counter for distinct values that remembers all values and how often
+    they occurred.
+    """
+    def __init__(self):
+        self._distinct_value_to_count_map = {}
+
+    def add(self, value):
         try:
             self._distinct_value_to_count_map[value] += 1
         except KeyError:
             self._distinct_value_to_count_map[value] = 1
 
-    def check_at_end(self, location):
-        if not self._eval():
-            raise errors.CheckError(
-                "distinct count is %d but check requires: %r" % (self._distinct_count(), self._expression), location)
+    def count(self):
+        return len(self._distinct_value_to_count_map)
+
+    def snapshot_state(self):
+        return dict(self._distinct_value_to_count_map)
+
+    def merge_state(self, other_state):
+        for value, count in other_state.items():
+            self._distinct_value_to_count_map[value] = self._distinct_value_to_count_map.get(value, 0) + count
+
+
+class _HashedDistinctCounter(object):
+    """
+    Counter for distinct values that only remembers a 128 bit digest of
+    each value.
+    """
+    def __init__(self):
+        self._digests = set()
+
+    def add(self, value):
+        self._digests.add(_row_key_digest((value,))[:16])
+
+    def count(self):
+        return len(self._digests)
+
+    def snapshot_state(self):
+        return set(self._digests)
+
+    def merge_state(self, other_state):
+        self._digests.update(other_state)
+
+
+class _ApproximateDistinctCounter(object):
+    """
+    Counter for distinct values that estimates their number using a
+    HyperLogLog sketch with a relative standard error of about
+    ``error_rate``.
+    """
+    _MIN_PRECISION = 4
+    _MAX_PRECISION = 18
+    _HASH_BIT_COUNT = 64
+
+    def __init__(self, error_rate):
+        assert 0 < error_rate < 1
+
+        # The relative standard error of HyperLogLog is about 1.04 / sqrt(register_count).
+        precision = int(math.ceil(math.log((1.04 / error_rate) ** 2, 2)))
+        self._precision = min(max(precision, self._MIN_PRECISION), self._MAX_PRECISION)
+        self._register_count = 1 << self._precision
+        self._rank_bit_count = self._HASH_BIT_COUNT - self._precision
+        self._rank_mask = (1 << self._rank_bit_count) - 1
+        self._registers = bytearray(self._register_count)
+
+    def add(self, value):
+        hash_value = struct.unpack('>Q', _row_key_digest((value,))[:8])[0]
+        register_index = hash_value >> self._rank_bit_count
+        rank = self._rank_bit_count - (hash_value & self._rank_mask).bit_length() + 1
+        if rank > self._registers[register_index]:
+            self._registers[register_index] = rank
+
+    def count(self):
+        register_count = self._register_count
+        if register_count == 16:
+            alpha = 0.673
+        elif register_count == 32:
+            alpha = 0.697
+        elif register_count == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / register_count)
+        estimate = alpha * register_count * register_count / sum(2.0 ** -rank for rank in self._registers)
+        if estimate <= 2.5 * register_count:
+            # Use linear counting for small cardinalities.
+            empty_register_count = self._registers.count(b'\x00')
+            if empty_register_count > 0:
+                estimate = register_count * math.log(register_count / empty_register_count)
+        return int(round(estimate))
+
+    def snapshot_state(self):
+        return bytes(self._registers)
+
+    def merge_state(self, other_state):
+        assert len(other_state) == self._register_count, \
+            'sketch sizes must match: %d != %d' % (len(other_state), self._register_count)
+        self._registers = bytearray(
+            max(rank, other_rank) for rank, other_rank in zip(self._registers, bytearray(other_state)))
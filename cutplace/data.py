@@ -116,6 +116,7 @@ class DataFormat(object):
         self._header = 0
         self._is_valid = False
         self._allowed_characters = None
+        self._invalid_character_regex = None
         self._encoding = 'cp1252'
         if self.format == FORMAT_DELIMITED:
             self._escape_character = '"'
@@ -164,6 +165,19 @@ class DataFormat(object):
         assert (new_allowed_characters is None) or isinstance(new_allowed_characters, ranges.Range)
 
         self._allowed_characters = new_allowed_characters
+        if new_allowed_characters is not None:
+            self._invalid_character_regex = ranges.create_invalid_character_regex(new_allowed_characters)
+        else:
+            self._invalid_character_regex = None
+
+    @property
+    def invalid_character_regex(self):
+        """
+        Compiled regular expression to find the first character not within
+        :py:attr:`allowed_characters` or ``None`` if all characters are
+        allowed; see :py:func:`cutplace.ranges.create_invalid_character_regex`.
+        """
+        return self._invalid_character_regex
 
     @property
     def escape_character(self):
@@ -239,7 +253,7 @@ class DataFormat(object):
         assert self.format in (FORMAT_EXCEL, FORMAT_ODS)
         assert new_sheet >= 1
 
-        self._sheet == new_sheet
+        self._sheet = new_sheet
 
     @property
     def skip_initial_space(self):
@@ -314,7 +328,7 @@ class DataFormat(object):
             self.header = DataFormat._validated_int_at_least_0(name, value, location)
         elif name == KEY_ALLOWED_CHARACTERS:
             try:
-                self._allowed_characters = ranges.Range(value)
+                self.allowed_characters = ranges.Range(value)
             except errors.InterfaceError as error:
                 raise errors.InterfaceError(
                     'data format property %s must be a valid range: %s'
@@ -26,6 +26,7 @@ import traceback
 
 import six
 
+from cutplace import _compat
 from cutplace._compat import python_2_unicode_compatible
 
 #: Symbolic names that can be used to improve the legibility of the CID.
@@ -44,7 +45,12 @@ class Location(object):
     Location in an input file, consisting of ``line``, an optional ``column``
     (pointing at a single character) and an optional cell (pointing to a cell
     in a structured input such as CSV).
+
+    Readers that process many rows can keep track of their position using
+    integer counters and only create a location using :py:meth:`~.copy_at`
+    once they actually need one, for example to report an error.
     """
+    __slots__ = ('file_path', '_line', '_column', '_cell', '_sheet', '_has_column', '_has_cell', '_has_sheet')
 
     def __init__(self, file_path, has_column=False, has_cell=False, has_sheet=False):
         """
@@ -102,8 +108,32 @@ class Location(object):
         self._has_sheet = has_sheet
 
     def __copy__(self):
-        result = type(self)(self.file_path)
-        result.__dict__.update(self.__dict__)
+        result = type(self).__new__(type(self))
+        result.__setstate__(self.__getstate__())
+        return result
+
+    def __getstate__(self):
+        # NOTE: Python 2 cannot pickle classes with __slots__ without this.
+        return tuple(getattr(self, slot_name) for slot_name in Location.__slots__)
+
+    def __setstate__(self, state):
+        for slot_name, value in zip(Location.__slots__, state):
+            setattr(self, slot_name, value)
+
+    def copy_at(self, line, column=0, cell=0):
+        """
+        Copy of the location with the same file and sheet but pointing to
+        ``line``, ``column`` and ``cell``.
+        """
+        assert line >= 0
+        assert column >= 0
+        assert cell >= 0
+        assert (column == 0) or self._has_column
+        assert (cell == 0) or self._has_cell
+        result = copy.copy(self)
+        result._line = line
+        result._column = column
+        result._cell = cell
         return result
 
     def advance_column(self, amount=1):
@@ -133,6 +163,13 @@ class Location(object):
         self._column = 0
         self._cell = 0
 
+    def set_line(self, new_line):
+        assert new_line is not None
+        assert new_line >= 0
+        self._line = new_line
+        self._column = 0
+        self._cell = 0
+
     def advance_sheet(self):
         self._sheet += 1
         self._line = 0
@@ -360,6 +397,105 @@ class DataError(CutplaceError):
     pass
 
 
+@python_2_unicode_compatible
+class DataErrorRecord(object):
+    """
+    Lightweight record of a broken data row that only builds the complete
+    :py:exc:`DataError` describing it once :py:attr:`error`,
+    :py:attr:`message`, :py:attr:`location` or ``str()`` is used.
+
+    Readers produce these with ``on_error='record'`` so rows can be rejected
+    without preparing error messages and locations nobody might ever look
+    at.
+    """
+    __slots__ = ('_file_path', '_line', '_field_index', '_field_name', '_value', '_error', '_is_error_complete')
+
+    def __init__(self, file_path, line, field_index, field_name, value, error):
+        """
+        Create a record for a broken field or row in line ``line``
+        (starting with 0) of the data in ``file_path``.
+
+        :param field_index: index of the broken field or ``None`` if the \
+          row as a whole is broken
+        :param field_name: name of the broken field or ``None`` if ``error`` \
+          already is complete, for example because it was raised by a check
+        :param value: the raw value of the broken field or ``None``
+        :param error: the :py:exc:`DataError` to complete or a tuple \
+          ``(error_code, error_args)`` as returned by \
+          :py:meth:`cutplace.fields.AbstractFieldFormat.broken_value` \
+          from which to build it; unless ``field_name`` is ``None`` the \
+          error still lacks the field name and location
+        """
+        assert file_path is not None
+        assert line >= 0
+        assert (field_name is None) or (field_index is not None)
+        assert error is not None
+
+        self._file_path = file_path
+        self._line = line
+        self._field_index = field_index
+        self._field_name = field_name
+        self._value = value
+        self._error = error
+        self._is_error_complete = (field_name is None)
+
+    @property
+    def line(self):
+        """The line or row of the broken data starting with 0."""
+        return self._line
+
+    @property
+    def field_index(self):
+        """The index of the broken field or ``None`` if the row as a whole is broken."""
+        return self._field_index
+
+    @property
+    def field_name(self):
+        """The name of the broken field or ``None`` if it is unknown."""
+        return self._field_name
+
+    @property
+    def value(self):
+        """The raw value of the broken field or ``None`` if it is unknown."""
+        return self._value
+
+    @property
+    def error(self):
+        """
+        The complete :py:exc:`DataError` describing the broken data, which
+        is the same as the one raised with ``on_error='raise'``.
+        """
+        if not self._is_error_complete:
+            if not isinstance(self._error, CutplaceError):
+                # Import late because fields.py itself depends on this module.
+                from cutplace import fields
+
+                error_code, error_args = self._error
+                self._error = fields.field_value_error(error_code, error_args)
+            location = Location(self._file_path, has_cell=True)
+            location.set_line(self._line)
+            location.set_cell(self._field_index)
+            self._error.prepend_message('cannot accept field %s' % _compat.text_repr(self._field_name), location)
+            self._is_error_complete = True
+        return self._error
+
+    @property
+    def location(self):
+        """Same as :py:attr:`CutplaceError.location` of :py:attr:`error`."""
+        return self.error.location
+
+    @property
+    def message(self):
+        """Same as :py:attr:`CutplaceError.message` of :py:attr:`error`."""
+        return self.error.message
+
+    def __str__(self):
+        return six.text_type(self.error)
+
+    def __repr__(self):
+        return '<DataErrorRecord %s>' % self.__str__()
+
+
 class InterfaceError(CutplaceError):
     """
     Error that can be fixed by providing a proper CID or API calls. Typically
@@ -20,13 +20,16 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import datetime
 import decimal
 import fnmatch
+import io
 import keyword
 import re
 import string
 import sys
 import time
+import token
 
 import six
 
@@ -47,6 +50,148 @@ _FieldFormatClassSuffix = "FieldFormat"
 _ASCII_LETTERS = set(string.ascii_letters)
 _ASCII_LETTERS_DIGITS_AND_UNDERSCORE = set(string.ascii_letters + string.digits + '_')
 
+#: Result type for :py:class:`DecimalFieldFormat` to validate values as :py:class:`decimal.Decimal`.
+DECIMAL_RESULT_DECIMAL = 'decimal'
+#: Result type for :py:class:`DecimalFieldFormat` to validate values as :py:class:`float`.
+DECIMAL_RESULT_FLOAT = 'float'
+#: Result type for :py:class:`DecimalFieldFormat` to validate values as :py:class:`int` scaled by the
+#: precision of the range.
+DECIMAL_RESULT_SCALED_INTEGER = 'scaled_integer'
+_DECIMAL_RESULT_TYPES = (DECIMAL_RESULT_DECIMAL, DECIMAL_RESULT_FLOAT, DECIMAL_RESULT_SCALED_INTEGER)
+
+#: Maximum number of digits of a decimal range to validate values as :py:class:`float` without loss.
+MAX_FLOAT_DIGITS = 15
+
+# Context to scale decimals without rounding; Python 2 has no ``decimal.MAX_PREC``.
+_EXACT_DECIMAL_CONTEXT = decimal.Context(prec=getattr(decimal, 'MAX_PREC', 999999999))
+
+# Keywords that can precede the choices in the rule of a Choice field.
+_CHOICE_KEYWORD_FILE = 'file'
+_CHOICE_KEYWORD_IGNORE_CASE = 'ignorecase'
+
+# Function to normalize the case of a text for case insensitive comparison;
+# Python 2 has no ``casefold()``.
+_folded_case = getattr(six.text_type, 'casefold', six.text_type.lower)
+
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: with a character that is not allowed.
+FIELD_ERROR_CHARACTER = 'character'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that must not be empty.
+FIELD_ERROR_EMPTY = 'empty'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that is too long for a fixed format field.
+FIELD_ERROR_FIXED_LENGTH = 'fixed_length'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that is too short or too long.
+FIELD_ERROR_LENGTH = 'length'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that is out of range.
+FIELD_ERROR_RANGE = 'range'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that is not an integer number.
+FIELD_ERROR_INTEGER = 'integer'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that is none of the choices.
+FIELD_ERROR_CHOICE = 'choice'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that differs from the constant.
+FIELD_ERROR_CONSTANT = 'constant'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that does not match the regular expression.
+FIELD_ERROR_REGEX = 'regex'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for a value
+#: that does not match the pattern.
+FIELD_ERROR_PATTERN = 'pattern'
+#: Error code of :py:meth:`AbstractFieldFormat.broken_value` for any other
+#: problem; the only argument is the
+#: :py:exc:`~cutplace.errors.FieldValueError` raised by
+#: :py:meth:`AbstractFieldFormat.validated_value`.
+FIELD_ERROR_OTHER = 'other'
+
+
+def _character_error_message(character, field_name, column, allowed_characters):
+    character_code = ord(character)
+    return "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed " \
+        "character: %s" % (
+            _compat.text_repr(character), character_code, character_code, field_name, column, allowed_characters)
+
+
+def _empty_error_message():
+    return "value must not be empty"
+
+
+def _fixed_length_error_message(fixed_length, value):
+    return 'fixed format field must have at most %d characters instead of %d: %s' \
+        % (fixed_length, len(value), _compat.text_repr(value))
+
+
+def _length_error_message(field_name, value, length):
+    return "length of '%s' with value %s is %r but must be within range: %s" \
+        % (field_name, _compat.text_repr(value), len(value), length)
+
+
+def _range_error_message(name, value, valid_range):
+    return "%s is %r but must be within range: %s" % (name, value, valid_range)
+
+
+def _integer_error_message(value):
+    return "value must be an integer number: %s" % _compat.text_repr(value)
+
+
+def _choice_error_message(value, choices, choices_path):
+    if choices_path is not None:
+        result = "value is %s but must be one of the %d choices in: %s" \
+            % (_compat.text_repr(value), len(choices), _compat.text_repr(choices_path))
+    else:
+        result = "value is %s but must be one of: %s" \
+            % (_compat.text_repr(value), _tools.human_readable_list(choices))
+    return result
+
+
+def _constant_error_message(value, constant):
+    return "value is %s but must be constant: %s" % (_compat.text_repr(value), _compat.text_repr(constant))
+
+
+def _regex_error_message(value, rule):
+    return "value %s must match regular expression: %s" % (_compat.text_repr(value), _compat.text_repr(rule))
+
+
+def _pattern_error_message(value, rule, pattern):
+    return 'value %s must match pattern: %s (regex %s)' \
+        % (_compat.text_repr(value), _compat.text_repr(rule), _compat.text_repr(pattern))
+
+
+# Functions to build the message for each error code of `AbstractFieldFormat.broken_value()` from its arguments.
+_FIELD_ERROR_CODE_TO_MESSAGE_FUNCTION_MAP = {
+    FIELD_ERROR_CHARACTER: _character_error_message,
+    FIELD_ERROR_EMPTY: _empty_error_message,
+    FIELD_ERROR_FIXED_LENGTH: _fixed_length_error_message,
+    FIELD_ERROR_LENGTH: _length_error_message,
+    FIELD_ERROR_RANGE: _range_error_message,
+    FIELD_ERROR_INTEGER: _integer_error_message,
+    FIELD_ERROR_CHOICE: _choice_error_message,
+    FIELD_ERROR_CONSTANT: _constant_error_message,
+    FIELD_ERROR_REGEX: _regex_error_message,
+    FIELD_ERROR_PATTERN: _pattern_error_message,
+}
+
+
+def field_value_error(error_code, error_args):
+    """
+    The :py:exc:`cutplace.errors.FieldValueError` described by
+    ``error_code`` and ``error_args`` as found by
+    :py:meth:`AbstractFieldFormat.broken_value`.
+    """
+    assert error_code is not None
+    assert error_args is not None
+
+    if error_code == FIELD_ERROR_OTHER:
+        (result,) = error_args
+    else:
+        result = errors.FieldValueError(_FIELD_ERROR_CODE_TO_MESSAGE_FUNCTION_MAP[error_code](*error_args))
+    return result
+
 
 @python_2_unicode_compatible
 class AbstractFieldFormat(object):
@@ -154,18 +299,16 @@ class AbstractFieldFormat(object):
         :raises cutplace.errors.FieldValueError: if any character in \
           ``value`` is not allowed
         """
-        valid_character_range = self.data_format.allowed_characters
-        if valid_character_range is not None:
-            for character_column, character in enumerate(value, 1):
-                character_code = ord(character)
-                try:
-                    valid_character_range.validate("character", character_code)
-                except errors.RangeValueError:
-                    raise errors.FieldValueError(
-                        "character %s (code point U+%04x, decimal %d) in field '%s' at column %d must be an allowed "
-                        "character: %s" % (
-                            _compat.text_repr(character), character_code, character_code, self.field_name,
-                            character_column, valid_character_range))
+        invalid_character_regex = self.data_format.invalid_character_regex
+        if invalid_character_regex is not None:
+            invalid_character_match = invalid_character_regex.search(value)
+            if invalid_character_match is not None:
+                raise field_value_error(FIELD_ERROR_CHARACTER, self._character_error_args(invalid_character_match))
+
+    def _character_error_args(self, invalid_character_match):
+        return (
+            invalid_character_match.group(), self.field_name, invalid_character_match.start() + 1,
+            self.data_format.allowed_characters)
 
     def validate_empty(self, value):
         """
@@ -178,7 +321,7 @@ class AbstractFieldFormat(object):
         """
         if not self.is_allowed_to_be_empty:
             if not value:
-                raise errors.FieldValueError("value must not be empty")
+                raise field_value_error(FIELD_ERROR_EMPTY, ())
 
     def validate_length(self, value):
         """
@@ -190,22 +333,26 @@ class AbstractFieldFormat(object):
         """
         assert value is not None
 
+        broken_length = self._broken_length(value)
+        if broken_length is not None:
+            raise field_value_error(*broken_length)
+
+    def _broken_length(self, value):
+        """
+        Tuple ``(error_code, error_args)`` describing why ``value`` does not
+        conform to :py:attr:`~cutplace.fields.AbstractFieldFormat.length` or
+        ``None`` if it does.
+        """
+        result = None
         if self.length is not None and not (self.is_allowed_to_be_empty and (value == '')):
-            try:
-                if self.data_format.format == data.FORMAT_FIXED:
-                    # Length of fixed format is considered a maximum, fewer characters have to be padded later.
-                    value_length = len(value)
-                    fixed_length = self.length.lower_limit
-                    if value_length > fixed_length:
-                        raise errors.FieldValueError(
-                            'fixed format field must have at most %d characters instead of %d: %s'
-                            % (fixed_length, value_length, _compat.text_repr(value))
-                        )
-                else:
-                    self.length.validate(
-                        "length of '%s' with value %s" % (self.field_name, _compat.text_repr(value)), len(value))
-            except errors.RangeValueError as error:
-                raise errors.FieldValueError(six.text_type(error))
+            if self.data_format.format == data.FORMAT_FIXED:
+                # Length of fixed format is considered a maximum, fewer characters have to be padded later.
+                fixed_length = self.length.lower_limit
+                if len(value) > fixed_length:
+                    result = (FIELD_ERROR_FIXED_LENGTH, (fixed_length, value))
+            elif not self.length.is_within(len(value)):
+                result = (FIELD_ERROR_LENGTH, (self.field_name, value, self.length))
+        return result
 
     def validated_value(self, value):
         """
@@ -245,6 +392,175 @@ class AbstractFieldFormat(object):
             result = self.empty_value
         return result
 
+    def broken_value(self, value):
+        """
+        Tuple ``(error_code, error_args)`` describing why ``value`` does not
+        comply with the field description or ``None`` if it does. This
+        performs the same checks as
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` but
+        describes the first problem with one of the ``FIELD_ERROR_*`` codes
+        instead of raising an error with a formatted message. Use
+        :py:func:`field_value_error` to build the error if it is actually
+        needed.
+        """
+        result = None
+        invalid_character_regex = self.data_format.invalid_character_regex
+        if invalid_character_regex is not None:
+            invalid_character_match = invalid_character_regex.search(value)
+            if invalid_character_match is not None:
+                result = (FIELD_ERROR_CHARACTER, self._character_error_args(invalid_character_match))
+        if result is None:
+            if not value and not self.is_allowed_to_be_empty:
+                result = (FIELD_ERROR_EMPTY, ())
+            else:
+                result = self._broken_length(value)
+        if result is None:
+            if self.data_format.format == data.FORMAT_FIXED:
+                possibly_stripped_value = value.strip()
+            else:
+                possibly_stripped_value = value
+            if possibly_stripped_value:
+                result = self._broken_stripped_value(possibly_stripped_value)
+        return result
+
+    def _broken_stripped_value(self, value):
+        """
+        Same as :py:meth:`~cutplace.fields.AbstractFieldFormat.broken_value()`
+        but for a ``value`` that already passed the checks described in
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()`.
+
+        The default implementation calls
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()`
+        and describes any error it raises with :py:data:`FIELD_ERROR_OTHER`.
+        Field formats can override this to describe broken values without
+        raising an error.
+        """
+        assert value
+
+        try:
+            self.validated_value(value)
+            result = None
+        except errors.FieldValueError as error:
+            result = (FIELD_ERROR_OTHER, (error,))
+        return result
+
+    def validated_column(self, values):
+        """
+        Validate all ``values`` of a column at once. This is the same as
+        calling :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()`
+        for each value but faster in case of many values if the field format
+        implements
+        :py:meth:`~cutplace.fields.AbstractFieldFormat._validated_column_values()`.
+
+        The result is a tuple ``(validated_values, index_to_error_map)``:
+
+        * ``validated_values``: list with the result of \
+          :py:meth:`~cutplace.fields.AbstractFieldFormat.validated()` for \
+          each value or ``None`` for broken values.
+        * ``index_to_error_map``: map of the indices of broken values to the \
+          :py:exc:`cutplace.errors.FieldValueError` describing the problem.
+
+        :param list values: the values to validate
+        :rtype: tuple
+        """
+        assert values is not None
+
+        result, indices_to_validate = self._validated_column_values_and_indices_to_validate(values)
+        index_to_error_map = {}
+        # Validate possibly broken values one by one to get the exact same results and errors as `validated()`.
+        for index in indices_to_validate:
+            try:
+                result[index] = self.validated(values[index])
+            except errors.FieldValueError as error:
+                result[index] = None
+                index_to_error_map[index] = error
+        return result, index_to_error_map
+
+    def broken_column(self, values):
+        """
+        Same as :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_column()`
+        but without the validated values and with the broken values
+        described by :py:meth:`~cutplace.fields.AbstractFieldFormat.broken_value()`
+        instead of errors.
+
+        :param list values: the values to validate
+        :return: map of the indices of broken values to a tuple \
+          ``(error_code, error_args)``
+        :rtype: dict
+        """
+        assert values is not None
+
+        _, indices_to_validate = self._validated_column_values_and_indices_to_validate(values)
+        result = {}
+        broken_value = self.broken_value
+        for index in indices_to_validate:
+            error_code_and_args = broken_value(values[index])
+            if error_code_and_args is not None:
+                result[index] = error_code_and_args
+        return result
+
+    def _validated_column_values_and_indices_to_validate(self, values):
+        """
+        Tuple ``(validated_values, indices_to_validate)`` where
+        ``indices_to_validate`` is the sorted list of indices of ``values``
+        that might be broken and have to be validated one by one.
+        """
+        if self.data_format.format == data.FORMAT_FIXED:
+            stripped_values = [value.strip() for value in values]
+        else:
+            stripped_values = values
+        validated_values_and_indices_to_validate = self._validated_column_values(stripped_values)
+        if validated_values_and_indices_to_validate is None:
+            result = [None] * len(values)
+            indices_to_validate = range(len(values))
+        else:
+            result, indices_to_validate = validated_values_and_indices_to_validate
+            indices_to_validate = set(indices_to_validate)
+            indices_to_validate.update(self._column_indices_to_validate(values, stripped_values))
+            indices_to_validate = sorted(indices_to_validate)
+        return result, indices_to_validate
+
+    def _column_indices_to_validate(self, values, stripped_values):
+        """
+        Set of indices of ``values`` that are empty or might break
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validate_characters()`
+        or :py:meth:`~cutplace.fields.AbstractFieldFormat.validate_length()`.
+        """
+        result = set(index for index, value in enumerate(stripped_values) if not value)
+        invalid_character_regex = self.data_format.invalid_character_regex
+        if invalid_character_regex is not None:
+            search = invalid_character_regex.search
+            result.update(index for index, value in enumerate(values) if search(value) is not None)
+        if self.length is not None:
+            value_lengths = [len(value) for value in values]
+            if self.data_format.format == data.FORMAT_FIXED:
+                fixed_length = self.length.lower_limit
+                result.update(
+                    index for index, value_length in enumerate(value_lengths) if value_length > fixed_length)
+            else:
+                result.update(self.length.out_of_range_indices(value_lengths))
+        return result
+
+    def _validated_column_values(self, values):
+        """
+        Support for :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_column()`
+        to validate ``values`` without calling
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()` for
+        each of them. The ``values`` already have trailing blanks removed for
+        fixed format data but still can be empty or contain invalid
+        characters.
+
+        The result is a tuple ``(validated_values, indices_to_validate)``
+        where ``validated_values`` is a list with the same result as
+        :py:meth:`~cutplace.fields.AbstractFieldFormat.validated_value()`
+        for each value except for the indices in ``indices_to_validate``,
+        which are validated one by one later. This can also be ``None`` to
+        validate all values one by one, which is the default.
+        """
+        assert values is not None
+
+        return None
+
     def __str__(self):
         return "%s(%s, %s, %s, %s)" % (
             self.__class__.__name__, _compat.text_repr(self.field_name), self.is_allowed_to_be_empty,
@@ -254,54 +570,153 @@ class AbstractFieldFormat(object):
 class ChoiceFieldFormat(AbstractFieldFormat):
     """
     Field format accepting only values from a pool of choices.
+
+    The rule can start with the keyword ``ignorecase`` to accept values
+    regardless of their case. Instead of listing the choices, the rule can
+    also be ``file "some.txt"`` to read the choices from a UTF-8 text file
+    with one choice per line. A relative path is resolved from the current
+    folder.
     """
     def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format):
         super(ChoiceFieldFormat, self).__init__(
             field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value='')
         self.choices = []
+        self._ignore_case = False
+        self._choices_path = None
 
         # Split rule into tokens, ignoring white space.
-        tokens = _tools.tokenize_without_space(rule)
+        tokens = list(_tools.tokenize_without_space(rule))
+
+        # Extract keywords from rule tokens.
+        token_index = 0
+        while ChoiceFieldFormat._is_keyword_at(tokens, token_index):
+            keyword_text = tokens[token_index][1]
+            if keyword_text == _CHOICE_KEYWORD_IGNORE_CASE:
+                self._ignore_case = True
+                token_index += 1
+            else:
+                assert keyword_text == _CHOICE_KEYWORD_FILE
+                self._choices_path = _tools.token_text(tokens[token_index + 1])
+                token_index += 2
+                if not _tools.is_eof_token(tokens[token_index]):
+                    raise errors.InterfaceError(
+                        "file with choices must be the last part of the rule but found: %s"
+                        % _compat.text_repr(tokens[token_index][1]))
 
-        # Extract choices from rule tokens.
-        previous_toky = None
-        toky = next(tokens)
-        while not _tools.is_eof_token(toky):
-            if _tools.is_comma_token(toky):
-                # Handle comma after comma without choice.
-                if previous_toky:
-                    previous_toky_text = previous_toky[1]
-                else:
-                    previous_toky_text = None
-                raise errors.InterfaceError(
-                    "choice value must precede a comma (,) but found: %s" % _compat.text_repr(previous_toky_text))
-            choice = _tools.token_text(toky)
-            if not choice:
-                raise errors.InterfaceError(
-                    "choice field must be allowed to be empty instead of containing an empty choice")
-            self.choices.append(choice)
+        if self._choices_path is not None:
+            self.choices = _choices_from_file(self._choices_path)
+        else:
+            # Extract choices from rule tokens.
+            tokens = iter(tokens[token_index:])
+            previous_toky = None
             toky = next(tokens)
-            if not _tools.is_eof_token(toky):
-                if not _tools.is_comma_token(toky):
+            while not _tools.is_eof_token(toky):
+                if _tools.is_comma_token(toky):
+                    # Handle comma after comma without choice.
+                    if previous_toky:
+                        previous_toky_text = previous_toky[1]
+                    else:
+                        previous_toky_text = None
                     raise errors.InterfaceError(
-                        "comma (,) must follow choice value %s but found: %s"
-                        % (_compat.text_repr(choice), _compat.text_repr(toky[1])))
-                # Process next choice after comma.
+                        "choice value must precede a comma (,) but found: %s" % _compat.text_repr(previous_toky_text))
+                choice = _tools.token_text(toky)
+                if not choice:
+                    raise errors.InterfaceError(
+                        "choice field must be allowed to be empty instead of containing an empty choice")
+                self.choices.append(choice)
                 toky = next(tokens)
-                if _tools.is_eof_token(toky):
-                    raise errors.InterfaceError("trailing comma (,) must be removed")
+                if not _tools.is_eof_token(toky):
+                    if not _tools.is_comma_token(toky):
+                        raise errors.InterfaceError(
+                            "comma (,) must follow choice value %s but found: %s"
+                            % (_compat.text_repr(choice), _compat.text_repr(toky[1])))
+                    # Process next choice after comma.
+                    toky = next(tokens)
+                    if _tools.is_eof_token(toky):
+                        raise errors.InterfaceError("trailing comma (,) must be removed")
         if not self.is_allowed_to_be_empty and not self.choices:
             raise errors.InterfaceError("choice field without any choices must be allowed to be empty")
+        if self._ignore_case:
+            self._choice_set = frozenset(_folded_case(choice) for choice in self.choices)
+        else:
+            self._choice_set = frozenset(self.choices)
+
+    @staticmethod
+    def _is_keyword_at(tokens, token_index):
+        """
+        ``True`` if ``tokens[token_index]`` is a keyword and not just a
+        choice, which is the case if it is followed by something other than
+        a comma or the end of the rule.
+        """
+        result = False
+        toky = tokens[token_index]
+        if (toky[0] == token.NAME) and (toky[1] in (_CHOICE_KEYWORD_FILE, _CHOICE_KEYWORD_IGNORE_CASE)):
+            next_toky = tokens[token_index + 1]
+            result = not _tools.is_eof_token(next_toky) and not _tools.is_comma_token(next_toky)
+        return result
+
+    @property
+    def ignore_case(self):
+        """
+        ``True`` if values are accepted regardless of their case.
+        """
+        return self._ignore_case
+
+    @property
+    def choices_path(self):
+        """
+        The path of the file the choices have been read from or ``None`` if
+        the rule lists the choices.
+        """
+        return self._choices_path
 
     def validated_value(self, value):
         assert value
 
-        if value not in self.choices:
-            raise errors.FieldValueError(
-                "value is %s but must be one of: %s"
-                % (_compat.text_repr(value), _tools.human_readable_list(self.choices)))
+        broken_value = self._broken_stripped_value(value)
+        if broken_value is not None:
+            raise field_value_error(*broken_value)
         return value
 
+    def _broken_stripped_value(self, value):
+        assert value
+
+        value_to_look_up = _folded_case(value) if self._ignore_case else value
+        if value_to_look_up not in self._choice_set:
+            result = (FIELD_ERROR_CHOICE, (value, self.choices, self._choices_path))
+        else:
+            result = None
+        return result
+
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        choice_set = self._choice_set
+        values_to_look_up = [_folded_case(value) for value in values] if self._ignore_case else values
+        indices_to_validate = [
+            index for index, value_to_look_up in enumerate(values_to_look_up) if value_to_look_up not in choice_set]
+        return list(values), indices_to_validate
+
+
+def _choices_from_file(choices_path):
+    """
+    List of choices read from the UTF-8 text file ``choices_path`` with one
+    choice per line, ignoring white space around choices and empty lines.
+    """
+    assert choices_path is not None
+
+    result = []
+    try:
+        with io.open(choices_path, 'r', encoding='utf-8') as choices_file:
+            for line in choices_file:
+                choice = line.strip()
+                if choice:
+                    result.append(choice)
+    except (EnvironmentError, UnicodeError) as error:
+        raise errors.InterfaceError(
+            'cannot read choices from %s: %s' % (_compat.text_repr(choices_path), error))
+    return result
+
 
 class ConstantFieldFormat(AbstractFieldFormat):
     """
@@ -343,11 +758,21 @@ class ConstantFieldFormat(AbstractFieldFormat):
         assert value
 
         if value != self._constant:
-            raise errors.FieldValueError(
-                "value is %s but must be constant: %s"
-                % (_compat.text_repr(value), _compat.text_repr(self._constant)))
+            raise field_value_error(FIELD_ERROR_CONSTANT, (value, self._constant))
         return value
 
+    def _broken_stripped_value(self, value):
+        assert value
+
+        return (FIELD_ERROR_CONSTANT, (value, self._constant)) if value != self._constant else None
+
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        constant = self._constant
+        indices_to_validate = [index for index, value in enumerate(values) if value != constant]
+        return list(values), indices_to_validate
+
 
 class DecimalFieldFormat(AbstractFieldFormat):
     """
@@ -356,10 +781,30 @@ class DecimalFieldFormat(AbstractFieldFormat):
     :py:const:`cutplace.data.KEY_THOUSANDS_SEPARATOR` into account.
     """
 
-    def __init__(self, field_name, is_allowed_to_be_empty, length_text, rule, data_format, empty_value=None):
+    def __init__(self, field_name, is_allowed_to_be_empty, length_text, rule, data_format, empty_value=None,
+                 result_type=None):
+        """
+        Set up a field format for decimal numbers within the range described
+        by ``rule``. By default, :py:meth:`validated` results in a
+        :py:class:`decimal.Decimal`. Use ``result_type``
+        :py:const:`DECIMAL_RESULT_FLOAT` to get a :py:class:`float` (provided
+        the range has at most :py:const:`MAX_FLOAT_DIGITS` digits) or
+        :py:const:`DECIMAL_RESULT_SCALED_INTEGER` to get an :py:class:`int`
+        multiplied by 10 to the power of the precision of the range, for
+        example 1234 for ``'12.34'`` with the range ``0.00...99.99``.
+
+        Alternatively ``rule`` can start with the result type followed by
+        the range, for example ``float 0.00...99.99``, which takes
+        precedence.
+        """
+        assert (result_type is None) or (result_type in _DECIMAL_RESULT_TYPES), 'result_type=%r' % result_type
         super(DecimalFieldFormat, self).__init__(
             field_name, is_allowed_to_be_empty, "", "", data_format, empty_value)
         assert rule is not None, 'to specify "no rule" use "" instead of None'
+        rule_parts = rule.split(None, 1)
+        if rule_parts and (rule_parts[0] in _DECIMAL_RESULT_TYPES):
+            result_type = rule_parts[0]
+            rule = rule_parts[1] if len(rule_parts) == 2 else ''
         self.decimal_separator = data_format.decimal_separator
         self.thousands_separator = data_format.thousands_separator
         self.valid_range = ranges.DecimalRange(rule, ranges.DEFAULT_DECIMAL_RANGE_TEXT)
@@ -371,6 +816,19 @@ class DecimalFieldFormat(AbstractFieldFormat):
         else:
             self._precision = None
             self._scale = None
+        self._result_type = result_type if result_type is not None else DECIMAL_RESULT_DECIMAL
+        if (self._result_type == DECIMAL_RESULT_FLOAT) and (self._scale > MAX_FLOAT_DIGITS):
+            raise errors.InterfaceError(
+                'to validate decimal field %s as float, the range must have at most %d digits but is: %s'
+                % (_compat.text_repr(field_name), MAX_FLOAT_DIGITS, self.valid_range))
+
+    @property
+    def result_type(self):
+        """
+        The type of the result of :py:meth:`validated`, for example
+        :py:const:`DECIMAL_RESULT_DECIMAL`.
+        """
+        return self._result_type
 
     def sql_ansi_type(self):
         return ('decimal', self._scale, self._precision)
@@ -378,24 +836,34 @@ class DecimalFieldFormat(AbstractFieldFormat):
     def validated_value(self, value):
         assert value
 
-        translated_value = ""
-        found_decimal_separator = False
-        for character_to_process in value:
-            if character_to_process == self.decimal_separator:
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain only one decimal separator (%s): %s"
-                        % (_compat.text_repr(self.decimal_separator), _compat.text_repr(value)))
-                translated_value += "."
-                found_decimal_separator = True
-            elif self.thousands_separator and (character_to_process == self.thousands_separator):
-                if found_decimal_separator:
-                    raise errors.FieldValueError(
-                        "decimal field must contain thousands separator (%r) only before "
-                        "decimal separator (%r): %r "
-                        % (self.thousands_separator, self.decimal_separator, value))
+        decimal_separator = self.decimal_separator
+        thousands_separator = self.thousands_separator
+        has_thousands_separator = bool(thousands_separator) and (thousands_separator != decimal_separator)
+        integer_part, found_decimal_separator, fraction_part = value.partition(decimal_separator)
+        if found_decimal_separator:
+            # Report whatever comes first: another decimal separator or a thousands separator.
+            second_decimal_separator_index = fraction_part.find(decimal_separator)
+            if has_thousands_separator:
+                thousands_separator_index = fraction_part.find(thousands_separator)
             else:
-                translated_value += character_to_process
+                thousands_separator_index = -1
+            if (thousands_separator_index != -1) and \
+                    ((second_decimal_separator_index == -1)
+                     or (thousands_separator_index < second_decimal_separator_index)):
+                raise errors.FieldValueError(
+                    "decimal field must contain thousands separator (%r) only before "
+                    "decimal separator (%r): %r "
+                    % (thousands_separator, decimal_separator, value))
+            if second_decimal_separator_index != -1:
+                raise errors.FieldValueError(
+                    "decimal field must contain only one decimal separator (%s): %s"
+                    % (_compat.text_repr(decimal_separator), _compat.text_repr(value)))
+        if has_thousands_separator:
+            integer_part = integer_part.replace(thousands_separator, '')
+        if found_decimal_separator:
+            translated_value = integer_part + '.' + fraction_part
+        else:
+            translated_value = integer_part
 
         try:
             result = decimal.Decimal(translated_value)
@@ -409,8 +877,59 @@ class DecimalFieldFormat(AbstractFieldFormat):
         except errors.RangeValueError as error:
             raise errors.FieldValueError(str(error))
 
+        if self._result_type == DECIMAL_RESULT_FLOAT:
+            result = float(result)
+        elif self._result_type == DECIMAL_RESULT_SCALED_INTEGER:
+            scaled_result = result.scaleb(self._precision, _EXACT_DECIMAL_CONTEXT)
+            result = int(scaled_result)
+            if result != scaled_result:
+                raise errors.FieldValueError(
+                    "value is %s but must have at most %d digits after the decimal separator"
+                    % (_compat.text_repr(value), self._precision))
         return result
 
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        decimal_separator = self.decimal_separator
+        thousands_separator = self.thousands_separator
+        has_thousands_separator = bool(thousands_separator) and (thousands_separator != decimal_separator)
+        result_type = self._result_type
+        result = []
+        indices_to_validate = []
+        for index, value in enumerate(values):
+            integer_part, found_decimal_separator, fraction_part = value.partition(decimal_separator)
+            # Leave values with misplaced separators to `validated_value()` for a proper error message.
+            is_validated = (decimal_separator not in fraction_part) and \
+                not (has_thousands_separator and (thousands_separator in fraction_part))
+            if is_validated:
+                if has_thousands_separator:
+                    integer_part = integer_part.replace(thousands_separator, '')
+                try:
+                    value_as_decimal = decimal.Decimal(integer_part + '.' + fraction_part) \
+                        if found_decimal_separator else decimal.Decimal(integer_part)
+                    is_validated = value_as_decimal.is_finite()
+                except Exception:
+                    is_validated = False
+            if is_validated:
+                result.append(value_as_decimal)
+            else:
+                # Use a placeholder that is validated again later anyway.
+                result.append(decimal.Decimal(0))
+                indices_to_validate.append(index)
+        indices_to_validate.extend(self.valid_range.out_of_range_indices(result))
+        if result_type == DECIMAL_RESULT_FLOAT:
+            result = [float(value_as_decimal) for value_as_decimal in result]
+        elif result_type == DECIMAL_RESULT_SCALED_INTEGER:
+            precision = self._precision
+            for index, value_as_decimal in enumerate(result):
+                scaled_value = value_as_decimal.scaleb(precision, _EXACT_DECIMAL_CONTEXT)
+                scaled_integer = int(scaled_value)
+                if scaled_integer != scaled_value:
+                    indices_to_validate.append(index)
+                result[index] = scaled_integer
+        return result, indices_to_validate
+
 
 class IntegerFieldFormat(AbstractFieldFormat):
     """
@@ -480,13 +999,41 @@ class IntegerFieldFormat(AbstractFieldFormat):
         try:
             value_as_int = int(value)
         except ValueError:
-            raise errors.FieldValueError("value must be an integer number: %s" % _compat.text_repr(value))
-        try:
-            self.valid_range.validate("value", value_as_int)
-        except errors.RangeValueError as error:
-            raise errors.FieldValueError(six.text_type(error))
+            raise field_value_error(FIELD_ERROR_INTEGER, (value,))
+        if not self.valid_range.is_within(value_as_int):
+            raise field_value_error(FIELD_ERROR_RANGE, ("value", value_as_int, self.valid_range))
         return value_as_int
 
+    def _broken_stripped_value(self, value):
+        assert value
+
+        try:
+            value_as_int = int(value)
+        except ValueError:
+            value_as_int = None
+        if value_as_int is None:
+            result = (FIELD_ERROR_INTEGER, (value,))
+        elif not self.valid_range.is_within(value_as_int):
+            result = (FIELD_ERROR_RANGE, ("value", value_as_int, self.valid_range))
+        else:
+            result = None
+        return result
+
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        result = []
+        indices_to_validate = []
+        for index, value in enumerate(values):
+            try:
+                result.append(int(value))
+            except ValueError:
+                # Use a placeholder that is validated again later anyway.
+                result.append(0)
+                indices_to_validate.append(index)
+        indices_to_validate.extend(self.valid_range.out_of_range_indices(result))
+        return result, indices_to_validate
+
 
 class DateTimeFieldFormat(AbstractFieldFormat):
     """
@@ -496,7 +1043,14 @@ class DateTimeFieldFormat(AbstractFieldFormat):
     # particular, "%" need to be checked first, and "YYYY" needs to be checked before "YY".
     _human_readable_to_strptime_map = ["%:%%", "DD:%d", "MM:%m", "YYYY:%Y", "YY:%y", "hh:%H", "mm:%M", "ss:%S"]
 
-    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value=None):
+    def __init__(self, field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value=None,
+                 as_datetime=False):
+        """
+        Set up a field format for dates and times formatted as described by
+        ``rule``. By default, :py:meth:`validated` results in a
+        :py:class:`time.struct_time`; with ``as_datetime`` it is a
+        :py:class:`datetime.datetime` instead.
+        """
         super(DateTimeFieldFormat, self).__init__(
             field_name, is_allowed_to_be_empty, length, rule, data_format, empty_value)
         self.human_readable_format = rule
@@ -507,6 +1061,16 @@ class DateTimeFieldFormat(AbstractFieldFormat):
             (key, value) = patternKeyValue.split(":")
             strptime_format = strptime_format.replace(key, value)
         self.strptimeFormat = strptime_format
+        self._as_datetime = as_datetime
+        self._date_time_parser = _DateTimeParser.for_strptime_format(strptime_format)
+
+    @property
+    def as_datetime(self):
+        """
+        ``True`` if :py:meth:`validated` results in a
+        :py:class:`datetime.datetime` instead of a :py:class:`time.struct_time`.
+        """
+        return self._as_datetime
 
     def sql_ansi_type(self):
         return ('date',)
@@ -514,12 +1078,145 @@ class DateTimeFieldFormat(AbstractFieldFormat):
     def validated_value(self, value):
         assert value
 
-        try:
-            result = time.strptime(value, self.strptimeFormat)
-        except ValueError:
-            raise errors.FieldValueError(
-                "date must match format %s (%s) but is: %s (%s)"
-                % (self.human_readable_format, self.strptimeFormat, _compat.text_repr(value), sys.exc_info()[1]))
+        if self._date_time_parser is not None:
+            parsed_datetime = self._date_time_parser.parsed(value)
+        else:
+            parsed_datetime = None
+        if parsed_datetime is not None:
+            result = parsed_datetime if self._as_datetime else parsed_datetime.timetuple()
+        else:
+            # Let strptime() decide on values the parser cannot handle, which also results in the
+            # proper error message for broken values.
+            try:
+                result = time.strptime(value, self.strptimeFormat)
+            except ValueError:
+                raise errors.FieldValueError(
+                    "date must match format %s (%s) but is: %s (%s)"
+                    % (self.human_readable_format, self.strptimeFormat, _compat.text_repr(value), sys.exc_info()[1]))
+            if self._as_datetime:
+                try:
+                    result = datetime.datetime(*result[:6])
+                except ValueError as error:
+                    raise errors.FieldValueError(
+                        "date must be a valid datetime but is: %s (%s)" % (_compat.text_repr(value), error))
+        return result
+
+
+class _DateTimeParser(object):
+    """
+    Parser for values formatted according to a ``strptime_format`` that
+    uses only the directives of :py:class:`DateTimeFieldFormat`. It accepts
+    the same values as :py:func:`time.strptime` using an equivalent regular
+    expression compiled once but avoids the lock, format cache and time zone
+    handling of :py:func:`time.strptime`.
+    """
+    # Regular expressions used by ``_strptime`` for the directives we support.
+    _DIRECTIVE_TO_REGEX_MAP = {
+        'd': r'(3[0-1]|[1-2]\d|0[1-9]|[1-9]| [1-9])',
+        'm': r'(1[0-2]|0[1-9]|[1-9])',
+        'Y': r'(\d\d\d\d)',
+        'y': r'(\d\d)',
+        'H': r'(2[0-3]|[0-1]\d|\d)',
+        'M': r'([0-5]\d|\d)',
+        'S': r'(6[0-1]|[0-5]\d|\d)',
+    }
+    _DIRECTIVE_TO_DATE_TIME_PART_MAP = {
+        'd': 'day', 'm': 'month', 'Y': 'year', 'y': 'year', 'H': 'hour', 'M': 'minute', 'S': 'second'}
+    _WHITE_SPACE_REGEX = re.compile(r'(\s+)')
+
+    def __init__(self, parts):
+        assert parts is not None
+
+        regex_pattern = ''
+        part_to_group_index_map = {}
+        self._has_short_year = False
+        for is_directive, text in parts:
+            if is_directive:
+                part_to_group_index_map[_DateTimeParser._DIRECTIVE_TO_DATE_TIME_PART_MAP[text]] = \
+                    len(part_to_group_index_map)
+                regex_pattern += _DateTimeParser._DIRECTIVE_TO_REGEX_MAP[text]
+                if text == 'y':
+                    self._has_short_year = True
+            else:
+                for literal_index, literal_part in enumerate(_DateTimeParser._WHITE_SPACE_REGEX.split(text)):
+                    is_white_space = (literal_index % 2 == 1)
+                    regex_pattern += r'\s+' if is_white_space else re.escape(literal_part)
+        self._regex = re.compile(regex_pattern, re.IGNORECASE)
+        self._year_index = part_to_group_index_map.get('year')
+        self._month_index = part_to_group_index_map.get('month')
+        self._day_index = part_to_group_index_map.get('day')
+        self._hour_index = part_to_group_index_map.get('hour')
+        self._minute_index = part_to_group_index_map.get('minute')
+        self._second_index = part_to_group_index_map.get('second')
+
+    @staticmethod
+    def for_strptime_format(strptime_format):
+        """
+        A parser for ``strptime_format`` or ``None`` if it contains
+        directives that are unsupported or describe the same part of a date
+        or time more than once.
+        """
+        assert strptime_format is not None
+
+        result = None
+        parts = []
+        literal = ''
+        directive_index = strptime_format.find('%')
+        while (parts is not None) and (directive_index != -1):
+            literal += strptime_format[:directive_index]
+            directive = strptime_format[directive_index + 1:directive_index + 2]
+            strptime_format = strptime_format[directive_index + 2:]
+            if directive == '%':
+                literal += '%'
+            elif directive in _DateTimeParser._DIRECTIVE_TO_REGEX_MAP:
+                if literal:
+                    parts.append((False, literal))
+                    literal = ''
+                parts.append((True, directive))
+            else:
+                parts = None
+            directive_index = strptime_format.find('%')
+        if parts is not None:
+            literal += strptime_format
+            if literal:
+                parts.append((False, literal))
+            date_time_parts = [
+                _DateTimeParser._DIRECTIVE_TO_DATE_TIME_PART_MAP[text] for is_directive, text in parts if is_directive]
+            if len(date_time_parts) == len(set(date_time_parts)):
+                result = _DateTimeParser(parts)
+        return result
+
+    def parsed(self, value):
+        """
+        The :py:class:`datetime.datetime` described by ``value`` or ``None``
+        if ``value`` is broken or has to be parsed by
+        :py:func:`time.strptime` for other reasons, for example because it
+        contains a leap second.
+        """
+        assert value is not None
+
+        result = None
+        match = self._regex.match(value)
+        if (match is not None) and (match.end() == len(value)):
+            groups = match.groups()
+            if self._year_index is not None:
+                year = int(groups[self._year_index])
+                if self._has_short_year:
+                    year += 2000 if year <= 68 else 1900
+            else:
+                year = 1900
+            month = int(groups[self._month_index]) if self._month_index is not None else 1
+            day = int(groups[self._day_index]) if self._day_index is not None else 1
+            hour = int(groups[self._hour_index]) if self._hour_index is not None else 0
+            minute = int(groups[self._minute_index]) if self._minute_index is not None else 0
+            second = int(groups[self._second_index]) if self._second_index is not None else 0
+            # For leap seconds and February 29 without year, strptime() has special rules.
+            if (second <= 59) and ((self._year_index is not None) or (month != 2) or (day != 29)):
+                try:
+                    result = datetime.datetime(year, month, day, hour, minute, second)
+                except ValueError:
+                    # Invalid date, for example 2015-02-30.
+                    pass
         return result
 
 
@@ -536,11 +1233,21 @@ class RegExFieldFormat(AbstractFieldFormat):
         assert value
 
         if not self.regex.match(value):
-            raise errors.FieldValueError(
-                "value %s must match regular expression: %s"
-                % (_compat.text_repr(value), _compat.text_repr(self.rule)))
+            raise field_value_error(FIELD_ERROR_REGEX, (value, self.rule))
         return value
 
+    def _broken_stripped_value(self, value):
+        assert value
+
+        return (FIELD_ERROR_REGEX, (value, self.rule)) if not self.regex.match(value) else None
+
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        match = self.regex.match
+        indices_to_validate = [index for index, value in enumerate(values) if match(value) is None]
+        return list(values), indices_to_validate
+
 
 class PatternFieldFormat(AbstractFieldFormat):
     """
@@ -556,11 +1263,21 @@ class PatternFieldFormat(AbstractFieldFormat):
         assert value
 
         if not self.regex.match(value):
-            raise errors.FieldValueError(
-                'value %s must match pattern: %s (regex %s)'
-                % (_compat.text_repr(value), _compat.text_repr(self.rule), _compat.text_repr(self.pattern)))
+            raise field_value_error(FIELD_ERROR_PATTERN, (value, self.rule, self.pattern))
         return value
 
+    def _broken_stripped_value(self, value):
+        assert value
+
+        return (FIELD_ERROR_PATTERN, (value, self.rule, self.pattern)) if not self.regex.match(value) else None
+
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        match = self.regex.match
+        indices_to_validate = [index for index, value in enumerate(values) if match(value) is None]
+        return list(values), indices_to_validate
+
 
 class TextFieldFormat(AbstractFieldFormat):
     """
@@ -575,6 +1292,11 @@ class TextFieldFormat(AbstractFieldFormat):
         # TODO: Validate Text with rules like: 32..., a...z and so on.
         return value
 
+    def _validated_column_values(self, values):
+        assert values is not None
+
+        return list(values), []
+
 
 def field_name_index(field_name_to_look_up, available_field_names, location):
     """
@@ -21,6 +21,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import glob
+import hashlib
 import imp  # TODO: deprecated; with Python 3, use importlib.
 import inspect
 import io
@@ -28,6 +29,7 @@ import logging
 import os.path
 
 import six
+from six.moves import cPickle as pickle
 
 from cutplace import data
 from cutplace import fields
@@ -38,6 +40,9 @@ from cutplace import _compat
 from cutplace import _tools
 from cutplace._compat import python_2_unicode_compatible
 
+#: Suffix of the files :py:func:`cached_cid` stores compiled CIDs in.
+CID_CACHE_SUFFIX = '.cidcache'
+
 _log = logging.getLogger("cutplace")
 
 
@@ -88,6 +93,19 @@ class Cid(object):
             ])
         return result
 
+    def __getstate__(self):
+        # Leave out the classes available for field formats and checks because they are set up again when
+        # unpickling. This also prevents classes from plugins the CID does not use from breaking the pickling.
+        result = self.__dict__.copy()
+        del result['_check_name_to_class_map']
+        del result['_field_format_name_to_class_map']
+        return result
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._check_name_to_class_map = Cid._create_name_to_class_map(checks.AbstractCheck)
+        self._field_format_name_to_class_map = Cid._create_name_to_class_map(fields.AbstractFieldFormat)
+
     def set_location_to_caller(self):
         """
         Set the internal :py:attr:`_location` to the caller function. This is
@@ -518,6 +536,135 @@ def create_cid_from_string(cid_text):
     return result
 
 
+def cached_cid(cid_path, cache_folder=None):
+    """
+    Same as ``Cid(cid_path)`` but using a compiled version of the CID
+    pickled by a previous call, which takes only a fraction of the time
+    needed to read and compile the CID again.
+
+    The cache is stored in ``cache_folder`` or, if it is ``None``, next to
+    the CID using the suffix :py:const:`CID_CACHE_SUFFIX`. It is renewed
+    automatically once the path, modification time or size of the CID or of
+    a file with choices referred to by a
+    :py:class:`~cutplace.fields.ChoiceFieldFormat` or the version of
+    cutplace changes. If the cache cannot be read or written, the
+    CID is read from ``cid_path`` as usual.
+
+    Because loading a pickled cache can run arbitrary code, only use cache
+    folders that cannot be modified by others.
+
+    :param str cid_path: the path of a CID file in any format supported by \
+      :py:class:`~cutplace.interface.Cid`
+    :param str cache_folder: folder to store the cache in; ``None`` stores \
+      the cache next to the CID
+    :rtype: cutplace.interface.Cid
+    """
+    assert cid_path is not None
+
+    cache_path = _cid_cache_path(cid_path, cache_folder)
+    cache_key = _cid_cache_key(cid_path)
+    result = _cached_cid_or_none(cache_path, cache_key)
+    if result is None:
+        result = Cid(cid_path)
+        _write_cid_cache(cache_path, cache_key, result)
+    return result
+
+
+def _cid_cache_path(cid_path, cache_folder):
+    """
+    The path of the file to cache the CID read from ``cid_path`` in.
+    """
+    if cache_folder is None:
+        result = cid_path + CID_CACHE_SUFFIX
+    else:
+        # Add a digest of the full path so CIDs with the same name in different folders use different caches.
+        absolute_cid_path = os.path.abspath(cid_path)
+        cid_path_digest = hashlib.sha1(absolute_cid_path.encode('utf-8')).hexdigest()[:12]
+        result = os.path.join(
+            cache_folder, '%s_%s%s' % (os.path.basename(cid_path), cid_path_digest, CID_CACHE_SUFFIX))
+    return result
+
+
+def _cid_cache_key(cid_path):
+    """
+    Tuple identifying the state of the CID file ``cid_path`` and the
+    cutplace version used to compile it.
+    """
+    # Import here to avoid circular import because the package imports this module.
+    from cutplace import __version__
+
+    cid_stat = os.stat(cid_path)
+    return __version__, os.path.abspath(cid_path), cid_stat.st_size, cid_stat.st_mtime
+
+
+def _file_state(path):
+    """
+    Tuple ``(absolute_path, size, modification_time)`` of the file
+    ``path`` or ``None`` if it cannot be accessed.
+    """
+    try:
+        path_stat = os.stat(path)
+    except (EnvironmentError, OSError):
+        return None
+    return os.path.abspath(path), path_stat.st_size, path_stat.st_mtime
+
+
+def _choices_file_states(cid):
+    """
+    List of tuples ``(choices_path, file_state)`` for all files with
+    choices ``cid`` read while it was compiled, where ``file_state`` is
+    the result of :py:func:`_file_state`.
+    """
+    assert cid is not None
+
+    return [
+        (field_format.choices_path, _file_state(field_format.choices_path))
+        for field_format in cid.field_formats
+        if isinstance(field_format, fields.ChoiceFieldFormat) and (field_format.choices_path is not None)]
+
+
+def _cached_cid_or_none(cache_path, cache_key):
+    """
+    The :py:class:`~cutplace.interface.Cid` pickled in ``cache_path`` or
+    ``None`` if there is no cache, it is broken, it was stored for another
+    ``cache_key`` or a file with choices it uses has changed since.
+    """
+    result = None
+    try:
+        with io.open(cache_path, 'rb') as cache_file:
+            # The keys are pickled separately so an outdated CID does not have to be loaded.
+            if pickle.load(cache_file) != cache_key:
+                _log.debug('ignore outdated CID cache "%s"', cache_path)
+            elif any(_file_state(choices_path) != choices_file_state
+                     for choices_path, choices_file_state in pickle.load(cache_file)):
+                _log.debug('ignore CID cache "%s" with outdated choices', cache_path)
+            else:
+                result = pickle.load(cache_file)
+                _log.debug('read CID from cache "%s"', cache_path)
+    except (EnvironmentError, OSError) as error:
+        _log.debug('cannot read CID cache "%s": %s', cache_path, error)
+    except Exception as error:
+        # Unpickling can fail in many ways, for example if a field format from a plugin is missing.
+        _log.debug('ignore broken CID cache "%s": %s', cache_path, error)
+    if (result is not None) and not isinstance(result, Cid):
+        _log.debug('ignore CID cache "%s" containing %s', cache_path, type(result).__name__)
+        result = None
+    return result
+
+
+def _write_cid_cache(cache_path, cache_key, cid):
+    """
+    Store ``cid`` in ``cache_path`` for :py:func:`cached_cid` to find it
+    again using ``cache_key``. Writing to a temporary file first ensures
+    that concurrent processes either find the old cache or the new one.
+    """
+    try:
+        _tools.write_pickled(cache_path, [cache_key, _choices_file_states(cid), cid])
+        _log.debug('wrote CID cache "%s"', cache_path)
+    except (EnvironmentError, OSError, AttributeError, TypeError, pickle.PicklingError) as error:
+        _log.warning('cannot write CID cache "%s": %s', cache_path, error)
+
+
 def field_names_and_lengths(fixed_cid):
     """
     List of tuples ``(field_name, field_length)`` for all field formats in
@@ -22,8 +22,11 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import token
+import bisect
 import decimal
+import re
+import sys
+import token
 
 import six
 
@@ -58,6 +61,13 @@ DEFAULT_PRECISION = len(MAX_DECIMAL_TEXT.split('.')[1])
 #: specified.
 DEFAULT_SCALE = len(MAX_DECIMAL_TEXT) - 1
 
+# Limits of integers NumPy can compare without converting them to Python objects.
+_MIN_INT64 = -2 ** 63
+_MAX_INT64 = 2 ** 63 - 1
+
+# The ``numpy`` module once `_numpy()` attempted to import it or ``False`` if it is not available.
+_numpy_module = None
+
 
 def code_for_number_token(name, value, location):
     """
@@ -126,6 +136,28 @@ def code_for_string_token(name, value, location):
     return ord(value_without_quotes)
 
 
+def _numpy():
+    """
+    The :py:mod:`numpy` module or ``None`` if it is not available. NumPy is
+    only imported on the first call because it takes a while.
+    """
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+            _numpy_module = numpy
+        except ImportError:
+            _numpy_module = False
+    return _numpy_module or None
+
+
+def has_numpy():
+    """
+    ``True`` if NumPy is available to validate many values at once.
+    """
+    return _numpy() is not None
+
+
 def create_range_from_length(length_range):
     """
     Create a range from length.
@@ -163,6 +195,45 @@ def create_range_from_length(length_range):
     return Range(range_rule_text)
 
 
+def create_invalid_character_regex(character_range):
+    """
+    A compiled regular expression where ``search()`` finds the first
+    character whose code is outside of ``character_range``, or ``None`` if
+    ``character_range`` accepts any character. This allows to validate all
+    characters of a text in a single scan.
+
+    :param cutplace.ranges.Range character_range: the range of valid \
+      character codes
+    """
+    assert character_range is not None
+
+    if character_range.items is None:
+        result = None
+    else:
+        # Clip the items to valid character codes and join adjacent ones.
+        valid_items = []
+        for lower, upper in sorted(
+                character_range.items, key=lambda item: -1 if item[0] is None else item[0]):
+            lower = 0 if lower is None else max(lower, 0)
+            upper = sys.maxunicode if upper is None else min(upper, sys.maxunicode)
+            if lower <= upper:
+                if valid_items and (lower <= valid_items[-1][1] + 1):
+                    valid_items[-1][1] = max(upper, valid_items[-1][1])
+                else:
+                    valid_items.append([lower, upper])
+        if valid_items:
+            character_class = ''
+            for lower, upper in valid_items:
+                character_class += re.escape(six.unichr(lower))
+                if upper > lower:
+                    character_class += '-' + re.escape(six.unichr(upper))
+            result = re.compile('[^' + character_class + ']')
+        else:
+            # No character code is within the range, so every character is invalid.
+            result = re.compile('.', re.DOTALL)
+    return result
+
+
 def _decimal_as_text(decimal_value, precision=DEFAULT_PRECISION):
     """
     Decimal value formatted as text always using a ``#.###`` format because
@@ -328,6 +399,7 @@ class Range(object):
                     self._upper_limit = None
                 elif (self._upper_limit is not None) and (upper_item > self._upper_limit):
                     self._upper_limit = upper_item
+        self._set_up_intervals(merge_adjacent_integers=True)
 
     @property
     def description(self):
@@ -369,6 +441,116 @@ class Range(object):
         """
         return self._upper_limit
 
+    def _set_up_intervals(self, merge_adjacent_integers):
+        """
+        Set up sorted and merged intervals derived from
+        :py:attr:`~cutplace.ranges.Range.items` so
+        :py:meth:`~cutplace.ranges.Range.validate` can use a binary search.
+        Integer items like ``1...3, 4...5`` are merged to ``1...5`` only if
+        ``merge_adjacent_integers`` is ``True`` because for decimal ranges
+        values like 3.5 must remain invalid.
+        """
+        if self._items is None:
+            self._interval_lowers = None
+            self._interval_uppers = None
+            self._has_interval_without_lower = False
+        else:
+            intervals = []
+            # Sort items without a lower limit first to avoid comparing ``None`` with numbers.
+            for lower, upper in sorted(self._items, key=lambda item: (item[0] is not None, item[0])):
+                if intervals:
+                    previous_upper = intervals[-1][1]
+                    is_mergeable = (previous_upper is None) or (lower is None) or (lower <= previous_upper) or (
+                        merge_adjacent_integers and (lower == previous_upper + 1))
+                    if is_mergeable:
+                        if (previous_upper is not None) and ((upper is None) or (upper > previous_upper)):
+                            intervals[-1][1] = upper
+                        continue
+                intervals.append([lower, upper])
+            self._interval_lowers = [lower for lower, _ in intervals]
+            self._interval_uppers = [upper for _, upper in intervals]
+            self._has_interval_without_lower = self._interval_lowers[0] is None
+
+    def _is_within_intervals(self, value):
+        """
+        ``True`` if ``value`` is within any of the intervals set up by
+        :py:meth:`~cutplace.ranges.Range._set_up_intervals`.
+        """
+        assert self._interval_lowers is not None
+
+        interval_lowers = self._interval_lowers
+        interval_uppers = self._interval_uppers
+        if len(interval_lowers) == 1:
+            # Fast path for ranges with a single interval.
+            lower = interval_lowers[0]
+            upper = interval_uppers[0]
+            result = ((lower is None) or (value >= lower)) and ((upper is None) or (value <= upper))
+        elif self._has_interval_without_lower and (value <= interval_uppers[0]):
+            result = True
+        else:
+            first_index = 1 if self._has_interval_without_lower else 0
+            interval_index = bisect.bisect_right(interval_lowers, value, first_index) - 1
+            if interval_index < first_index:
+                result = False
+            else:
+                upper = interval_uppers[interval_index]
+                result = (upper is None) or (value <= upper)
+        return result
+
+    def out_of_range_indices(self, values):
+        """
+        List of indices of all integer ``values`` that are not within the
+        range. This is the same as calling
+        :py:meth:`~cutplace.ranges.Range.validate` for each value but faster
+        in case of many values. If NumPy is available, integer ranges check
+        all values at once.
+
+        :param list values: the values to validate
+        :rtype: list
+        """
+        assert values is not None
+
+        if self._items is None:
+            result = []
+        else:
+            result = None
+            numpy = _numpy()
+            if numpy is not None:
+                result = self._out_of_range_indices_using_numpy(numpy, values)
+            if result is None:
+                is_within_intervals = self._is_within_intervals
+                result = [index for index, value in enumerate(values) if not is_within_intervals(value)]
+        return result
+
+    def _out_of_range_indices_using_numpy(self, numpy, values):
+        """
+        Same as :py:meth:`~cutplace.ranges.Range.out_of_range_indices` but
+        using the module ``numpy`` or ``None`` if the limits or ``values`` do
+        not fit into 64 bit integers.
+        """
+        assert numpy is not None
+        assert self._interval_lowers is not None
+
+        result = None
+        limits = [limit for limit in self._interval_lowers + self._interval_uppers if limit is not None]
+        has_int64_limits = all(
+            isinstance(limit, six.integer_types) and (_MIN_INT64 <= limit <= _MAX_INT64) for limit in limits)
+        if has_int64_limits:
+            try:
+                value_array = numpy.array(values)
+            except (OverflowError, ValueError):
+                value_array = None
+            if (value_array is not None) and (value_array.dtype.kind == 'i') and (value_array.ndim == 1):
+                lower_array = numpy.array(
+                    [_MIN_INT64 if lower is None else lower for lower in self._interval_lowers], dtype=numpy.int64)
+                upper_array = numpy.array(
+                    [_MAX_INT64 if upper is None else upper for upper in self._interval_uppers], dtype=numpy.int64)
+                interval_indices = numpy.searchsorted(lower_array, value_array, side='right') - 1
+                is_within_intervals = (interval_indices >= 0) & \
+                    (value_array <= upper_array[numpy.maximum(interval_indices, 0)])
+                result = numpy.flatnonzero(~is_within_intervals).tolist()
+        return result
+
     def _repr_item(self, item):
         """
         Human readable description of a range item.
@@ -444,6 +626,16 @@ class Range(object):
                 result = (value >= lower) and (value <= upper)
         return result
 
+    def is_within(self, value):
+        """
+        ``True`` if the integer ``value`` is within the range. This is the
+        same test as :py:meth:`~cutplace.ranges.Range.validate` performs but
+        without preparing an error for values out of range.
+        """
+        assert value is not None
+
+        return (self._items is None) or self._is_within_intervals(value)
+
     def validate(self, name, value, location=None):
         """
         Validate that ``value`` is within the specified range.
@@ -459,24 +651,9 @@ class Range(object):
         assert name
         assert value is not None
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value >= lower:
-                        is_valid = True
-                elif (value >= lower) and (value <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError(
-                    "%s is %r but must be within range: %s" % (name, value, self), location)
+        if not self.is_within(value):
+            raise errors.RangeValueError(
+                "%s is %r but must be within range: %s" % (name, value, self), location)
 
 
 @python_2_unicode_compatible
@@ -623,6 +800,7 @@ class DecimalRange(Range):
                     self._upper_limit = None
                 elif (self._upper_limit is not None) and (upper_item > self._upper_limit):
                     self._upper_limit = upper_item
+        self._set_up_intervals(merge_adjacent_integers=False)
 
     @property
     def precision(self):
@@ -701,21 +879,6 @@ class DecimalRange(Range):
         else:
             value_as_decimal = value
 
-        if self._items is not None:
-            is_valid = False
-            item_index = 0
-            while not is_valid and item_index < len(self._items):
-                lower, upper = self._items[item_index]
-                if lower is None:
-                    assert upper is not None
-                    if value_as_decimal <= upper:
-                        is_valid = True
-                elif upper is None:
-                    if value_as_decimal >= lower:
-                        is_valid = True
-                elif (value_as_decimal >= lower) and (value_as_decimal <= upper):
-                    is_valid = True
-                item_index += 1
-            if not is_valid:
-                raise errors.RangeValueError(
-                    "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location)
+        if (self._items is not None) and not self._is_within_intervals(value_as_decimal):
+            raise errors.RangeValueError(
+                "%s is %r but must be within range: %r" % (name, value_as_decimal, self), location)
@@ -24,14 +24,18 @@ from __future__ import unicode_literals
 import csv
 import datetime
 import io
+import itertools
+import mmap
+import operator
 import os
+import posixpath
 import re
 import six
-import xlrd
-import xlsxwriter
-import zipfile
 from contextlib import closing
-from xml.etree import ElementTree
+
+# NOTE: Modules only needed for Excel and ODS, such as ``xlrd``,
+# ``xlsxwriter``, ``zipfile`` and ``xml.etree.ElementTree``, are imported
+# where they are used so ``import cutplace`` remains fast.
 
 from cutplace import data
 from cutplace import errors
@@ -42,6 +46,18 @@ from cutplace import _tools
 _VALID_FIXED_ANY_LINE_DELIMITERS = ('\n', '\r', '\r\n')
 _VALID_FIXED_LINE_DELIMITERS = data.LINE_DELIMITER_TO_TEXT_MAP.keys()
 
+# Approximate number of characters `fixed_rows()` reads at once.
+_FIXED_READ_BLOCK_SIZE = 64 * 1024
+
+#: Default size in bytes of the chunks computed by `delimited_chunks()` and `fixed_chunks()`.
+DEFAULT_CHUNK_SIZE = 16 * 1024 * 1024
+
+#: Default number of rows :py:meth:`AbstractRowWriter.write_rows` formats and writes at once.
+DEFAULT_WRITE_BUFFER_SIZE = 1000
+
+# Number of bytes `delimited_chunks()` reads at once to find record boundaries.
+_CHUNK_SCAN_BLOCK_SIZE = 1024 * 1024
+
 # Namespaces used by OpenOffice.org documents.
 _OOO_NAMESPACES = {
     'chart': 'urn:oasis:names:tc:opendocument:xmlns:chart:1.0',
@@ -74,18 +90,40 @@ _OOO_NAMESPACES = {
     'xsi': 'http://www.w3.org/2001/XMLSchema-instance',
 }
 _NUMBER_COLUMNS_REPEATED = '{' + _OOO_NAMESPACES['table'] + '}number-columns-repeated'
+_NUMBER_ROWS_REPEATED = '{' + _OOO_NAMESPACES['table'] + '}number-rows-repeated'
+_ODS_TABLE = '{' + _OOO_NAMESPACES['table'] + '}table'
+_ODS_TABLE_CELL = '{' + _OOO_NAMESPACES['table'] + '}table-cell'
+_ODS_TABLE_ROW = '{' + _OOO_NAMESPACES['table'] + '}table-row'
+_ODS_TEXT_P = '{' + _OOO_NAMESPACES['text'] + '}p'
+
+# Minimum number of repetitions for blank cells at the end of an ODS row or
+# blank rows at the end of an ODS sheet to be considered as filler up to
+# the end of the spreadsheet, which `ods_rows()` leaves out.
+_ODS_FILLER_REPEAT_COUNT = 256
+
+# Bytes each ZIP archive and consequently each XLSX document starts with.
+_ZIP_SIGNATURE = b'PK\x03\x04'
+
+# IDs of builtin Excel number formats for dates and times.
+_EXCEL_BUILTIN_DATE_FORMAT_IDS = frozenset(
+    list(range(14, 23)) + list(range(27, 37)) + list(range(45, 48)) + list(range(50, 59)))
 
-if six.PY2:
-    # HACK: Prepare ``ElementTree`` for namespaced find operations.
-    # See also: <http://effbot.org/zone/element-namespaces.htm>.
-    try:
-        register_namespace = ElementTree.register_namespace
-    except AttributeError:
-        def register_namespace(prefix, uri):
-            ElementTree._namespace_map[uri] = prefix
 
-    for short_name, url in _OOO_NAMESPACES.items():
-        register_namespace(short_name, url)
+def _excel_date_text(value, datemode):
+    """
+    Text for the Excel date ``value`` using the format "YYYY-MM-DD hh:mm:ss"
+    or "hh:mm:ss" if ``value`` is only a time.
+    """
+    import xlrd
+
+    cell_tuple = xlrd.xldate_as_tuple(value, datemode)
+    assert len(cell_tuple) == 6, "cell_tuple=%r" % cell_tuple
+    if cell_tuple[:3] == (0, 0, 0):
+        time_tuple = cell_tuple[3:]
+        result = six.text_type(datetime.time(*time_tuple))
+    else:
+        result = six.text_type(datetime.datetime(*cell_tuple))
+    return result
 
 
 def _excel_cell_value(cell, datemode):
@@ -106,16 +144,12 @@ def _excel_cell_value(cell, datemode):
     :param str datemode: the datemode from the workbook the cell was read \
       from; refer to the :py:mod:`xlrd` documentation for more details
     """
+    import xlrd
+
     assert cell is not None
 
     if cell.ctype == xlrd.XL_CELL_DATE:
-        cell_tuple = xlrd.xldate_as_tuple(cell.value, datemode)
-        assert len(cell_tuple) == 6, "cell_tuple=%r" % cell_tuple
-        if cell_tuple[:3] == (0, 0, 0):
-            time_tuple = cell_tuple[3:]
-            result = six.text_type(datetime.time(*time_tuple))
-        else:
-            result = six.text_type(datetime.datetime(*cell_tuple))
+        result = _excel_date_text(cell.value, datemode)
     elif cell.ctype == xlrd.XL_CELL_ERROR:
         default_error_text = xlrd.error_text_from_code[0x2a]  # same as "#N/A!"
         error_code = cell.value
@@ -133,7 +167,8 @@ def _excel_cell_value(cell, datemode):
 def excel_rows(source_path, sheet=1):
     """
     Rows read from an Excel document (both :file:`*.xls` and :file:`*.xlsx`
-    thanks to :py:mod:`xlrd`).
+    thanks to :py:mod:`xlrd`). Documents in the XLSX format are read using
+    :py:func:`xlsx_rows`.
 
     :param str source_path: path to the Excel file to be read
     :param int sheet: the sheet in the file to be read
@@ -141,25 +176,333 @@ def excel_rows(source_path, sheet=1):
       Excel file
     :raises cutplace.errors.DataFormatError: in case the file cannot be read
     """
+    import xlrd
+
+    assert source_path is not None
+    assert sheet >= 1, 'sheet=%r' % sheet
+
+    with io.open(source_path, 'rb') as excel_file:
+        # NOTE: zipfile.is_zipfile() cannot be used because *.xls files can contain embedded ZIP archives.
+        is_xlsx = excel_file.read(len(_ZIP_SIGNATURE)) == _ZIP_SIGNATURE
+    if is_xlsx:
+        for row in xlsx_rows(source_path, sheet):
+            yield row
+    else:
+        location = errors.Location(source_path, has_cell=True)
+        # Keep track of the current cell using integers and only point the location to it in case of errors.
+        y = 0
+        x = 0
+        try:
+            with xlrd.open_workbook(source_path) as book:
+                if sheet > book.nsheets:
+                    raise errors.DataFormatError(
+                        'Excel must contain at least %d sheet(s) instead of just %d' % (sheet, book.nsheets),
+                        location)
+                sheet = book.sheet_by_index(sheet - 1)
+                datemode = book.datemode
+                for y in range(sheet.nrows):
+                    row = []
+                    for x in range(sheet.ncols):
+                        row.append(_excel_cell_value(sheet.cell(y, x), datemode))
+                    yield row
+        except xlrd.XLRDError as error:
+            raise errors.DataFormatError('cannot read Excel file: %s' % error, location.copy_at(y, cell=x))
+        except UnicodeError as error:
+            raise errors.DataFormatError('cannot decode Excel data: %s' % error, location.copy_at(y, cell=x))
+
+
+def _xml_local_name(tag_or_attribute_name):
+    """
+    ``tag_or_attribute_name`` without XML namespace.
+    """
+    return tag_or_attribute_name.rsplit('}', 1)[-1]
+
+
+def _xlsx_column_index(cell_reference):
+    """
+    The 0 based index of the column in Excel ``cell_reference``, for example
+    27 for "AB12".
+    """
+    result = 0
+    for character in cell_reference:
+        if 'A' <= character <= 'Z':
+            result = 26 * result + ord(character) - ord('A') + 1
+        else:
+            break
+    return result - 1
+
+
+def _is_excel_date_format(format_code):
+    """
+    ``True`` if Excel number format ``format_code`` represents a date or
+    time.
+    """
+    # Remove quoted text, escaped characters, padding and sections in brackets such as colors except for elapsed
+    # times like "[h]".
+    relevant_format_code = re.sub(r'"[^"]*"|\\.|_.|\*.', '', format_code)
+    relevant_format_code = re.sub(r'\[(?![hms]+\])[^\]]*\]', '', relevant_format_code, flags=re.IGNORECASE)
+    relevant_format_code = relevant_format_code.lower()
+    return (relevant_format_code != 'general') and any(
+        date_character in relevant_format_code for date_character in 'dmyhs')
+
+
+def _xlsx_relationship_targets(zip_archive, relationships_path):
+    """
+    Map of relationship IDs to tuples ``(type, target_path)`` for the
+    relationships at ``relationships_path`` in ``zip_archive``.
+    """
+    from xml.etree import ElementTree
+
+    result = {}
+    if relationships_path in zip_archive.namelist():
+        # Relationships are stored in the "_rels" folder of the folder containing the related part.
+        base_folder = posixpath.dirname(posixpath.dirname(relationships_path))
+        with closing(zip_archive.open(relationships_path)) as relationships_stream:
+            relationships_root = ElementTree.parse(relationships_stream).getroot()
+        for relationship in relationships_root:
+            target = relationship.get('Target', '')
+            if target.startswith('/'):
+                target_path = target.lstrip('/')
+            else:
+                target_path = posixpath.normpath(posixpath.join(base_folder, target))
+            relationship_type = relationship.get('Type', '').rsplit('/', 1)[-1]
+            result[relationship.get('Id')] = (relationship_type, target_path)
+    return result
+
+
+def _xlsx_shared_strings(zip_archive, shared_strings_path):
+    """
+    List of texts in the shared strings table at ``shared_strings_path``.
+    """
+    result = []
+    if shared_strings_path in zip_archive.namelist():
+        with closing(zip_archive.open(shared_strings_path)) as shared_strings_stream:
+            location = errors.Location(shared_strings_path)
+            for event, element in _iterparse_events(shared_strings_stream, 'cannot parse shared strings', location):
+                if (event == 'end') and (_xml_local_name(element.tag) == 'si'):
+                    text_parts = []
+                    for text_or_run in element:
+                        text_or_run_name = _xml_local_name(text_or_run.tag)
+                        if text_or_run_name == 't':
+                            text_parts.append(text_or_run.text or '')
+                        elif text_or_run_name == 'r':
+                            for text_in_run in text_or_run:
+                                if _xml_local_name(text_in_run.tag) == 't':
+                                    text_parts.append(text_in_run.text or '')
+                    result.append(''.join(text_parts))
+                    element.clear()
+    return result
+
+
+def _xlsx_date_style_indices(zip_archive, styles_path):
+    """
+    Set of indices of cell styles at ``styles_path`` that represent a date
+    or time.
+    """
+    from xml.etree import ElementTree
+
+    result = set()
+    if styles_path in zip_archive.namelist():
+        with closing(zip_archive.open(styles_path)) as styles_stream:
+            styles_root = ElementTree.parse(styles_stream).getroot()
+        number_format_id_to_code_map = {}
+        cell_formats = []
+        for element in styles_root:
+            element_name = _xml_local_name(element.tag)
+            if element_name == 'numFmts':
+                for number_format in element:
+                    number_format_id_to_code_map[int(number_format.get('numFmtId'))] = number_format.get('formatCode')
+            elif element_name == 'cellXfs':
+                cell_formats = list(element)
+        for style_index, cell_format in enumerate(cell_formats):
+            number_format_id = int(cell_format.get('numFmtId', '0'))
+            number_format_code = number_format_id_to_code_map.get(number_format_id)
+            if number_format_code is None:
+                is_date = number_format_id in _EXCEL_BUILTIN_DATE_FORMAT_IDS
+            else:
+                is_date = _is_excel_date_format(number_format_code)
+            if is_date:
+                result.add(style_index)
+    return result
+
+
+def _xlsx_cell_value(cell, shared_strings, date_style_indices, datemode, location, line, cell_index):
+    """
+    The value of XLSX ``cell`` element with the same semantics as
+    :py:func:`_excel_cell_value`.
+
+    :raises cutplace.errors.DataFormatError: if the value of ``cell`` is \
+      broken, reported at ``line`` and ``cell_index`` of ``location``
+    """
+    cell_type = cell.get('t', 'n')
+    value_text = None
+    inline_string = None
+    for cell_child in cell:
+        cell_child_name = _xml_local_name(cell_child.tag)
+        if cell_child_name == 'v':
+            value_text = cell_child.text
+        elif cell_child_name == 'is':
+            inline_string = ''.join(
+                text.text or '' for text in cell_child.iter() if _xml_local_name(text.tag) == 't')
+    if cell_type == 's':
+        try:
+            result = shared_strings[int(value_text)]
+        except (IndexError, TypeError, ValueError):
+            raise errors.DataFormatError(
+                'index of shared string must be a number between 0 and %d but is: %s'
+                % (len(shared_strings) - 1, _compat.text_repr(value_text)),
+                location.copy_at(line, cell=cell_index))
+    elif cell_type == 'inlineStr':
+        result = inline_string if inline_string is not None else ''
+    elif value_text is None:
+        result = ''
+    elif cell_type == 'b':
+        result = '1' if value_text.strip() in ('1', 'true') else '0'
+    elif cell_type in ('e', 'str', 'd'):
+        result = value_text
+    else:
+        try:
+            value = float(value_text)
+        except ValueError:
+            raise errors.DataFormatError(
+                'value of numeric cell must be a number but is: %s' % _compat.text_repr(value_text),
+                location.copy_at(line, cell=cell_index))
+        style_text = cell.get('s', '0')
+        try:
+            style_index = int(style_text)
+        except ValueError:
+            raise errors.DataFormatError(
+                'style of cell must be a number but is: %s' % _compat.text_repr(style_text),
+                location.copy_at(line, cell=cell_index))
+        if style_index in date_style_indices:
+            result = _excel_date_text(value, datemode)
+        else:
+            result = six.text_type(value)
+            if result.endswith('.0'):
+                result = result[:-2]
+    if six.PY2 and isinstance(result, six.binary_type):
+        result = six.text_type(result, 'utf-8')
+    return result
+
+
+def xlsx_rows(source_path, sheet=1):
+    """
+    Rows read from the XLSX document at ``source_path`` in ``sheet``.
+
+    Unlike :py:func:`excel_rows` for :file:`*.xls`, the rows of the sheet
+    are parsed while they are read, so even large sheets need only little
+    memory. Cell values are converted the same way.
+
+    :param str source_path: path to the XLSX file to be read
+    :param int sheet: the sheet in the file to be read
+    :raises cutplace.errors.DataFormatError: in case the file cannot be read
+    """
+    import zipfile
+    from xml.etree import ElementTree
+
     assert source_path is not None
     assert sheet >= 1, 'sheet=%r' % sheet
 
     location = errors.Location(source_path, has_cell=True)
     try:
-        with xlrd.open_workbook(source_path) as book:
-            sheet = book.sheet_by_index(0)
-            datemode = book.datemode
-            for y in range(sheet.nrows):
-                row = []
-                for x in range(sheet.ncols):
-                    row.append(_excel_cell_value(sheet.cell(y, x), datemode))
-                    location.advance_cell()
-                yield row
-                location.advance_line()
-    except xlrd.XLRDError as error:
+        zip_archive = zipfile.ZipFile(source_path, 'r')
+    except zipfile.BadZipfile as error:
         raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
-    except UnicodeError as error:
-        raise errors.DataFormatError('cannot decode Excel data: %s' % error, location)
+    with closing(zip_archive):
+        try:
+            workbook_path = 'xl/workbook.xml'
+            for relationship_type, target_path in _xlsx_relationship_targets(zip_archive, '_rels/.rels').values():
+                if relationship_type == 'officeDocument':
+                    workbook_path = target_path
+            with closing(zip_archive.open(workbook_path)) as workbook_stream:
+                workbook_root = ElementTree.parse(workbook_stream).getroot()
+        except Exception as error:
+            raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
+        datemode = 0
+        sheet_relationship_ids = []
+        for element in workbook_root:
+            element_name = _xml_local_name(element.tag)
+            if element_name == 'workbookPr':
+                if element.get('date1904', 'false').lower() in ('1', 'true'):
+                    datemode = 1
+            elif element_name == 'sheets':
+                for sheet_element in element:
+                    for attribute_name, attribute_value in sheet_element.attrib.items():
+                        if attribute_name.startswith('{') and (_xml_local_name(attribute_name) == 'id'):
+                            sheet_relationship_ids.append(attribute_value)
+        if sheet > len(sheet_relationship_ids):
+            raise errors.DataFormatError(
+                'Excel must contain at least %d sheet(s) instead of just %d' % (sheet, len(sheet_relationship_ids)),
+                location)
+        workbook_folder, workbook_name = posixpath.split(workbook_path)
+        workbook_relationship_targets = _xlsx_relationship_targets(
+            zip_archive, posixpath.join(workbook_folder, '_rels', workbook_name + '.rels'))
+        shared_strings_path = posixpath.join(workbook_folder, 'sharedStrings.xml')
+        styles_path = posixpath.join(workbook_folder, 'styles.xml')
+        for relationship_type, target_path in workbook_relationship_targets.values():
+            if relationship_type == 'sharedStrings':
+                shared_strings_path = target_path
+            elif relationship_type == 'styles':
+                styles_path = target_path
+        try:
+            _, sheet_path = workbook_relationship_targets[sheet_relationship_ids[sheet - 1]]
+            shared_strings = _xlsx_shared_strings(zip_archive, shared_strings_path)
+            date_style_indices = _xlsx_date_style_indices(zip_archive, styles_path)
+            sheet_stream = zip_archive.open(sheet_path)
+        except errors.DataFormatError:
+            raise
+        except Exception as error:
+            raise errors.DataFormatError('cannot read Excel file: %s' % error, location)
+
+        with closing(sheet_stream):
+            column_count = 0
+            sheet_data = None
+            row_index = 0
+            for event, element in _iterparse_events(sheet_stream, 'cannot read Excel file', location):
+                element_name = _xml_local_name(element.tag)
+                if event == 'start':
+                    if element_name == 'dimension':
+                        last_cell_reference = element.get('ref', 'A1').split(':')[-1]
+                        column_count = _xlsx_column_index(last_cell_reference) + 1
+                    elif element_name == 'sheetData':
+                        sheet_data = element
+                elif element_name == 'row':
+                    # Yield empty rows for rows without cells.
+                    row_reference = element.get('r')
+                    if row_reference is None:
+                        row_index_to_read = row_index
+                    else:
+                        try:
+                            row_index_to_read = int(row_reference) - 1
+                        except ValueError:
+                            row_index_to_read = -1
+                        if row_index_to_read < 0:
+                            raise errors.DataFormatError(
+                                'reference of row must be a number greater than 0 but is: %s'
+                                % _compat.text_repr(row_reference), location.copy_at(row_index))
+                    while row_index < row_index_to_read:
+                        yield [''] * column_count
+                        row_index += 1
+                    row = []
+                    for cell in element:
+                        cell_reference = cell.get('r')
+                        if cell_reference is not None:
+                            column_index = _xlsx_column_index(cell_reference)
+                            if column_index < 0:
+                                raise errors.DataFormatError(
+                                    'reference of cell must start with a column such as A1 but is: %s'
+                                    % _compat.text_repr(cell_reference), location.copy_at(row_index, cell=len(row)))
+                            if column_index > len(row):
+                                row.extend([''] * (column_index - len(row)))
+                        row.append(_xlsx_cell_value(
+                            cell, shared_strings, date_style_indices, datemode, location, row_index, len(row)))
+                    if len(row) < column_count:
+                        row.extend([''] * (column_count - len(row)))
+                    yield row
+                    row_index += 1
+                    # Forget processed rows to save memory.
+                    if sheet_data is not None:
+                        sheet_data.remove(element)
 
 
 def _raise_delimited_data_format_error(delimited_path, reader, error):
@@ -222,101 +565,441 @@ def delimited_rows(delimited_source, data_format):
             delimited_stream.close()
 
 
-def _findall(element, xpath, namespaces):
-    if six.PY2:
-        resolved_xpath = xpath
-        for short_name, url in namespaces.items():
-            resolved_xpath = re.sub(r'\b' + short_name + ':', '{' + url + '}', resolved_xpath)
-        result = element.findall(resolved_xpath)
+def _is_ascii_compatible(encoding, characters):
+    """
+    ``True`` if each of ``characters`` is encoded in ``encoding`` as a
+    single byte with the same value as in ASCII.
+    """
+    assert encoding is not None
+    assert characters is not None
+    try:
+        return all(character.encode(encoding) == character.encode('ascii') for character in characters)
+    except UnicodeError:
+        return False
+
+
+def _delimited_quote_and_newline(data_format):
+    """
+    Tuple ``(quote, newline)`` with the encoded quote character and line
+    delimiter that can be used to find record boundaries in delimited data
+    by counting quotes or ``None`` if this is not possible with
+    ``data_format``.
+    """
+    quote_character = data_format.quote_character
+    is_splittable = (data_format.escape_character == quote_character) \
+        and _is_ascii_compatible(data_format.encoding, quote_character + '\r\n')
+    if is_splittable:
+        result = quote_character.encode('ascii'), b'\r' if data_format.line_delimiter == '\r' else b'\n'
     else:
-        result = element.findall(xpath, namespaces)
+        result = None
     return result
 
 
+def delimited_chunks(delimited_path, data_format, chunk_size=None):
+    """
+    List of tuples ``(start, end)`` describing byte ranges of about
+    ``chunk_size`` bytes in the file ``delimited_path`` where each range
+    starts and ends at a record boundary. Consequently each range can be
+    decoded and read with :py:func:`delimited_rows` independent of the
+    others, for example by a separate process.
+
+    Line delimiters within quoted items are no record boundaries. To detect
+    them the quote characters preceding a possible boundary are counted.
+    This only works if the data format uses a doubled quote character to
+    escape quotes and the encoding represents quote and line delimiters
+    using ASCII. Otherwise the result is a single range spanning the whole
+    file.
+
+    :param int chunk_size: the minimum number of bytes in each chunk except \
+      the last one; ``None`` means :py:const:`DEFAULT_CHUNK_SIZE`
+    """
+    assert delimited_path is not None
+    assert data_format is not None
+    assert data_format.format == data.FORMAT_DELIMITED
+    assert (chunk_size is None) or (chunk_size >= 1)
+
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    file_size = os.path.getsize(delimited_path)
+    quote_and_newline = _delimited_quote_and_newline(data_format)
+    if quote_and_newline is None:
+        return [(0, file_size)] if file_size > 0 else []
+
+    quote, newline = quote_and_newline
+    result = []
+    chunk_start = 0
+    next_split = chunk_size
+    is_quoted = False
+    block_offset = 0
+    with io.open(delimited_path, 'rb') as delimited_stream:
+        block = delimited_stream.read(_CHUNK_SCAN_BLOCK_SIZE)
+        while block:
+            block_length = len(block)
+            position = 0
+            while position < block_length:
+                # Note: a line delimiter just before ``next_split`` already ends the chunk.
+                if block_offset + position < next_split - 1:
+                    # Skip to the next possible split while keeping track of quotes.
+                    end_position = min(block_length, next_split - 1 - block_offset)
+                    if block.count(quote, position, end_position) % 2 == 1:
+                        is_quoted = not is_quoted
+                    position = end_position
+                else:
+                    # Find the next line delimiter outside of quotes.
+                    newline_position = block.find(newline, position)
+                    quote_position = block.find(quote, position)
+                    if (quote_position != -1) and ((newline_position == -1) or (quote_position < newline_position)):
+                        is_quoted = not is_quoted
+                        position = quote_position + 1
+                    elif newline_position != -1:
+                        position = newline_position + 1
+                        if not is_quoted:
+                            chunk_end = block_offset + position
+                            result.append((chunk_start, chunk_end))
+                            chunk_start = chunk_end
+                            next_split = chunk_end + chunk_size
+                    else:
+                        position = block_length
+            block_offset += block_length
+            block = delimited_stream.read(_CHUNK_SCAN_BLOCK_SIZE)
+    if chunk_start < block_offset:
+        result.append((chunk_start, block_offset))
+    return result
+
+
+def delimited_records_end(delimited_path, data_format, start=0):
+    """
+    Tuple ``(end, line_count)`` with the position in bytes after the last
+    line delimiter outside of quotes in the file ``delimited_path`` and the
+    number of line delimiters between ``start``, which must be a record
+    boundary, and ``end``. Consequently all records in this range are
+    complete even if the file is still being appended to, and can be read
+    using :py:func:`delimited_rows_in_range`.
+
+    Record boundaries are found the same way as with
+    :py:func:`delimited_chunks`. If the data format does not allow this or
+    there is no line delimiter outside of quotes after ``start``, the
+    result is ``(start, 0)``.
+    """
+    assert delimited_path is not None
+    assert data_format is not None
+    assert data_format.format == data.FORMAT_DELIMITED
+    assert start >= 0
+
+    end = start
+    line_count_before_end = 0
+    quote_and_newline = _delimited_quote_and_newline(data_format)
+    if quote_and_newline is not None:
+        quote, newline = quote_and_newline
+        line_count = 0
+        is_quoted = False
+        block_offset = start
+        with io.open(delimited_path, 'rb') as delimited_stream:
+            delimited_stream.seek(start)
+            block = delimited_stream.read(_CHUNK_SCAN_BLOCK_SIZE)
+            while block:
+                last_newline_position = block.rfind(newline)
+                if last_newline_position == -1:
+                    is_quoted ^= (block.count(quote) % 2 == 1)
+                else:
+                    is_quoted_at_block_start = is_quoted
+                    is_quoted ^= (block.count(quote, 0, last_newline_position) % 2 == 1)
+                    if not is_quoted:
+                        end = block_offset + last_newline_position + 1
+                        line_count_before_end = line_count + block.count(newline)
+                    else:
+                        # Check each line delimiter to find the last one outside of quotes.
+                        is_quoted_at_position = is_quoted_at_block_start
+                        position = 0
+                        newline_position = block.find(newline)
+                        while newline_position < last_newline_position:
+                            is_quoted_at_position ^= (block.count(quote, position, newline_position) % 2 == 1)
+                            position = newline_position + 1
+                            if not is_quoted_at_position:
+                                end = block_offset + position
+                                line_count_before_end = line_count + block.count(newline, 0, position)
+                            newline_position = block.find(newline, position)
+                    line_count += block.count(newline)
+                    is_quoted ^= (block.count(quote, last_newline_position) % 2 == 1)
+                block_offset += len(block)
+                block = delimited_stream.read(_CHUNK_SCAN_BLOCK_SIZE)
+    return end, line_count_before_end
+
+
+class _ByteRangeStream(io.RawIOBase):
+    """
+    Raw stream reading the bytes of the binary file ``source_file`` from
+    ``start`` up to ``end``, or until the end of the file if ``end`` is
+    ``None``. Closing the stream does not close ``source_file``.
+    """
+    def __init__(self, source_file, start, end):
+        assert source_file is not None
+        assert start >= 0
+        assert (end is None) or (end >= start)
+
+        super(_ByteRangeStream, self).__init__()
+        source_file.seek(start)
+        self._source_file = source_file
+        self._remaining_size = end - start if end is not None else None
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size_to_read = len(buffer)
+        if self._remaining_size is not None:
+            size_to_read = min(size_to_read, self._remaining_size)
+        data_read = self._source_file.read(size_to_read) if size_to_read > 0 else b''
+        data_read_size = len(data_read)
+        buffer[:data_read_size] = data_read
+        if self._remaining_size is not None:
+            self._remaining_size -= data_read_size
+        return data_read_size
+
+
+def delimited_rows_in_range(delimited_path, data_format, start=0, end=None, line_count_before_start=0):
+    """
+    Same as :py:func:`delimited_rows` but only reading the bytes from
+    ``start`` up to ``end`` of the file ``delimited_path``, or until the end
+    of the file if ``end`` is ``None``. Both have to be record boundaries as
+    computed for example by :py:func:`delimited_records_end`.
+
+    The data are read while the rows are produced, so even large ranges
+    take only little memory. Errors refer to the line in the whole file
+    using ``line_count_before_start``, the number of line delimiters before
+    ``start``.
+
+    :raises cutplace.errors.DataFormatError: if the data in the range are \
+      not valid delimited data
+    """
+    assert delimited_path is not None
+    assert data_format is not None
+    assert data_format.format == data.FORMAT_DELIMITED
+    assert start >= 0
+    assert (end is None) or (end >= start)
+    assert line_count_before_start >= 0
+
+    with io.open(delimited_path, 'rb') as delimited_file:
+        range_stream = io.BufferedReader(_ByteRangeStream(delimited_file, start, end))
+        with io.TextIOWrapper(range_stream, encoding=data_format.encoding, newline='') as delimited_stream:
+            try:
+                for row in delimited_rows(delimited_stream, data_format):
+                    yield row
+            except errors.DataFormatError as error:
+                raise errors.DataFormatError(
+                    error.message,
+                    errors.Location(delimited_path).copy_at(line_count_before_start + error.location.line))
+
+
+def fixed_chunks(fixed_path, encoding, field_name_and_lengths, line_delimiter, chunk_size=None):
+    """
+    Same as :py:func:`delimited_chunks` but for fixed data, where each range
+    starts at a record boundary and consequently can be read with
+    :py:class:`MappedFixedRows` independent of the others.
+
+    This only works if all records have the same length in bytes, which
+    requires ``encoding`` to use a single byte for each character and
+    ``line_delimiter`` to be something else than ``'any'``. Otherwise the
+    result is a single range spanning the whole file.
+
+    :param int chunk_size: the minimum number of bytes in each chunk except \
+      the last one; ``None`` means :py:const:`DEFAULT_CHUNK_SIZE`
+    """
+    assert fixed_path is not None
+    assert encoding is not None
+    assert field_name_and_lengths
+    assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS, \
+        'line_delimiter=%s but must be one of: %s' % (_compat.text_repr(line_delimiter), _VALID_FIXED_LINE_DELIMITERS)
+    assert (chunk_size is None) or (chunk_size >= 1)
+
+    if chunk_size is None:
+        chunk_size = DEFAULT_CHUNK_SIZE
+
+    file_size = os.path.getsize(fixed_path)
+    if (line_delimiter == 'any') or not is_single_byte_encoding(encoding):
+        return [(0, file_size)] if file_size > 0 else []
+
+    record_length = sum(field_length for _, field_length in field_name_and_lengths)
+    if line_delimiter is not None:
+        record_length += len(line_delimiter.encode(encoding))
+    chunk_length = max(1, (chunk_size + record_length - 1) // record_length) * record_length
+    return [(chunk_start, min(chunk_start + chunk_length, file_size)) for chunk_start in range(0, file_size, chunk_length)]
+
+
 def ods_rows(source_ods_path, sheet=1):
     """
     Rows stored in ODS document ``source_ods_path`` in ``sheet``.
 
+    The document is parsed while the rows are read so even large documents
+    take only little memory. Repeated cells and rows are expanded, except
+    for runs of blank cells and rows at the end of a row or the sheet that
+    are repeated :py:data:`_ODS_FILLER_REPEAT_COUNT` times or more. Such runs
+    usually fill the rest of the spreadsheet and are left out.
+
     :raises cutplace.errors.DataFormarError: if ``source_ods_path`` is not \
       a valid ODS file.
     """
+    import zipfile
+
+    assert source_ods_path is not None
     assert sheet >= 1
 
-    def ods_content_root():
-        """
-        `ElementTree` for content.xml in `source_ods_path`.
-        """
-        assert source_ods_path is not None
+    location = errors.Location(source_ods_path)
+    try:
+        zip_archive = zipfile.ZipFile(source_ods_path, "r")
+    except Exception as error:
+        raise errors.DataFormatError('cannot uncompress ODS spreadsheet: %s' % error, location)
+    # HACK: Use ``closing()`` because of Python 2.6.
+    with closing(zip_archive):
+        try:
+            content_stream = zip_archive.open("content.xml")
+        except Exception as error:
+            raise errors.DataFormatError('cannot extract content.xml for ODS spreadsheet: %s' % error, location)
+        with closing(content_stream):
+            for row in _ods_content_rows(content_stream, source_ods_path, sheet):
+                yield row
+
 
-        location = errors.Location(source_ods_path)
+def _iterparse_events(xml_stream, error_message, location):
+    """
+    Same as ``ElementTree.iterparse()`` for ``start`` and ``end`` events but
+    with parser errors turned into a
+    :py:exc:`cutplace.errors.DataFormatError` using ``error_message``.
+    """
+    from xml.etree import ElementTree
+
+    events = ElementTree.iterparse(xml_stream, events=('start', 'end'))
+    while True:
         try:
-            # HACK: Use ``closing()`` because of Python 2.6.
-            with closing(zipfile.ZipFile(source_ods_path, "r")) as zip_archive:
-                try:
-                    xml_data = zip_archive.read("content.xml")
-                except Exception as error:
-                    raise errors.DataFormatError('cannot extract content.xml for ODS spreadsheet: %s' % error, location)
-        except errors.DataFormatError:
-            raise
+            event_and_element = next(events)
+        except StopIteration:
+            break
         except Exception as error:
-            raise errors.DataFormatError('cannot uncompress ODS spreadsheet: %s' % error, location)
+            raise errors.DataFormatError('%s: %s' % (error_message, error), location)
+        yield event_and_element
 
-        with io.BytesIO(xml_data) as xml_stream:
-            try:
-                tree = ElementTree.parse(xml_stream)
-            except Exception as error:
-                raise errors.DataFormatError('cannot parse content.xml: %s' % error, location)
 
-        return tree.getroot()
+def _ods_repeated_count(element, repeated_attribute, location, cell=0):
+    """
+    Value of ``repeated_attribute`` of ``element``, reporting errors at
+    ``cell`` in the line of ``location``.
+    """
+    repeated_text = element.attrib.get(repeated_attribute)
+    if repeated_text is None:
+        result = 1
+    else:
+        _, attribute_name = repeated_attribute.split('}')
+        try:
+            result = int(repeated_text)
+        except ValueError:
+            raise errors.DataFormatError(
+                'table:%s is %s but must be an integer' % (attribute_name, _compat.text_repr(repeated_text)),
+                location.copy_at(location.line, cell=cell))
+        if result < 1:
+            raise errors.DataFormatError(
+                'table:%s is %s but must be at least 1' % (attribute_name, _compat.text_repr(repeated_text)),
+                location.copy_at(location.line, cell=cell))
+    return result
+
 
-    content_root = ods_content_root()
-    table_elements = list(
-        _findall(content_root, 'office:body/office:spreadsheet/table:table', namespaces=_OOO_NAMESPACES))
-    table_count = len(table_elements)
-    if table_count < sheet:
-        error_message = 'ODS must contain at least %d sheet(s) instead of just %d' % (sheet, table_count)
-        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
-    table_element = table_elements[sheet - 1]
+def _ods_row(table_row, location):
+    """
+    Cell values in ODS ``table_row`` element; ``location`` points to the
+    row and is only used to report errors.
+    """
+    result = []
+    blank_cell_count = 0
+    cell = 0
+    for table_cell in table_row.iterfind(_ODS_TABLE_CELL):
+        repeated_count = _ods_repeated_count(table_cell, _NUMBER_COLUMNS_REPEATED, location, cell)
+        text_p = table_cell.find(_ODS_TEXT_P)
+        if text_p is None:
+            # Remember blank cells for now so huge runs of them at the end of the row never need to be expanded.
+            blank_cell_count += repeated_count
+            last_blank_repeated_count = repeated_count
+        else:
+            cell_value = text_p.text
+            if six.PY2:
+                # HACK: It seems that under Python 2 ElementTree.find() returns a unicode string only of the value
+                # actually contains non ASCII characters, and otherwise a binary string. To work around this we
+                # check the result for binary strings and possibly convert them to uncicode strings assuming UTF-8
+                # to be the internal encoding for the XML file. Ideally we would parse the XML header for the
+                # encoding. Considering that Python 2 is on the way out, this just doesn't seem to be worth the
+                # trouble right now.
+                if isinstance(cell_value, six.binary_type):
+                    cell_value = six.text_type(cell_value, 'utf-8')
+                else:
+                    assert cell_value is None or isinstance(cell_value, six.text_type), 'cell_value=%r' % cell_value
+            if blank_cell_count > 0:
+                result.extend([''] * blank_cell_count)
+                blank_cell_count = 0
+            result.extend([cell_value] * repeated_count)
+        cell += repeated_count
+    if blank_cell_count > 0:
+        if last_blank_repeated_count >= _ODS_FILLER_REPEAT_COUNT:
+            blank_cell_count -= last_blank_repeated_count
+        result.extend([''] * blank_cell_count)
+    return result
+
+
+def _ods_content_rows(content_stream, source_ods_path, sheet):
+    """
+    Rows in ``sheet`` of the ODS ``content.xml`` provided by
+    ``content_stream``.
+    """
     location = errors.Location(source_ods_path, has_cell=True, has_sheet=True)
     for _ in range(sheet - 1):
         location.advance_sheet()
-    for table_row in _findall(table_element, 'table:table-row', namespaces=_OOO_NAMESPACES):
-        row = []
-        for table_cell in _findall(table_row, 'table:table-cell', namespaces=_OOO_NAMESPACES):
-            repeated_text = table_cell.attrib.get(_NUMBER_COLUMNS_REPEATED, '1')
-            try:
-                repeated_count = int(repeated_text)
-                if repeated_count < 1:
-                    raise errors.DataFormatError(
-                        'table:number-columns-repeated is %s but must be at least 1'
-                        % _compat.text_repr(repeated_text), location)
-            except ValueError:
-                raise errors.DataFormatError(
-                    'table:number-columns-repeated is %s but must be an integer' % _compat.text_repr(repeated_text),
-                    location)
-            if six.PY2:
-                text_p = table_cell.find('{%s}p' % _OOO_NAMESPACES['text'])
-            else:
-                text_p = table_cell.find('text:p', namespaces=_OOO_NAMESPACES)
-            if text_p is None:
-                cell_value = ''
-            else:
-                cell_value = text_p.text
-                if six.PY2:
-                    # HACK: It seems that under Python 2 ElementTree.find() returns a unicode string only of the value
-                    # actually contains non ASCII characters, and otherwise a binary string. To work around this we
-                    # check the result for binary strings and possibly convert them to uncicode strings assuming UTF-8
-                    # to be the internal encoding for the XML file. Ideally we would parse the XML header for the
-                    # encoding. Considering that Python 2 is on the way out, this just doesn't seem to be worth the
-                    # trouble right now.
-                    if isinstance(cell_value, six.binary_type):
-                        cell_value = six.text_type(cell_value, 'utf-8')
+    table_count = 0
+    target_table = None
+    # Stack of elements enclosing the current one.
+    parents = []
+    # List of tuples (blank_row, repeated_count) not yielded yet.
+    blank_rows_and_repeated_counts = []
+    for event, element in _iterparse_events(
+            content_stream, 'cannot parse content.xml', errors.Location(source_ods_path)):
+        if event == 'start':
+            if element.tag == _ODS_TABLE:
+                table_count += 1
+                if table_count == sheet:
+                    target_table = element
+            parents.append(element)
+        else:
+            parents.pop()
+            parent = parents[-1] if parents else None
+            if (parent is target_table) and (target_table is not None):
+                if element.tag == _ODS_TABLE_ROW:
+                    repeated_count = _ods_repeated_count(element, _NUMBER_ROWS_REPEATED, location)
+                    row = _ods_row(element, location)
+                    if all(cell_value == '' for cell_value in row):
+                        blank_rows_and_repeated_counts.append((row, repeated_count))
                     else:
-                        assert isinstance(cell_value, six.text_type), 'cell_value=%r' % cell_value
-            row.extend([cell_value] * repeated_count)
-            location.advance_cell(repeated_count)
-        yield row
-        location.advance_line()
+                        for blank_row, blank_repeated_count in blank_rows_and_repeated_counts:
+                            for _ in range(blank_repeated_count):
+                                yield list(blank_row)
+                                location.advance_line()
+                        blank_rows_and_repeated_counts = []
+                        for repeated_index in range(repeated_count):
+                            yield row if repeated_index == 0 else list(row)
+                            location.advance_line()
+                # Forget processed elements to save memory.
+                target_table.remove(element)
+            elif element is target_table:
+                for blank_row, blank_repeated_count in blank_rows_and_repeated_counts:
+                    if blank_repeated_count >= _ODS_FILLER_REPEAT_COUNT:
+                        # Skip rows filling the rest of the sheet.
+                        continue
+                    for _ in range(blank_repeated_count):
+                        yield list(blank_row)
+                        location.advance_line()
+                break
+            elif (parent is not None) and (parent.tag == _ODS_TABLE):
+                # Forget elements of tables that are not of interest.
+                parent.remove(element)
+    if table_count < sheet:
+        error_message = 'ODS must contain at least %d sheet(s) instead of just %d' % (sheet, table_count)
+        raise errors.DataFormatError(error_message, errors.Location(source_ods_path))
 
 
 def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='any'):
@@ -337,9 +1020,112 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
     assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS, \
         'line_delimiter=%s but must be one of: %s' % (_compat.text_repr(line_delimiter), _VALID_FIXED_LINE_DELIMITERS)
 
-    # Predefine variable for access in local function.
     location = errors.Location(fixed_source, has_column=True)
-    fixed_file = None
+    if isinstance(fixed_source, six.string_types):
+        # Read line delimiters as they are instead of translating them to '\n'.
+        fixed_file = io.open(fixed_source, 'r', encoding=encoding, newline='')
+        is_opened = True
+    else:
+        fixed_file = fixed_source
+        is_opened = False
+
+    try:
+        if (line_delimiter == 'any') or not field_name_and_lengths:
+            # With 'any', the length of a record is unknown until its line delimiter has been read.
+            fixed_rows_to_read = _fixed_rows_by_field(
+                fixed_file, is_opened, field_name_and_lengths, line_delimiter, location)
+        else:
+            fixed_rows_to_read = _fixed_rows_by_block(
+                fixed_file, is_opened, field_name_and_lengths, line_delimiter, location)
+        for row in fixed_rows_to_read:
+            yield row
+    finally:
+        if is_opened:
+            fixed_file.close()
+
+
+def _fixed_rows_by_block(fixed_file, is_opened, field_name_and_lengths, line_delimiter, location):
+    """
+    Same as :py:func:`_fixed_rows_by_field` but read many records at once and
+    slice the fields out of them, which is a lot faster. This works only if
+    ``line_delimiter`` is not ``'any'`` because every record must have the
+    same length. If the data do not end with a complete record or a line
+    delimiter is broken, fall back to :py:func:`_fixed_rows_by_field` to
+    report the error in detail.
+    """
+    assert line_delimiter != 'any'
+
+    line_delimiter_length = len(line_delimiter) if line_delimiter is not None else 0
+    record_length = 0
+    field_slices = []
+    for _, field_length in field_name_and_lengths:
+        field_slices.append(slice(record_length, record_length + field_length))
+        record_length += field_length
+    record_length += line_delimiter_length
+    if len(field_slices) == 1:
+        field_slice = field_slices[0]
+
+        def fields_of(record):
+            return [record[field_slice]]
+    else:
+        fields_getter = operator.itemgetter(*field_slices)
+
+        def fields_of(record):
+            return list(fields_getter(record))
+    block_length = max(1, _FIXED_READ_BLOCK_SIZE // record_length) * record_length
+
+    line = 0
+    is_broken = False
+    block = fixed_file.read(block_length)
+    while block and not is_broken:
+        if not is_opened:
+            # Ensure that the input is a text file, `io.StringIO` or something similar.
+            assert isinstance(block, six.text_type), \
+                '%s: fixed_source must yield strings but got type %s, value %r' \
+                % (location.copy_at(line), type(block), block)
+        block_length_read = len(block)
+        record_start = 0
+        while (record_start + record_length <= block_length_read) and not is_broken:
+            record_end = record_start + record_length
+            if (line_delimiter_length == 0) or (block[record_end - line_delimiter_length:record_end] == line_delimiter):
+                yield fields_of(block[record_start:record_end])
+                line += 1
+                record_start = record_end
+            else:
+                is_broken = True
+        if is_broken or (record_start < block_length_read):
+            # Read the rest of the current record including its line delimiter, if any, and let
+            # the detailed reader take care of it.
+            remaining_text = block[record_start:]
+            while len(remaining_text) < record_length:
+                # Read only up to the end of the current record even if the source returns less than requested.
+                text_read = fixed_file.read(record_length - len(remaining_text))
+                if not text_read:
+                    break
+                remaining_text += text_read
+            location.set_line(line)
+            for row in _fixed_rows_by_field(
+                    io.StringIO(remaining_text), True, field_name_and_lengths, line_delimiter, location):
+                yield row
+                line += 1
+            if not is_broken and (len(remaining_text) >= record_length):
+                # The source returned less than requested without being at its end.
+                block = fixed_file.read(block_length)
+            else:
+                block = ''
+        else:
+            block = fixed_file.read(block_length)
+
+
+def _fixed_rows_by_field(fixed_file, is_opened, field_name_and_lengths, line_delimiter, location):
+    """
+    Rows found in ``fixed_file`` reading each field and line delimiter
+    separately. The first row is in the line ``location`` points to.
+    """
+    # Keep track of the current position using integers and only create a location for it in case of errors.
+    line = location.line
+    column = 0
+
     # HACK: list with at most 1 character to be unread after a line feed. We
     # need to use a list so `_has_data_after_skipped_line_delimiter` can
     # modify its contents.
@@ -353,7 +1139,6 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
         In case `line_delimiter` is `None`, the result is always ``True`` even
         if the input has already reached its end.
         """
-        assert location is not None
         assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS
         assert unread_character_after_line_delimiter[0] is None
 
@@ -381,71 +1166,215 @@ def fixed_rows(fixed_source, encoding, field_name_and_lengths, line_delimiter='a
                     valid_line_delimiters = _tools.human_readable_list(_VALID_FIXED_ANY_LINE_DELIMITERS)
                     raise errors.DataFormatError(
                         'line delimiter is %s but must be one of: %s' %
-                        (_compat.text_repr(actual_line_delimiter), valid_line_delimiters), location)
+                        (_compat.text_repr(actual_line_delimiter), valid_line_delimiters),
+                        location.copy_at(line, column))
             elif actual_line_delimiter != line_delimiter:
                 raise errors.DataFormatError(
                     'line delimiter is %s but must be %s'
-                    % (_compat.text_repr(actual_line_delimiter), _compat.text_repr(line_delimiter)), location)
+                    % (_compat.text_repr(actual_line_delimiter), _compat.text_repr(line_delimiter)),
+                    location.copy_at(line, column))
         return result
 
-    if isinstance(fixed_source, six.string_types):
-        fixed_file = io.open(fixed_source, 'r', encoding=encoding)
-        is_opened = True
-    else:
-        fixed_file = fixed_source
-        is_opened = False
-
     has_data = True
-    try:
-        while has_data:
-            field_index = 0
-            row = []
-            for field_name, field_length in field_name_and_lengths:
-                if unread_character_after_line_delimiter[0] is None:
-                    item = fixed_file.read(field_length)
-                else:
-                    assert len(unread_character_after_line_delimiter) == 1
-                    item = unread_character_after_line_delimiter[0]
-                    if field_length >= 2:
-                        item += fixed_file.read(field_length - 1)
-                    unread_character_after_line_delimiter[0] = None
-                assert unread_character_after_line_delimiter[0] is None
-                if not is_opened:
-                    # Ensure that the input is a text file, `io.StringIO` or something similar. Binary files,
-                    # `io.BytesIO` and the like cannot be used because the return bytes instead of strings.
-                    # NOTE: We do not need to use _compat.text_repr(item) because type `unicode` does not fail here.
-                    assert isinstance(item, six.text_type), \
-                        '%s: fixed_source must yield strings but got type %s, value %r' % (location, type(item), item)
-                item_length = len(item)
-                if item_length == 0:
-                    if field_index > 0:
-                        names = [name for name, _ in field_name_and_lengths]
-                        lengths = [length for _, length in field_name_and_lengths]
-                        previous_field_index = field_index - 1
-                        characters_needed_count = sum(lengths[field_index:])
-                        list_of_missing_field_names = _tools.human_readable_list(names[field_index:], 'and')
-                        raise errors.DataFormatError(
-                            "after field '%s' %d characters must follow for: %s"
-                            % (names[previous_field_index], characters_needed_count, list_of_missing_field_names),
-                            location)
-                    # End of input reached.
-                    has_data = False
-                elif item_length == field_length:
-                    row.append(item)
-                    location.advance_column(field_length)
-                    field_index += 1
-                else:
+    while has_data:
+        field_index = 0
+        row = []
+        for field_name, field_length in field_name_and_lengths:
+            if unread_character_after_line_delimiter[0] is None:
+                item = fixed_file.read(field_length)
+            else:
+                assert len(unread_character_after_line_delimiter) == 1
+                item = unread_character_after_line_delimiter[0]
+                if field_length >= 2:
+                    item += fixed_file.read(field_length - 1)
+                unread_character_after_line_delimiter[0] = None
+            assert unread_character_after_line_delimiter[0] is None
+            if not is_opened:
+                # Ensure that the input is a text file, `io.StringIO` or something similar. Binary files,
+                # `io.BytesIO` and the like cannot be used because the return bytes instead of strings.
+                # NOTE: We do not need to use _compat.text_repr(item) because type `unicode` does not fail here.
+                assert isinstance(item, six.text_type), \
+                    '%s: fixed_source must yield strings but got type %s, value %r' \
+                    % (location.copy_at(line, column), type(item), item)
+            item_length = len(item)
+            if item_length == 0:
+                if field_index > 0:
+                    names = [name for name, _ in field_name_and_lengths]
+                    lengths = [length for _, length in field_name_and_lengths]
+                    previous_field_index = field_index - 1
+                    characters_needed_count = sum(lengths[field_index:])
+                    list_of_missing_field_names = _tools.human_readable_list(names[field_index:], 'and')
                     raise errors.DataFormatError(
-                        "cannot read field '%s': need %d characters but found only %d: %s"
-                        % (field_name, field_length, item_length, _compat.text_repr(item)), location)
-            if has_data and not _has_data_after_skipped_line_delimiter():
+                        "after field '%s' %d characters must follow for: %s"
+                        % (names[previous_field_index], characters_needed_count, list_of_missing_field_names),
+                        location.copy_at(line, column))
+                # End of input reached.
                 has_data = False
-            if len(row) > 0:
-                yield row
-                location.advance_line()
-    finally:
-        if is_opened:
-            fixed_file.close()
+            elif item_length == field_length:
+                row.append(item)
+                column += field_length
+                field_index += 1
+            else:
+                raise errors.DataFormatError(
+                    "cannot read field '%s': need %d characters but found only %d: %s"
+                    % (field_name, field_length, item_length, _compat.text_repr(item)),
+                    location.copy_at(line, column))
+        if has_data and not _has_data_after_skipped_line_delimiter():
+            has_data = False
+        if len(row) > 0:
+            yield row
+            line += 1
+            column = 0
+
+
+def is_single_byte_encoding(encoding):
+    """
+    ``True`` if ``encoding`` always uses exactly one byte per character, which
+    is required for :py:class:`MappedFixedRows`.
+    """
+    assert encoding is not None
+    try:
+        is_single_byte = len('A'.encode(encoding)) == 1
+    except UnicodeError:
+        is_single_byte = False
+    if is_single_byte:
+        # Look for byte sequences that multi byte encodings such as UTF-8 or
+        # Shift JIS decode to a single character.
+        possibly_multi_byte_sequences = b'\xc3\xa4\x81\x40\xe0\xa0\x80\xa4\xa1'
+        decoded_text = possibly_multi_byte_sequences.decode(encoding, 'replace')
+        is_single_byte = len(decoded_text) == len(possibly_multi_byte_sequences)
+    return is_single_byte
+
+
+class MappedFixedRows(object):
+    """
+    Rows of the fixed data file at ``fixed_path`` using random access.
+
+    Unlike :py:func:`fixed_rows`, which can only read the data from the
+    start, this maps the file into memory and computes the position of each
+    record from its index. Consequently this supports ``len()``, indexing
+    and slicing without reading the whole file, for example::
+
+        with MappedFixedRows(fixed_path, 'ascii', [('name', 4), ('size', 3)], '\\n') as mapped_rows:
+            last_row = mapped_rows[-1]
+
+    Records are only decoded when accessed. This requires all records to
+    have the same length in bytes, so ``encoding`` must use a single byte
+    for each character (see :py:func:`is_single_byte_encoding`) and
+    ``line_delimiter`` must not be ``'any'``.
+
+    The last record may lack the line delimiter. Broken records only raise
+    a :py:exc:`cutplace.errors.DataFormatError` once they are accessed.
+    """
+    def __init__(self, fixed_path, encoding, field_name_and_lengths, line_delimiter):
+        assert fixed_path is not None
+        assert encoding is not None
+        assert field_name_and_lengths
+        assert line_delimiter in _VALID_FIXED_LINE_DELIMITERS, \
+            'line_delimiter=%s but must be one of: %s' % (_compat.text_repr(line_delimiter), _VALID_FIXED_LINE_DELIMITERS)
+        assert line_delimiter != 'any'
+        assert is_single_byte_encoding(encoding), 'encoding=%r' % encoding
+
+        self._fixed_path = fixed_path
+        self._encoding = encoding
+        self._field_name_and_lengths = field_name_and_lengths
+        self._line_delimiter = line_delimiter
+        self._encoded_line_delimiter = line_delimiter.encode(encoding) if line_delimiter is not None else b''
+        self._location = errors.Location(fixed_path, has_column=True)
+        fields_length = 0
+        field_slices = []
+        for _, field_length in field_name_and_lengths:
+            field_slices.append(slice(fields_length, fields_length + field_length))
+            fields_length += field_length
+        self._field_slices = field_slices
+        self._record_length = fields_length + len(self._encoded_line_delimiter)
+
+        self._fixed_file = io.open(fixed_path, 'rb')
+        try:
+            self._data_size = os.fstat(self._fixed_file.fileno()).st_size
+            if self._data_size > 0:
+                self._mapped_data = mmap.mmap(self._fixed_file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                # Empty files cannot be mapped.
+                self._mapped_data = b''
+        except Exception:
+            self._fixed_file.close()
+            raise
+        self._row_count = (self._data_size + self._record_length - 1) // self._record_length
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __len__(self):
+        return self._row_count
+
+    def __iter__(self):
+        for row_index in range(self._row_count):
+            yield self._row_at(row_index)
+
+    def __getitem__(self, row_index_or_slice):
+        if isinstance(row_index_or_slice, slice):
+            result = [self._row_at(row_index) for row_index in range(*row_index_or_slice.indices(self._row_count))]
+        else:
+            row_index = row_index_or_slice
+            if row_index < 0:
+                row_index += self._row_count
+            if not 0 <= row_index < self._row_count:
+                raise IndexError('row index must be between 0 and %d but is: %d' % (self._row_count - 1, row_index))
+            result = self._row_at(row_index)
+        return result
+
+    @property
+    def fixed_path(self):
+        return self._fixed_path
+
+    @property
+    def data_size(self):
+        """
+        Number of bytes mapped, which can be less than the current size of
+        a file that is still being appended to.
+        """
+        return self._data_size
+
+    @property
+    def record_length(self):
+        """
+        Number of bytes in each record including the line delimiter.
+        """
+        return self._record_length
+
+    def _row_at(self, row_index):
+        assert 0 <= row_index < self._row_count
+
+        record_start = row_index * self._record_length
+        record = self._mapped_data[record_start:record_start + self._record_length]
+        record_text = record.decode(self._encoding)
+        line_delimiter_length = len(self._encoded_line_delimiter)
+        is_complete_record = (len(record) == self._record_length) \
+            and ((line_delimiter_length == 0) or record.endswith(self._encoded_line_delimiter))
+        if is_complete_record:
+            result = [record_text[field_slice] for field_slice in self._field_slices]
+        else:
+            # Let the field by field reader take care of the details.
+            self._location.set_line(row_index)
+            result = None
+            for row in _fixed_rows_by_field(
+                    io.StringIO(record_text), True, self._field_name_and_lengths, self._line_delimiter,
+                    self._location):
+                result = row
+            assert result is not None
+        return result
+
+    def close(self):
+        if self._fixed_file is not None:
+            if self._data_size > 0:
+                self._mapped_data.close()
+            self._mapped_data = None
+            self._fixed_file.close()
+            self._fixed_file = None
 
 
 def auto_rows(source):
@@ -487,13 +1416,20 @@ class AbstractRowWriter(object):
       :py:meth:`~.cutplace.rowio.AbstractRowWriter.close` or by using the \
       ``with`` statement
     :param cutplace.data.DataFormat: data format to use for writing
+    :param buffer_size: number of rows \
+      :py:meth:`~.cutplace.rowio.AbstractRowWriter.write_rows` collects \
+      and writes to ``target`` at once; ``None`` means \
+      :py:data:`DEFAULT_WRITE_BUFFER_SIZE`
+    :type buffer_size: int or None
     """
-    def __init__(self, target, data_format):
+    def __init__(self, target, data_format, buffer_size=None):
         assert target is not None
         assert data_format is not None
         assert data_format.is_valid
+        assert (buffer_size is None) or (buffer_size >= 1), 'buffer_size=%r' % buffer_size
 
         self._data_format = data_format
+        self._buffer_size = buffer_size if buffer_size is not None else DEFAULT_WRITE_BUFFER_SIZE
         self._has_opened_target_stream = False
         if isinstance(target, six.string_types):
             self._target_path = target
@@ -528,6 +1464,14 @@ class AbstractRowWriter(object):
         """
         return self._location
 
+    @property
+    def buffer_size(self):
+        """
+        Number of rows :py:meth:`~.cutplace.rowio.AbstractRowWriter.write_rows`
+        collects and writes at once.
+        """
+        return self._buffer_size
+
     @property
     def target_path(self):
         return self._target_path
@@ -540,12 +1484,51 @@ class AbstractRowWriter(object):
         raise NotImplementedError
 
     def write_rows(self, rows_to_write):
+        """
+        Write all rows in ``rows_to_write``, which has the same result as
+        calling :py:meth:`~.cutplace.rowio.AbstractRowWriter.write_row` for
+        each of them. Rows are collected in blocks of
+        :py:attr:`~.cutplace.rowio.AbstractRowWriter.buffer_size` rows,
+        which are passed to :py:meth:`~.write_block`.
+        """
         assert self.target_stream is not None
         assert rows_to_write is not None
 
+        rows_to_write = iter(rows_to_write)
+        while True:
+            block = list(itertools.islice(rows_to_write, self.buffer_size))
+            if not block:
+                break
+            self.write_block(block)
+
+    def write_block(self, rows_to_write):
+        """
+        Write the list ``rows_to_write``. Descendants can override this to
+        format all rows at once and write them to the target using a single
+        write.
+        """
+        assert rows_to_write is not None
+
         for row_to_write in rows_to_write:
             self.write_row(row_to_write)
 
+    def _write_block_text(self, block_text, rows_to_write):
+        """
+        Write ``block_text``, which is ``rows_to_write`` already formatted,
+        to the target and advance :py:attr:`~.location` accordingly.
+
+        If the text cannot be encoded, nothing has been written yet so the
+        rows are written one by one to report the exact row that is broken.
+        """
+        try:
+            self._target_stream.write(block_text)
+        except UnicodeEncodeError:
+            for row_to_write in rows_to_write:
+                self.write_row(row_to_write)
+        else:
+            if rows_to_write:
+                self._location.advance_line(len(rows_to_write))
+
     def close(self):
         if self._has_opened_target_stream:
             self._target_stream.close()
@@ -555,15 +1538,17 @@ class AbstractRowWriter(object):
 
 
 class DelimitedRowWriter(AbstractRowWriter):
-    def __init__(self, target, data_format):
+    def __init__(self, target, data_format, buffer_size=None):
         assert target is not None
         assert data_format is not None
         assert data_format.format == data.FORMAT_DELIMITED
         assert data_format.is_valid
 
-        super(DelimitedRowWriter, self).__init__(target, data_format)
+        super(DelimitedRowWriter, self).__init__(target, data_format, buffer_size)
         keywords = _as_delimited_keywords(data_format)
         self._delimited_writer = _compat.csv_writer(self._target_stream, **keywords)
+        self._block_buffer = io.StringIO()
+        self._block_writer = _compat.csv_writer(self._block_buffer, **keywords)
 
     def write_row(self, row_to_write):
         try:
@@ -572,9 +1557,23 @@ class DelimitedRowWriter(AbstractRowWriter):
             raise errors.DataFormatError('cannot write data row: %s; row=%s' % (error, row_to_write), self.location)
         self._location.advance_line()
 
+    def write_block(self, rows_to_write):
+        """
+        Same as :py:meth:`~.cutplace.rowio.AbstractRowWriter.write_block`
+        but formats all rows in memory using :py:meth:`csv.writer.writerows`
+        and writes them to the target at once.
+        """
+        assert rows_to_write is not None
+
+        block_buffer = self._block_buffer
+        block_buffer.seek(0)
+        block_buffer.truncate(0)
+        self._block_writer.writerows(rows_to_write)
+        self._write_block_text(block_buffer.getvalue(), rows_to_write)
+
 
 class FixedRowWriter(AbstractRowWriter):
-    def __init__(self, target, data_format, field_names_and_lengths):
+    def __init__(self, target, data_format, field_names_and_lengths, buffer_size=None):
         assert target is not None
         assert data_format is not None
         assert data_format.format == data.FORMAT_FIXED
@@ -585,7 +1584,7 @@ class FixedRowWriter(AbstractRowWriter):
             assert field_length is not None
             assert field_length >= 1, 'field_length=%r' % field_length
 
-        super(FixedRowWriter, self).__init__(target, data_format)
+        super(FixedRowWriter, self).__init__(target, data_format, buffer_size)
         self._field_names_and_lengths = field_names_and_lengths
         self._expected_row_item_count = len(self._field_names_and_lengths)
         if self.data_format.line_delimiter == 'any':
@@ -595,6 +1594,10 @@ class FixedRowWriter(AbstractRowWriter):
                 self._line_separator = os.linesep
         else:
             self._line_separator = self.data_format.line_delimiter
+        # Format string to turn a row into a line of text including the line separator.
+        self._row_format = '%s' * self._expected_row_item_count
+        if self._line_separator is not None:
+            self._row_format += self._line_separator.replace('%', '%%')
 
     def write_row(self, row_to_write):
         """
@@ -614,18 +1617,16 @@ class FixedRowWriter(AbstractRowWriter):
             % (self.location, self._expected_row_item_count, row_to_write_item_count, row_to_write)
         if __debug__:
             for field_index, field_value in enumerate(row_to_write):
-                self.location.set_cell(field_index)
                 field_name, expected_field_length = self._field_names_and_lengths[field_index]
                 assert isinstance(field_value, six.text_type), \
                     '%s: field %s must be of type %s instead of %s: %r' \
-                    % (self.location, _compat.text_repr(field_name), six.text_type.__name__, type(field_value).__name__,
-                       field_value)
+                    % (self.location.copy_at(self.location.line, cell=field_index), _compat.text_repr(field_name),
+                       six.text_type.__name__, type(field_value).__name__, field_value)
                 actual_field_length = len(field_value)
                 assert actual_field_length == expected_field_length, \
                     '%s: field %s must have exactly %d characters instead of %d: %r' \
-                    % (self.location, _compat.text_repr(field_name), expected_field_length, actual_field_length,
-                       field_value)
-            self.location.set_cell(0)
+                    % (self.location.copy_at(self.location.line, cell=field_index), _compat.text_repr(field_name),
+                       expected_field_length, actual_field_length, field_value)
 
         try:
             self._target_stream.write(''.join(row_to_write))
@@ -637,6 +1638,31 @@ class FixedRowWriter(AbstractRowWriter):
             self._target_stream.write(self._line_separator)
         self.location.advance_line()
 
+    def write_block(self, rows_to_write):
+        """
+        Same as :py:meth:`~.cutplace.rowio.AbstractRowWriter.write_block`
+        but formats all rows in memory using a format string prepared in
+        advance and writes them to the target at once.
+        """
+        assert rows_to_write is not None
+        if __debug__:
+            for row_index, row_to_write in enumerate(rows_to_write):
+                assert len(row_to_write) == self._expected_row_item_count, \
+                    '%s: row must have %d items instead of %d: %s' \
+                    % (self.location.copy_at(self.location.line + row_index), self._expected_row_item_count,
+                       len(row_to_write), row_to_write)
+                for field_index, field_value in enumerate(row_to_write):
+                    field_name, expected_field_length = self._field_names_and_lengths[field_index]
+                    assert isinstance(field_value, six.text_type) and (len(field_value) == expected_field_length), \
+                        '%s: field %s must be a %s with exactly %d characters: %r' \
+                        % (self.location.copy_at(self.location.line + row_index, cell=field_index),
+                           _compat.text_repr(field_name), six.text_type.__name__, expected_field_length,
+                           field_value)
+
+        row_format = self._row_format
+        block_text = ''.join([row_format % tuple(row_to_write) for row_to_write in rows_to_write])
+        self._write_block_text(block_text, rows_to_write)
+
 
 class XlsxRowWriter(AbstractRowWriter):
     """
@@ -657,6 +1683,8 @@ class XlsxRowWriter(AbstractRowWriter):
         Internally data are written to a worksheet first and written to a
         file during :py:meth:`cutplace.rowio.XlsxRowWriter.close`.
         """
+        import xlsxwriter
+
         assert target_path is not None
         assert isinstance(target_path, six.string_types), 'target_path must be a string but is: %s' % type(target_path)
 
@@ -695,17 +1723,15 @@ class XlsxRowWriter(AbstractRowWriter):
         assert row_to_write is not None
 
         row_index = self.location.line
-        for item in row_to_write:
+        for column_index, item in enumerate(row_to_write):
             assert item is not None
             assert not isinstance(item, six.binary_type), 'item must be a (unicode) string: %r' % item
-            column_index = self.location.cell
             if isinstance(item, six.text_type):
                 # Write strings as explicit strings to prevent strings starting with '=' from being converted to
                 # formulas.
                 self.worksheet.write_string(row_index, column_index, item)
             else:
                 self.worksheet.write(row_index, column_index, item)
-            self.location.advance_cell()
         self.location.advance_line()
 
     def close(self):
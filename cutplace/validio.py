@@ -20,26 +20,406 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import collections
+import hashlib
+import io
 import itertools
+import logging
+import os
+import sys
 
 import six
+from six.moves import cPickle as pickle
 
+from cutplace import checks
 from cutplace import data
 from cutplace import errors
+from cutplace import fields
 from cutplace import interface
 from cutplace import rowio
 from cutplace import _compat
+from cutplace import _tools
 
 # Valid choices for ``on_error`` parameter.
-_VALID_ON_ERROR_CHOICES = ('continue', 'raise', 'yield')
+_VALID_ON_ERROR_CHOICES = ('continue', 'raise', 'record', 'yield')
 
+#: Suggested ``batch_size`` for :py:class:`Reader` to validate many rows at
+#: once.
+DEFAULT_BATCH_SIZE = 1000
 
-def _create_field_map(field_names, field_values):
-    assert field_names
-    assert field_values
-    assert len(field_names) == len(field_values)
+# Number and size in bytes of the blocks of already validated data sampled
+# to detect changes to them when resuming from a checkpoint.
+_CHECKPOINT_SAMPLE_COUNT = 16
+_CHECKPOINT_SAMPLE_SIZE = 4096
 
-    return dict(zip(field_names, field_values))
+# Row validator used by `_validated_delimited_chunk()` and `_validated_fixed_chunk()` in worker processes.
+_chunk_worker_row_validator = None
+
+# Number of chunks per process submitted to the worker processes at most
+# before their results are consumed.
+_CHUNKS_IN_FLIGHT_PER_JOB = 2
+
+_log = logging.getLogger("cutplace")
+
+
+def _has_check_row(check):
+    """
+    ``True`` if ``check`` overrides
+    :py:meth:`cutplace.checks.AbstractCheck.check_row` and consequently has
+    to be called for each row.
+    """
+    assert check is not None
+    return six.get_unbound_function(type(check).check_row) \
+        is not six.get_unbound_function(checks.AbstractCheck.check_row)
+
+
+class _CompiledRowValidator(object):
+    """
+    Validator for single rows compiled from a :py:class:`cutplace.interface.Cid`.
+
+    Everything that does not change between rows is resolved once during
+    construction: the bound
+    :py:meth:`cutplace.fields.AbstractFieldFormat.broken_value` of each field
+    and the bound :py:meth:`cutplace.checks.AbstractCheck.check_row` of all
+    checks that actually override it. This keeps the per row overhead of
+    :py:meth:`~.validate_row` down to a tight loop.
+    """
+    def __init__(self, cid):
+        assert cid is not None
+
+        self._field_names = tuple(cid.field_names)
+        self._field_formats = tuple(cid.field_formats)
+        self._broken_value_functions = tuple(field_format.broken_value for field_format in self._field_formats)
+        self._expected_item_count = len(self._field_formats)
+        self._row_checks = tuple(
+            cid.check_map[check_name].check_row for check_name in cid.check_names
+            if _has_check_row(cid.check_map[check_name]))
+
+    @property
+    def expected_item_count(self):
+        return self._expected_item_count
+
+    @property
+    def has_row_checks(self):
+        """
+        ``True`` if any check has to be called for each row using
+        :py:meth:`~.check_row`.
+        """
+        return bool(self._row_checks)
+
+    def validate_row(self, row, location):
+        """
+        Same as :py:meth:`BaseValidator.validate_row` except that
+        ``location`` has to be passed explicitly and is only pointed to a
+        specific cell in case a field is broken.
+        """
+        self.validate_fields(row, location)
+        self.check_row(row, location)
+
+    def validate_fields(self, row, location):
+        """
+        Validate the number of items in ``row`` and that each of them
+        conforms to its field format.
+        """
+        broken_field = self.broken_field(row, location)
+        if broken_field is not None:
+            self.raise_broken_row(row, broken_field, location)
+
+    def broken_field(self, row, location):
+        """
+        Tuple ``(field_index, error_code, error_args)`` describing the first
+        field in ``row`` that does not conform to its field format or
+        ``None`` if all fields are valid. The ``error_code`` and
+        ``error_args`` are the result of
+        :py:meth:`cutplace.fields.AbstractFieldFormat.broken_value`. Unlike
+        :py:meth:`~.validate_fields` this neither changes ``location`` nor
+        builds an error, which is left to :py:meth:`~.raise_broken_row` or
+        :py:meth:`~.error_record`.
+
+        :raises cutplace.errors.DataError: if ``row`` has the wrong number \
+          of items
+        """
+        assert row is not None
+        assert location is not None
+
+        # Validate that number of fields.
+        actual_item_count = len(row)
+        expected_item_count = self._expected_item_count
+        if actual_item_count != expected_item_count:
+            if actual_item_count < expected_item_count:
+                raise errors.DataError(
+                    'row must contain %d fields but only has %d: %s'
+                    % (expected_item_count, actual_item_count, row),
+                    location)
+            raise errors.DataError(
+                'row must contain %d fields but has %d, additional values are: %s'
+                % (expected_item_count, actual_item_count, row[expected_item_count:]),
+                location)
+
+        # Validate each field according to its format.
+        text_type = six.text_type
+        for field_index, (broken_value, field_value) in enumerate(zip(self._broken_value_functions, row)):
+            if not isinstance(field_value, text_type):
+                error = errors.FieldValueError(
+                    'type must be %s instead of %s: %s'
+                    % (text_type.__name__, type(field_value).__name__, _compat.text_repr(field_value)))
+                return field_index, fields.FIELD_ERROR_OTHER, (error,)
+            error_code_and_args = broken_value(field_value)
+            if error_code_and_args is not None:
+                error_code, error_args = error_code_and_args
+                return field_index, error_code, error_args
+        return None
+
+    def broken_rows(self, rows):
+        """
+        Map of the indices of ``rows`` with broken fields to a tuple
+        ``(field_index, error_code, error_args)`` describing the first broken
+        field just like :py:meth:`~.broken_field`. Instead of validating one
+        row after another, fields are validated one column at a time using
+        :py:meth:`cutplace.fields.AbstractFieldFormat.broken_column`.
+
+        Rows with the wrong number of items or items that are no text map to
+        ``None`` and have to be validated using :py:meth:`~.validate_fields`
+        to find out what is wrong with them.
+        """
+        assert rows is not None
+
+        result = {}
+        expected_item_count = self._expected_item_count
+        row_indices_to_validate = []
+        for row_index, row in enumerate(rows):
+            if len(row) == expected_item_count:
+                row_indices_to_validate.append(row_index)
+            else:
+                result[row_index] = None
+        rows_to_validate = [rows[row_index] for row_index in row_indices_to_validate]
+        text_type = six.text_type
+        for field_index, field_format in enumerate(self._field_formats):
+            column = [row[field_index] for row in rows_to_validate]
+            for index, field_value in enumerate(column):
+                if not isinstance(field_value, text_type):
+                    column[index] = ''
+                    result[row_indices_to_validate[index]] = None
+            for index, (error_code, error_args) in field_format.broken_column(column).items():
+                result.setdefault(row_indices_to_validate[index], (field_index, error_code, error_args))
+        return result
+
+    def raise_broken_row(self, row, broken_field, location):
+        """
+        Raise the error for a ``row`` with the ``broken_field`` found by
+        :py:meth:`~.broken_field` or :py:meth:`~.broken_rows` with
+        ``location`` pointing to the broken field.
+        """
+        assert row is not None
+        assert location is not None
+
+        if broken_field is None:
+            self.validate_fields(row, location)
+            assert False, 'row must be broken: %r' % row
+        field_index, error_code, error_args = broken_field
+        error = fields.field_value_error(error_code, error_args)
+        location.set_cell(field_index)
+        error.prepend_message('cannot accept field %s' % _compat.text_repr(self._field_names[field_index]), location)
+        raise error
+
+    def error_record(self, row, broken_field, location):
+        """
+        Same as :py:meth:`~.raise_broken_row` but instead of raising the
+        error return a :py:class:`cutplace.errors.DataErrorRecord` that
+        only builds it when needed.
+        """
+        assert row is not None
+        assert location is not None
+
+        if broken_field is None:
+            try:
+                self.validate_fields(row, location)
+                assert False, 'row must be broken: %r' % row
+            except errors.DataError as error:
+                result = errors.DataErrorRecord(location.file_path, location.line, None, None, None, error)
+        else:
+            field_index, error_code, error_args = broken_field
+            result = errors.DataErrorRecord(
+                location.file_path, location.line, field_index, self._field_names[field_index], row[field_index],
+                (error_code, error_args))
+        return result
+
+    def check_row(self, row, location):
+        """
+        Validate that ``row``, which already passed
+        :py:meth:`~.validate_fields`, conforms to all row checks.
+        """
+        assert row is not None
+        assert location is not None
+
+        if self._row_checks:
+            location.set_cell(0)
+            field_map = dict(zip(self._field_names, row))
+            for check_row in self._row_checks:
+                check_row(field_map, location)
+
+
+def _init_chunk_worker(cid):
+    """
+    Remember ``cid`` for all chunks validated by the current worker process.
+    """
+    global _chunk_worker_row_validator
+    _chunk_worker_row_validator = _CompiledRowValidator(cid)
+
+
+def _validated_delimited_chunk(chunk_info):
+    """
+    Validate the fields of all rows in a chunk of a delimited file as
+    described by ``chunk_info``, which is a tuple
+    ``(delimited_path, data_format, start, end, is_returning_rows)``. This
+    runs in a worker process set up by :py:func:`_init_chunk_worker`.
+
+    The result is a tuple
+    ``(rows, row_count, row_errors, line_count, format_error)``:
+
+    * ``rows``: the rows read from the chunk or ``None`` unless \
+      ``is_returning_rows``, which saves passing rows nobody needs back to \
+      the parent process.
+    * ``row_count``: the number of rows read from the chunk.
+    * ``row_errors``: a map of row indices within ``rows`` to tuples \
+      ``(error_class, message, cell)`` for rows with broken fields.
+    * ``line_count``: number of physical lines in the chunk.
+    * ``format_error``: ``None`` or a tuple ``(line, column, message)`` in \
+      case the chunk cannot be parsed at all; ``column`` is ``None`` for \
+      delimited data.
+
+    Errors are passed on this way because :py:class:`cutplace.errors.Location`
+    is relative to the chunk and has to be translated by the process that
+    knows the number of rows before it.
+    """
+    delimited_path, data_format, start, end, is_returning_rows = chunk_info
+    with io.open(delimited_path, 'rb') as delimited_stream:
+        delimited_stream.seek(start)
+        chunk_data = delimited_stream.read(end - start)
+    newline = b'\r' if data_format.line_delimiter == '\r' else b'\n'
+    line_count = chunk_data.count(newline)
+    rows = [] if is_returning_rows else None
+    row_count = 0
+    row_errors = {}
+    format_error = None
+    location = errors.Location(delimited_path, has_cell=True)
+    try:
+        with io.StringIO(chunk_data.decode(data_format.encoding), newline='') as chunk_stream:
+            for row_index, row in enumerate(rowio.delimited_rows(chunk_stream, data_format)):
+                if is_returning_rows:
+                    rows.append(row)
+                row_count += 1
+                try:
+                    _chunk_worker_row_validator.validate_fields(row, location)
+                except errors.DataError as error:
+                    cell = error.location.cell if error.location is not None else 0
+                    row_errors[row_index] = (type(error), error.message, cell)
+                location.advance_line()
+    except errors.DataFormatError as error:
+        format_error = (error.location.line, None, error.message)
+    return rows, row_count, row_errors, line_count, format_error
+
+
+def _validated_fixed_chunk(chunk_info):
+    """
+    Same as :py:func:`_validated_delimited_chunk` but for a chunk of a
+    fixed data file as described by ``chunk_info``, which is a tuple
+    ``(fixed_path, data_format, field_names_and_lengths, start, end, is_returning_rows)``
+    with ``start`` and ``end`` at record boundaries as computed by
+    :py:func:`cutplace.rowio.fixed_chunks`.
+    """
+    fixed_path, data_format, field_names_and_lengths, start, end, is_returning_rows = chunk_info
+    rows = [] if is_returning_rows else None
+    row_count = 0
+    row_errors = {}
+    format_error = None
+    location = errors.Location(fixed_path, has_cell=True)
+    with rowio.MappedFixedRows(
+            fixed_path, data_format.encoding, field_names_and_lengths, data_format.line_delimiter) as mapped_rows:
+        record_length = mapped_rows.record_length
+        first_row_index = start // record_length
+        stop_row_index = min(len(mapped_rows), (end + record_length - 1) // record_length)
+        try:
+            for row_index in range(first_row_index, stop_row_index):
+                row = mapped_rows[row_index]
+                if is_returning_rows:
+                    rows.append(row)
+                row_count += 1
+                try:
+                    _chunk_worker_row_validator.validate_fields(row, location)
+                except errors.DataError as error:
+                    cell = error.location.cell if error.location is not None else 0
+                    row_errors[row_index - first_row_index] = (type(error), error.message, cell)
+                location.advance_line()
+        except errors.DataFormatError as error:
+            format_error = (error.location.line - first_row_index, error.location.column, error.message)
+    return rows, row_count, row_errors, stop_row_index - first_row_index, format_error
+
+
+def _limited_imap(pool, function, items, max_items_in_flight):
+    """
+    Same as ``pool.imap(function, items)`` for a
+    :py:class:`multiprocessing.pool.Pool` but with at most
+    ``max_items_in_flight`` items submitted to the worker processes before
+    their results are consumed. Unlike ``imap()``, this keeps finished
+    results from piling up in memory in case the consumer is slower than
+    the workers.
+    """
+    assert max_items_in_flight >= 1
+
+    items = iter(items)
+    async_results = collections.deque(
+        pool.apply_async(function, (item,)) for item in itertools.islice(items, max_items_in_flight))
+    while async_results:
+        async_result = async_results.popleft()
+        # Keep the workers busy while the caller processes the result.
+        for item in itertools.islice(items, 1):
+            async_results.append(pool.apply_async(function, (item,)))
+        yield async_result.get()
+
+
+def _checkpoint_key(cid, data_path):
+    """
+    Tuple identifying the data file ``data_path``, the parts of ``cid`` that
+    affect the check states and the cutplace version used to validate them.
+    """
+    # Import here to avoid circular import because the package imports this module.
+    from cutplace import __version__
+
+    data_format = cid.data_format
+    return (
+        __version__, os.path.abspath(data_path), data_format.format, data_format.encoding, tuple(cid.field_names),
+        tuple((check_name, cid.check_map[check_name].rule) for check_name in cid.check_names))
+
+
+def _pickled_state_parts(checkpoint_file):
+    """
+    The parts of a check state read from ``checkpoint_file`` as stored by
+    :py:meth:`Reader._write_checkpoint`: each part is pickled as a tuple
+    with a single item followed by an empty tuple after the last part.
+    """
+    while True:
+        wrapped_state_part = pickle.load(checkpoint_file)
+        if not wrapped_state_part:
+            break
+        yield wrapped_state_part[0]
+
+
+def _sampled_prefix_digest(data_path, prefix_size):
+    """
+    Digest of the first ``prefix_size`` bytes of ``data_path``. For large
+    prefixes, only :py:const:`_CHECKPOINT_SAMPLE_COUNT` evenly distributed
+    blocks including the first and last one are used.
+    """
+    result = hashlib.sha1(('%d:' % prefix_size).encode('ascii'))
+    with io.open(data_path, 'rb') as data_file:
+        if prefix_size <= _CHECKPOINT_SAMPLE_COUNT * _CHECKPOINT_SAMPLE_SIZE:
+            result.update(data_file.read(prefix_size))
+        else:
+            for sample_index in range(_CHECKPOINT_SAMPLE_COUNT):
+                data_file.seek((prefix_size - _CHECKPOINT_SAMPLE_SIZE) * sample_index // (_CHECKPOINT_SAMPLE_COUNT - 1))
+                result.update(data_file.read(_CHECKPOINT_SAMPLE_SIZE))
+    return result.digest()
 
 
 class BaseValidator(object):
@@ -65,7 +445,8 @@ class BaseValidator(object):
             self._cid = cid_or_path
             assert self._cid.data_format.is_valid, \
                 'DataFormat.validate() must be called before using a CID for validation'
-        self._expected_item_count = len(self._cid.field_formats)
+        self._compiled_row_validator = _CompiledRowValidator(self._cid)
+        self._check_states_to_merge = []
         self._location = None
         self._is_closed = False
 
@@ -115,60 +496,72 @@ class BaseValidator(object):
         assert row is not None
         assert self.location is not None
 
-        # Validate that number of fields.
-        actual_item_count = len(row)
-        if actual_item_count < self._expected_item_count:
-            raise errors.DataError(
-                'row must contain %d fields but only has %d: %s'
-                % (self._expected_item_count, actual_item_count, row),
-                self.location)
-        if actual_item_count > self._expected_item_count:
-            raise errors.DataError(
-                'row must contain %d fields but has %d, additional values are: %s'
-                % (self._expected_item_count, actual_item_count, row[self._expected_item_count:]),
-                self.location)
+        self._compiled_row_validator.validate_row(row, self.location)
 
-        # Validate each field according to its format.
-        for field_index, field_value in enumerate(row):
-            self.location.set_cell(field_index)
-            field_to_validate = self.cid.field_formats[field_index]
-            try:
-                if not isinstance(field_value, six.text_type):
-                    raise errors.FieldValueError(
-                        'type must be %s instead of %s: %s'
-                        % (six.text_type.__name__, type(field_value).__name__, _compat.text_repr(field_value)))
-                field_to_validate.validated(field_value)
-            except errors.FieldValueError as error:
-                error.prepend_message(
-                    'cannot accept field %s' % _compat.text_repr(field_to_validate.field_name), self.location)
-                raise
-
-        # Validate the whole row according to row checks.
-        self.location.set_cell(0)
-        field_map = _create_field_map(self.cid.field_names, row)
-        for check_name in self.cid.check_names:
-            self.cid.check_map[check_name].check_row(field_map, self.location)
+    def check_states(self):
+        """
+        Map of check names to the state collected by each check so far as
+        returned by :py:meth:`cutplace.checks.AbstractCheck.snapshot_state`.
+
+        When validating parts of the data (shards) with separate validators,
+        for example in different processes, pass the results of each shard
+        validator to :py:meth:`~.merge_check_states` of the validator
+        performing the final checks. Shard validators should be closed with
+        ``close(check_at_end=False)`` because their checks only know about
+        a part of the data.
+        """
+        return dict(
+            (check_name, self.cid.check_map[check_name].snapshot_state()) for check_name in self.cid.check_names)
+
+    def merge_check_states(self, check_name_to_state_map):
+        """
+        Remember the check states ``check_name_to_state_map`` as returned by
+        :py:meth:`~.check_states` of another validator to be merged into the
+        checks of this validator during :py:meth:`~.close` before performing
+        the final checks.
 
-    def close(self):
+        States have to be merged in the order of the data they were
+        collected from so that errors on conflicting states refer to the
+        first occurrence, for example of a duplicate key.
         """
-        Validate final checks and release all resources. When called a second
-        time, do nothing.
+        assert check_name_to_state_map is not None
+        assert not self._is_closed
+        assert set(check_name_to_state_map.keys()) == set(self.cid.check_names), \
+            'check names must match: %s' % sorted(check_name_to_state_map.keys())
 
+        self._check_states_to_merge.append(check_name_to_state_map)
+
+    def close(self, check_at_end=True):
+        """
+        Merge any check states passed to :py:meth:`~.merge_check_states`,
+        validate final checks and release all resources. When called a
+        second time, do nothing.
+
+        :param bool check_at_end: if ``False``, skip the final checks, which \
+          is useful for validators processing only a part of the data
         :raises cutplace.errors.CheckError: if any \
+          :py:meth:`cutplace.checks.AbstractCheck.merge_state` or \
           :py:meth:`cutplace.checks.AbstractCheck.check_at_end` fails.
         """
         if not self._is_closed:
             try:
-                for check_name in self.cid.check_names:
-                    self.cid.check_map[check_name].check_at_end(self.location)
+                for check_name_to_state_map in self._check_states_to_merge:
+                    for check_name in self.cid.check_names:
+                        self.cid.check_map[check_name].merge_state(
+                            check_name_to_state_map[check_name], self.location)
+                if check_at_end:
+                    for check_name in self.cid.check_names:
+                        self.cid.check_map[check_name].check_at_end(self.location)
             finally:
                 for check in self.cid.check_map.values():
                     check.cleanup()
+                self._check_states_to_merge = []
             self._is_closed = True
 
 
 class Reader(BaseValidator):
-    def __init__(self, cid_or_path, source_data_stream_or_path, on_error='raise', validate_until=None):
+    def __init__(self, cid_or_path, source_data_stream_or_path, on_error='raise', validate_until=None, jobs=1,
+                 row_range=None, batch_size=1, checkpoint_path=None):
         """
         An iterator that produces possibly validated rows from
         ``source_data_stream_or_path`` conforming to ``cid_or_path``.
@@ -179,17 +572,86 @@ class Reader(BaseValidator):
         * ``'raise'`` (the default): raise an exception and stop reading.
         * ``'yield'``: instead of of a row, the result contains a \
           :py:exc:`cutplace.errors.DataError`.
+        * ``'record'``: same as ``'yield'`` but instead of the error, the \
+          result contains a lightweight \
+          :py:class:`cutplace.errors.DataErrorRecord`, which only builds the \
+          complete error when needed. This is faster than ``'yield'`` for \
+          data with many broken rows.
+
+        With ``'continue'`` and ``'record'``, rows with broken fields are \
+        rejected without raising an error for them.
 
         :param validate_until: number of rows after which validation should \
           stop; further rows are still produces but not validated anymore; \
           ``None`` all rows should be validated (the default); 0 means no \
           rows should be validated
         :type: int or None
+        :param int jobs: number of processes to validate the fields of \
+          delimited or fixed data in parallel; the data are split into \
+          chunks at record boundaries using \
+          :py:func:`cutplace.rowio.delimited_chunks` or \
+          :py:func:`cutplace.rowio.fixed_chunks`. Checks are still \
+          performed in the order of the rows, so the results are the same \
+          as with 1 (the default), which validates everything in the \
+          current process. Other formats, fixed data that cannot be read \
+          using :py:class:`cutplace.rowio.MappedFixedRows` and data read \
+          from streams are always validated in the current process.
+        :param row_range: tuple ``(start, stop)`` with the index of the \
+          first row to read and of the row after the last row to read; \
+          ``stop`` can be ``None`` to read until the end of the data; \
+          ``None`` reads all rows (the default). For fixed data files \
+          with a single byte encoding and a specific line delimiter, rows \
+          before ``start`` are skipped without reading them using \
+          :py:class:`cutplace.rowio.MappedFixedRows`. Checks only see \
+          the rows in the range, so to validate the data in parts, \
+          consider :py:meth:`~.check_states` and \
+          ``close(check_at_end=False)``. With a row range, the data are \
+          always validated in the current process.
+        :type row_range: tuple or None
+        :param batch_size: number of rows to read before validating their \
+          fields one column at a time using \
+          :py:meth:`cutplace.fields.AbstractFieldFormat.validated_column`, \
+          which reports the same errors as validating one row after another \
+          but is faster for many rows, for example \
+          :py:const:`DEFAULT_BATCH_SIZE`; 1 validates one row after another \
+          (the default). Data validated in parallel using ``jobs`` are \
+          always validated one row after another.
+        :type batch_size: int
+        :param checkpoint_path: path of a file to store a checkpoint in \
+          once all complete records of the data file \
+          ``source_data_stream_or_path`` have been read, consisting of \
+          their size, the number of rows and lines and the \
+          :py:meth:`~.check_states`. If the file already contains a \
+          checkpoint for the same data file and CID, only the rows \
+          appended since are read and validated, with checks taking the \
+          rows before them into account. A checkpoint is ignored if the \
+          data file became smaller or the bytes sampled from the data \
+          before it changed. Records after the last line delimiter are \
+          considered incomplete; they are read and validated but not \
+          included in the checkpoint, so they are read again the next \
+          time. This requires delimited data that can be split as \
+          described for :py:func:`cutplace.rowio.delimited_records_end` \
+          or fixed data that can be read using \
+          :py:class:`cutplace.rowio.MappedFixedRows`; other data are \
+          read completely every time. With a checkpoint, the data are \
+          always validated in the current process one row after another. \
+          ``None`` means no checkpoint is used (the default).
+        :type checkpoint_path: str or None
         """
         assert cid_or_path is not None
         assert source_data_stream_or_path is not None
         assert on_error in _VALID_ON_ERROR_CHOICES, 'on_error=%r' % on_error
         assert (validate_until is None) or (validate_until >= 0)
+        assert jobs >= 1, 'jobs=%r' % jobs
+        if row_range is not None:
+            assert len(row_range) == 2, 'row_range=%r' % (row_range,)
+            assert row_range[0] >= 0, 'row_range=%r' % (row_range,)
+            assert (row_range[1] is None) or (row_range[1] >= row_range[0]), 'row_range=%r' % (row_range,)
+        assert batch_size >= 1, 'batch_size=%r' % batch_size
+        if checkpoint_path is not None:
+            assert isinstance(source_data_stream_or_path, six.string_types), \
+                'checkpoint requires data file path: %r' % source_data_stream_or_path
+            assert row_range is None, 'row_range=%r' % (row_range,)
 
         super(Reader, self).__init__(cid_or_path)
         # TODO: Consolidate obtaining source path with other code segments that do similar things.
@@ -204,6 +666,10 @@ class Reader(BaseValidator):
         self._source_data_stream_or_path = source_data_stream_or_path
         self._on_error = on_error
         self._validate_until = validate_until
+        self._jobs = jobs
+        self._row_range = row_range
+        self._checkpoint_path = checkpoint_path
+        self._batch_size = batch_size
         self.accepted_rows_count = None
         self.rejected_rows_count = None
 
@@ -211,6 +677,221 @@ class Reader(BaseValidator):
     def on_error(self):
         return self._on_error
 
+    @property
+    def jobs(self):
+        return self._jobs
+
+    @property
+    def row_range(self):
+        return self._row_range
+
+    @property
+    def checkpoint_path(self):
+        return self._checkpoint_path
+
+    @property
+    def batch_size(self):
+        """
+        Number of rows validated at once; 1 means one row after another.
+        """
+        return self._batch_size
+
+    def _is_raising_field_errors(self):
+        """
+        ``True`` if broken fields have to be reported by raising a complete
+        error, ``False`` if they can be rejected without it.
+        """
+        return self.on_error in ('raise', 'yield')
+
+    def _error_record(self, error):
+        """
+        :py:class:`cutplace.errors.DataErrorRecord` for the already complete
+        ``error`` in the current row.
+        """
+        return errors.DataErrorRecord(self._location.file_path, self._location.line, None, None, None, error)
+
+    def _chunks_to_validate_in_parallel(self):
+        """
+        List of byte ranges as computed by
+        :py:func:`cutplace.rowio.delimited_chunks` to be validated by
+        separate processes or ``None`` if the data should be validated in
+        the current process.
+        """
+        result = None
+        data_format = self.cid.data_format
+        is_delimited_file = (data_format.format == data.FORMAT_DELIMITED) \
+            and isinstance(self._source_data_stream_or_path, six.string_types)
+        is_mappable_fixed_file = self._is_mappable_fixed_file()
+        if (self.jobs > 1) and (is_delimited_file or is_mappable_fixed_file) and (self.row_range is None) \
+                and (self.checkpoint_path is None):
+            if is_delimited_file:
+                chunks = rowio.delimited_chunks(self._source_data_stream_or_path, data_format)
+            else:
+                chunks = rowio.fixed_chunks(
+                    self._source_data_stream_or_path, data_format.encoding,
+                    interface.field_names_and_lengths(self.cid), data_format.line_delimiter)
+            if len(chunks) >= 2:
+                result = chunks
+            else:
+                _log.debug('validate "%s" in a single process', self._source_data_stream_or_path)
+        return result
+
+    def _is_mappable_fixed_file(self):
+        """
+        ``True`` if the data are a fixed data file that can be read using
+        :py:class:`cutplace.rowio.MappedFixedRows`.
+        """
+        data_format = self.cid.data_format
+        return (data_format.format == data.FORMAT_FIXED) \
+            and isinstance(self._source_data_stream_or_path, six.string_types) \
+            and (data_format.line_delimiter != 'any') \
+            and rowio.is_single_byte_encoding(data_format.encoding)
+
+    def _raw_rows_in_range(self):
+        """
+        Same as :py:meth:`~._raw_rows` but limited to :py:attr:`~.row_range`.
+        """
+        if self.row_range is None:
+            for row in self._raw_rows():
+                yield row
+        else:
+            start, stop = self.row_range
+            data_format = self.cid.data_format
+            if self._is_mappable_fixed_file():
+                with rowio.MappedFixedRows(
+                        self._source_data_stream_or_path, data_format.encoding,
+                        interface.field_names_and_lengths(self.cid), data_format.line_delimiter) as mapped_rows:
+                    stop = len(mapped_rows) if stop is None else min(stop, len(mapped_rows))
+                    for row_index in range(start, stop):
+                        yield mapped_rows[row_index]
+            else:
+                for row in itertools.islice(self._raw_rows(), start, stop):
+                    yield row
+
+    def _resumed_raw_rows(self):
+        """
+        Tuple ``(row_count, raw_rows)`` with the number of rows already
+        validated according to the checkpoint at :py:attr:`~.checkpoint_path`
+        and the rows after them, which store a new checkpoint once all
+        complete records have been read. The check states of the checkpoint
+        are merged into the checks, so call this after resetting them.
+        """
+        data_format = self.cid.data_format
+        if (data_format.format == data.FORMAT_DELIMITED) or self._is_mappable_fixed_file():
+            offset, line_count, row_count = self._checkpoint()
+            result = row_count, self._raw_rows_after_checkpoint(offset, line_count, row_count)
+        else:
+            _log.debug('validate "%s" without checkpoint', self._source_data_stream_or_path)
+            result = 0, self._raw_rows()
+        return result
+
+    def _checkpoint(self):
+        """
+        Tuple ``(offset, line_count, row_count)`` describing the data already
+        validated as stored in :py:attr:`~.checkpoint_path` after merging
+        the check states stored with it into the checks. If there is no
+        usable checkpoint, the result describes the start of the data and
+        the checks remain unchanged.
+        """
+        result = 0, 0, 0
+        data_path = self._source_data_stream_or_path
+        try:
+            with io.open(self.checkpoint_path, 'rb') as checkpoint_file:
+                # The key is pickled separately so the check states of an outdated checkpoint do not have to be loaded.
+                if pickle.load(checkpoint_file) == _checkpoint_key(self.cid, data_path):
+                    offset, line_count, row_count, prefix_digest = pickle.load(checkpoint_file)
+                    if os.path.getsize(data_path) < offset:
+                        _log.info('ignore checkpoint "%s" because "%s" became smaller', self.checkpoint_path, data_path)
+                    elif _sampled_prefix_digest(data_path, offset) != prefix_digest:
+                        _log.info('ignore checkpoint "%s" because "%s" changed', self.checkpoint_path, data_path)
+                    else:
+                        self._merge_checkpoint_check_states(checkpoint_file)
+                        _log.info('resume validating "%s" after %d rows', data_path, row_count)
+                        result = offset, line_count, row_count
+                else:
+                    _log.info('ignore outdated checkpoint "%s"', self.checkpoint_path)
+        except (EnvironmentError, OSError) as error:
+            _log.debug('cannot read checkpoint "%s": %s', self.checkpoint_path, error)
+        except errors.CutplaceError:
+            raise
+        except Exception as error:
+            # Unpickling can fail in many ways, for example if the file is truncated.
+            _log.warning('ignore broken checkpoint "%s": %s', self.checkpoint_path, error)
+            for check in self.cid.check_map.values():
+                check.reset()
+        return result
+
+    def _merge_checkpoint_check_states(self, checkpoint_file):
+        """
+        Merge the check states stored by :py:meth:`~._write_checkpoint` in
+        ``checkpoint_file`` into the checks one part after another.
+        """
+        for check_name in self.cid.check_names:
+            state_parts = _pickled_state_parts(checkpoint_file)
+            self.cid.check_map[check_name].merge_state_parts(state_parts)
+            # Skip parts the check did not use so the parts of the next check are read from the proper position.
+            for _ in state_parts:
+                pass
+
+    def _check_state_parts_to_pickle(self):
+        """
+        The parts of the states of all checks as returned by
+        :py:meth:`cutplace.checks.AbstractCheck.snapshot_state_parts` in
+        the form read by :py:func:`_pickled_state_parts`.
+        """
+        for check_name in self.cid.check_names:
+            for state_part in self.cid.check_map[check_name].snapshot_state_parts():
+                yield (state_part,)
+            yield ()
+
+    def _write_checkpoint(self, offset, line_count):
+        """
+        Store a checkpoint for the first ``offset`` bytes of the data, which
+        contain ``line_count`` lines and all rows validated so far. The check
+        states are pickled one part after another so large states, for
+        example the row keys :py:class:`cutplace.checks.IsUniqueCheck` moved
+        to disk, do not have to be loaded into memory at once.
+        """
+        data_path = self._source_data_stream_or_path
+        row_count = self._location.line
+        try:
+            _tools.write_pickled(self.checkpoint_path, itertools.chain(
+                [_checkpoint_key(self.cid, data_path),
+                 (offset, line_count, row_count, _sampled_prefix_digest(data_path, offset))],
+                self._check_state_parts_to_pickle()))
+            _log.debug('wrote checkpoint "%s" after %d rows', self.checkpoint_path, row_count)
+        except (EnvironmentError, OSError, AttributeError, TypeError, pickle.PicklingError) as error:
+            _log.warning('cannot write checkpoint "%s": %s', self.checkpoint_path, error)
+
+    def _raw_rows_after_checkpoint(self, offset, line_count, row_count):
+        """
+        Rows after the first ``offset`` bytes of the data, which contain
+        ``line_count`` lines and ``row_count`` rows. Once all complete
+        records have been read and consequently validated by the caller, a
+        new checkpoint is stored before reading the remaining incomplete
+        record, if any.
+        """
+        data_path = self._source_data_stream_or_path
+        data_format = self.cid.data_format
+        if data_format.format == data.FORMAT_DELIMITED:
+            end, end_line_count = rowio.delimited_records_end(data_path, data_format, offset)
+            end_line_count += line_count
+            for row in rowio.delimited_rows_in_range(data_path, data_format, offset, end, line_count):
+                yield row
+            self._write_checkpoint(end, end_line_count)
+            for row in rowio.delimited_rows_in_range(data_path, data_format, end, None, end_line_count):
+                yield row
+        else:
+            with rowio.MappedFixedRows(
+                    data_path, data_format.encoding, interface.field_names_and_lengths(self.cid),
+                    data_format.line_delimiter) as mapped_rows:
+                end_row_count = max(row_count, mapped_rows.data_size // mapped_rows.record_length)
+                for row_index in range(row_count, end_row_count):
+                    yield mapped_rows[row_index]
+                self._write_checkpoint(end_row_count * mapped_rows.record_length, end_row_count)
+                for row_index in range(end_row_count, len(mapped_rows)):
+                    yield mapped_rows[row_index]
+
     def _raw_rows(self):
         data_format = self.cid.data_format
         format = data_format.format
@@ -239,28 +920,253 @@ class Reader(BaseValidator):
 
         :raises cutplace.errors.DataError: on broken data
         """
+        return self._rows(True)
+
+    def _rows(self, is_yielding_rows):
+        """
+        Same as :py:meth:`~.rows` but if ``is_yielding_rows`` is ``False``,
+        the caller only wants to validate the rows, so rows read in
+        parallel are not passed back from the worker processes unless
+        needed for row checks and the result might not contain rows at all.
+        """
         self.accepted_rows_count = 0
         self.rejected_rows_count = 0
         for check in self.cid.check_map.values():
             check.reset()
+        chunks = self._chunks_to_validate_in_parallel()
+        if chunks is not None:
+            for row in self._parallel_rows(chunks, is_yielding_rows):
+                yield row
+        elif (self.batch_size > 1) and (self.checkpoint_path is None):
+            for row in self._batched_rows():
+                yield row
+        else:
+            header_row_count = self._cid.data_format.header
+            compiled_row_validator = self._compiled_row_validator
+            is_raising_field_errors = self._is_raising_field_errors()
+            if self.checkpoint_path is None:
+                first_row_index = 0 if self.row_range is None else self.row_range[0]
+                raw_rows = self._raw_rows_in_range()
+            else:
+                first_row_index, raw_rows = self._resumed_raw_rows()
+            self._location.set_line(first_row_index)
+            for row_count, row in enumerate(raw_rows, first_row_index + 1):
+                try:
+                    is_after_header_row = (row_count > header_row_count)
+                    is_before_validate_until = (self._validate_until is None) or (row_count <= self._validate_until)
+                    broken_field = None
+                    if is_after_header_row and is_before_validate_until:
+                        broken_field = compiled_row_validator.broken_field(row, self._location)
+                        if broken_field is None:
+                            compiled_row_validator.check_row(row, self._location)
+                        elif is_raising_field_errors:
+                            compiled_row_validator.raise_broken_row(row, broken_field, self._location)
+                    if broken_field is None:
+                        self.accepted_rows_count += 1
+                        yield row
+                    else:
+                        self.rejected_rows_count += 1
+                        if self.on_error == 'record':
+                            yield compiled_row_validator.error_record(row, broken_field, self._location)
+                except errors.DataError as error:
+                    if self.on_error == 'raise':
+                        raise
+                    self.rejected_rows_count += 1
+                    if self.on_error == 'yield':
+                        yield error
+                    elif self.on_error == 'record':
+                        yield self._error_record(error)
+                    else:
+                        assert self.on_error == 'continue'
+                self._location.advance_line()
+
+    def _batched_rows(self):
+        """
+        Same as :py:meth:`~.rows` but with fields validated one column of
+        :py:attr:`~.batch_size` rows at a time.
+        """
         header_row_count = self._cid.data_format.header
-        for row_count, row in enumerate(self._raw_rows(), 1):
+        compiled_row_validator = self._compiled_row_validator
+        is_raising_field_errors = self._is_raising_field_errors()
+        row_count = 0 if self.row_range is None else self.row_range[0]
+        self._location.set_line(row_count)
+        raw_rows = self._raw_rows_in_range()
+        is_done = False
+        while not is_done:
+            batch_rows = []
+            reading_error_info = None
             try:
-                is_after_header_row = (row_count > header_row_count)
-                is_before_validate_until = (self._validate_until is None) or (row_count <= self._validate_until)
-                if is_after_header_row and is_before_validate_until:
-                    self.validate_row(row)
-                self.accepted_rows_count += 1
-                yield row
-            except errors.DataError as error:
+                for row in itertools.islice(raw_rows, self.batch_size):
+                    batch_rows.append(row)
+            except Exception:
+                # Remember the error to raise it after the rows read before it.
+                reading_error_info = sys.exc_info()
+            is_done = (reading_error_info is not None) or (len(batch_rows) < self.batch_size)
+
+            # Find out which rows are after the header and before `validate_until` to validate them.
+            first_batch_index_to_validate = max(0, header_row_count - row_count)
+            if self._validate_until is None:
+                last_batch_index_to_validate = len(batch_rows)
+            else:
+                last_batch_index_to_validate = min(len(batch_rows), max(0, self._validate_until - row_count))
+            if first_batch_index_to_validate < last_batch_index_to_validate:
+                broken_rows = compiled_row_validator.broken_rows(
+                    batch_rows[first_batch_index_to_validate:last_batch_index_to_validate])
+            else:
+                broken_rows = {}
+
+            for batch_index, row in enumerate(batch_rows):
+                row_count += 1
+                try:
+                    is_broken_row = False
+                    if first_batch_index_to_validate <= batch_index < last_batch_index_to_validate:
+                        broken_row_index = batch_index - first_batch_index_to_validate
+                        is_broken_row = broken_row_index in broken_rows
+                        if not is_broken_row:
+                            compiled_row_validator.check_row(row, self._location)
+                        elif is_raising_field_errors:
+                            compiled_row_validator.raise_broken_row(
+                                row, broken_rows[broken_row_index], self._location)
+                    if not is_broken_row:
+                        self.accepted_rows_count += 1
+                        yield row
+                    else:
+                        self.rejected_rows_count += 1
+                        if self.on_error == 'record':
+                            yield compiled_row_validator.error_record(
+                                row, broken_rows[broken_row_index], self._location)
+                except errors.DataError as error:
+                    if self.on_error == 'raise':
+                        raise
+                    self.rejected_rows_count += 1
+                    if self.on_error == 'yield':
+                        yield error
+                    elif self.on_error == 'record':
+                        yield self._error_record(error)
+                    else:
+                        assert self.on_error == 'continue'
+                self._location.advance_line()
+            if reading_error_info is not None:
+                six.reraise(*reading_error_info)
+
+    def _parallel_rows(self, chunks, is_yielding_rows):
+        """
+        Same as :py:meth:`~._rows` but with fields validated by
+        :py:attr:`~.jobs` processes, each processing one of ``chunks`` at a
+        time, which are byte ranges as computed by
+        :py:func:`cutplace.rowio.delimited_chunks` or
+        :py:func:`cutplace.rowio.fixed_chunks`. At most
+        ``_CHUNKS_IN_FLIGHT_PER_JOB`` chunks per process are validated ahead
+        of the rows consumed by the caller.
+
+        Row checks still have to be performed by the current process in the
+        order of the data. If there are none and ``is_yielding_rows`` is
+        ``False``, the workers only pass back the number of rows and the
+        errors found instead of the rows.
+        """
+        # Import here because most validations do not need multiple processes.
+        import multiprocessing
+
+        assert chunks
+
+        source_path = self._source_data_stream_or_path
+        data_format = self.cid.data_format
+        header_row_count = data_format.header
+        compiled_row_validator = self._compiled_row_validator
+        is_returning_rows = is_yielding_rows or compiled_row_validator.has_row_checks
+        if data_format.format == data.FORMAT_DELIMITED:
+            validated_chunk = _validated_delimited_chunk
+            chunk_infos = ((source_path, data_format, start, end, is_returning_rows) for start, end in chunks)
+        else:
+            assert data_format.format == data.FORMAT_FIXED, 'format=%r' % data_format.format
+            validated_chunk = _validated_fixed_chunk
+            field_names_and_lengths = interface.field_names_and_lengths(self.cid)
+            chunk_infos = (
+                (source_path, data_format, field_names_and_lengths, start, end, is_returning_rows)
+                for start, end in chunks)
+        _log.debug('validate "%s" in %d chunks using %d processes', source_path, len(chunks), self.jobs)
+        pool = multiprocessing.Pool(self.jobs, _init_chunk_worker, (self.cid,))
+        try:
+            row_count = 0
+            line_count = 0
+            validated_chunks = _limited_imap(
+                pool, validated_chunk, chunk_infos, self.jobs * _CHUNKS_IN_FLIGHT_PER_JOB)
+            for rows, chunk_row_count, row_errors, chunk_line_count, format_error in validated_chunks:
+                if rows is None:
+                    self._count_parallel_rows(row_count, chunk_row_count, row_errors)
+                    row_count += chunk_row_count
+                    rows = ()
+                for row_index, row in enumerate(rows):
+                    row_count += 1
+                    try:
+                        is_after_header_row = (row_count > header_row_count)
+                        is_before_validate_until = \
+                            (self._validate_until is None) or (row_count <= self._validate_until)
+                        row_error = None
+                        if is_after_header_row and is_before_validate_until:
+                            row_error = row_errors.get(row_index)
+                            if row_error is None:
+                                compiled_row_validator.check_row(row, self._location)
+                            elif self.on_error != 'continue':
+                                error_class, message, cell = row_error
+                                self._location.set_cell(cell)
+                                raise error_class(message, self._location)
+                        if row_error is None:
+                            self.accepted_rows_count += 1
+                            yield row
+                        else:
+                            self.rejected_rows_count += 1
+                    except errors.DataError as error:
+                        if self.on_error == 'raise':
+                            raise
+                        self.rejected_rows_count += 1
+                        if self.on_error == 'yield':
+                            yield error
+                        elif self.on_error == 'record':
+                            yield self._error_record(error)
+                        else:
+                            assert self.on_error == 'continue'
+                    self._location.advance_line()
+                if format_error is not None:
+                    format_error_line, format_error_column, format_error_message = format_error
+                    if format_error_column is None:
+                        format_error_location = errors.Location(source_path).copy_at(line_count + format_error_line)
+                    else:
+                        format_error_location = errors.Location(source_path, has_column=True).copy_at(
+                            line_count + format_error_line, format_error_column)
+                    raise errors.DataFormatError(format_error_message, format_error_location)
+                line_count += chunk_line_count
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _count_parallel_rows(self, row_count, chunk_row_count, row_errors):
+        """
+        Same as the validation of a chunk of rows in
+        :py:meth:`~._parallel_rows` but for ``chunk_row_count`` rows after
+        the first ``row_count`` rows that are only known by the
+        ``row_errors`` found by a worker process. Because there are no rows
+        to yield, rows are only counted as accepted or rejected unless a
+        broken row has to raise an error.
+        """
+        header_row_count = self.cid.data_format.header
+        first_line = self._location.line
+        rejected_rows_count = 0
+        for row_index in sorted(row_errors):
+            broken_row_count = row_count + row_index + 1
+            is_after_header_row = (broken_row_count > header_row_count)
+            is_before_validate_until = (self._validate_until is None) or (broken_row_count <= self._validate_until)
+            if is_after_header_row and is_before_validate_until:
                 if self.on_error == 'raise':
-                    raise
-                self.rejected_rows_count += 1
-                if self.on_error == 'yield':
-                    yield error
-                else:
-                    assert self.on_error == 'continue'
-            self._location.advance_line()
+                    self.accepted_rows_count += row_index
+                    error_class, message, cell = row_errors[row_index]
+                    self._location.set_line(first_line + row_index)
+                    self._location.set_cell(cell)
+                    raise error_class(message, self._location)
+                rejected_rows_count += 1
+        self.accepted_rows_count += chunk_row_count - rejected_rows_count
+        self.rejected_rows_count += rejected_rows_count
+        self._location.set_line(first_line + chunk_row_count)
 
     def validate_rows(self):
         """
@@ -273,14 +1179,24 @@ class Reader(BaseValidator):
 
         :raises cutplace.errors.DataError: on broken data
         """
-        for _ in self.rows():
+        for _ in self._rows(False):
             pass
 
 
 class Writer(BaseValidator):
-    def __init__(self, cid_or_path, target):
+    def __init__(self, cid_or_path, target, buffer_size=None):
+        """
+        Set up a writer that validates rows against ``cid_or_path`` and
+        writes them to ``target``.
+
+        :param buffer_size: number of rows :py:meth:`~.write_rows` \
+          validates, formats and writes to ``target`` at once; ``None`` \
+          means :py:data:`cutplace.rowio.DEFAULT_WRITE_BUFFER_SIZE`
+        :type buffer_size: int or None
+        """
         assert cid_or_path is not None
         assert target is not None
+        assert (buffer_size is None) or (buffer_size >= 1), 'buffer_size=%r' % buffer_size
 
         super(Writer, self).__init__(cid_or_path)
 
@@ -289,10 +1205,11 @@ class Writer(BaseValidator):
         self._header = data_format.header
         self._delegated_writer = None
         if data_format.format == data.FORMAT_DELIMITED:
-            self._delegated_writer = rowio.DelimitedRowWriter(target, data_format)
+            self._delegated_writer = rowio.DelimitedRowWriter(target, data_format, buffer_size)
         elif data_format.format == data.FORMAT_FIXED:
             self._field_names_and_lengths = interface.field_names_and_lengths(self.cid)
-            self._delegated_writer = rowio.FixedRowWriter(target, data_format, self._field_names_and_lengths)
+            self._delegated_writer = rowio.FixedRowWriter(
+                target, data_format, self._field_names_and_lengths, buffer_size)
         else:
             raise NotImplementedError('data_format=%r' % data_format.format)
 
@@ -304,6 +1221,13 @@ class Writer(BaseValidator):
         """
         return self._delegated_writer.location if self._delegated_writer is not None else None
 
+    @property
+    def buffer_size(self):
+        """
+        Number of rows :py:meth:`~.write_rows` validates and writes at once.
+        """
+        return self._delegated_writer.buffer_size if self._delegated_writer is not None else None
+
     def _padded_fixed_row(self, row):
         """
         Same as ``row`` but with items possibly padded with trailing blanks in order to fix fixed length.
@@ -332,21 +1256,78 @@ class Writer(BaseValidator):
         self._delegated_writer.write_row(actual_row_to_write)
 
     def write_rows(self, rows_to_write):
+        """
+        Validate and write all rows in ``rows_to_write``, which has the
+        same result as calling :py:meth:`~.write_row` for each of them.
+        Rows are processed in blocks of :py:attr:`~.buffer_size` rows:
+        fields are validated one column at a time, and the valid rows are
+        formatted and written to the target at once. In case of a broken
+        row, all rows before it are written and :py:attr:`~.location` points
+        to the broken row, just like with :py:meth:`~.write_row`.
+
+        :raises cutplace.errors.DataError: on broken data
+        """
         assert rows_to_write is not None
+        assert self._delegated_writer is not None
 
-        for row_to_write in rows_to_write:
-            self.write_row(row_to_write)
+        rows_to_write = iter(rows_to_write)
+        while True:
+            block = list(itertools.islice(rows_to_write, self.buffer_size))
+            if not block:
+                break
+            self._write_block(block)
 
-    def close(self):
+    def _write_block(self, rows_to_write):
+        """
+        Validate and write the list ``rows_to_write`` as described in
+        :py:meth:`~.write_rows`.
+        """
+        location = self.location
+        header_row_count = min(max(self._header - location.line, 0), len(rows_to_write))
+        for header_row in rows_to_write[:header_row_count]:
+            self.write_row(header_row)
+        rows_to_validate = rows_to_write[header_row_count:] if header_row_count > 0 else rows_to_write
+        if not rows_to_validate:
+            return
+
+        start_line = location.line
+        row_validator = self._compiled_row_validator
+        row_index_to_field_error_map = row_validator.broken_rows(rows_to_validate)
+        row_location = location.copy_at(start_line)
+        row_index = 0
         try:
-            super(Writer, self).close()
+            for row_index, row in enumerate(rows_to_validate):
+                row_location.set_line(start_line + row_index)
+                if row_index in row_index_to_field_error_map:
+                    row_validator.raise_broken_row(row, row_index_to_field_error_map[row_index], row_location)
+                row_validator.check_row(row, row_location)
+        except errors.DataError:
+            # Write the valid rows before the broken one and point to it.
+            if row_index > 0:
+                self._write_validated_rows(rows_to_validate[:row_index])
+            location.set_cell(row_location.cell)
+            raise
+        self._write_validated_rows(rows_to_validate)
+
+    def _write_validated_rows(self, rows_to_write):
+        if self.cid.data_format.format == data.FORMAT_FIXED:
+            fixed_field_lengths = [field_length for _, field_length in self._field_names_and_lengths]
+            rows_to_write = [
+                [field_value.ljust(field_length) for field_value, field_length in zip(row, fixed_field_lengths)]
+                for row in rows_to_write]
+        self._delegated_writer.write_block(rows_to_write)
+
+    def close(self, check_at_end=True):
+        try:
+            super(Writer, self).close(check_at_end)
         finally:
             if self._delegated_writer is not None:
                 self._delegated_writer.close()
                 self._delegated_writer = None
 
 
-def rows(cid_or_path, data_stream_or_path, on_error='raise', validate_until=None):
+def rows(cid_or_path, data_stream_or_path, on_error='raise', validate_until=None, jobs=1, row_range=None,
+         batch_size=1, checkpoint_path=None):
     """
     Rows read from ``data`` and validated against ``cid_or_path``.
 
@@ -357,6 +1338,11 @@ def rows(cid_or_path, data_stream_or_path, on_error='raise', validate_until=None
     :param str on_error: same as ``on_error`` for :py:class:`cutplace.Reader`
     :param validate_until: same as ``on_error`` for \
       :py:class:`cutplace.Reader`
+    :param int jobs: same as ``jobs`` for :py:class:`cutplace.Reader`
+    :param row_range: same as ``row_range`` for :py:class:`cutplace.Reader`
+    :param batch_size: same as ``batch_size`` for :py:class:`cutplace.Reader`
+    :param checkpoint_path: same as ``checkpoint_path`` for \
+      :py:class:`cutplace.Reader`
     :raises cutplace.errors.DataError: on broken data but only in case \
       ``on_error='raise'`` (the default)
     :raises cutplace.errors.InterfaceError: on a broken CID
@@ -365,13 +1351,16 @@ def rows(cid_or_path, data_stream_or_path, on_error='raise', validate_until=None
     assert data_stream_or_path is not None
     assert on_error in _VALID_ON_ERROR_CHOICES, 'on_error=%r' % on_error
     assert (validate_until is None) or (validate_until >= 0)
+    assert jobs >= 1
 
-    with Reader(cid_or_path, data_stream_or_path, on_error, validate_until) as reader:
+    with Reader(
+            cid_or_path, data_stream_or_path, on_error, validate_until, jobs, row_range, batch_size,
+            checkpoint_path) as reader:
         for row in reader.rows():
             yield row
 
 
-def validate(cid_or_path, data_stream_or_path, validate_until=None):
+def validate(cid_or_path, data_stream_or_path, validate_until=None, jobs=1, checkpoint_path=None):
     """
     Validate that ``data_or_path`` conform to ``cid_or_path``.
 
@@ -379,16 +1368,45 @@ def validate(cid_or_path, data_stream_or_path, validate_until=None):
       describing a path pointing to a CID
     :param data_stream_or_path: filelike object or :py:class:`str` \
       describing a path pointing to the data to be read
+    :param int jobs: same as ``jobs`` for :py:class:`cutplace.Reader`
+    :param checkpoint_path: same as ``checkpoint_path`` for \
+      :py:class:`cutplace.Reader`, which allows to only validate the rows \
+      appended to a data file since the last validation
     :raises cutplace.errors.DataError: on broken data
     :raises cutplace.errors.InterfaceError: on a broken CID
     """
     assert cid_or_path is not None
     assert data_stream_or_path is not None
     assert (validate_until is None) or (validate_until >= 0)
+    assert jobs >= 1
 
-    with Reader(cid_or_path, data_stream_or_path, validate_until=validate_until) as reader:
+    with Reader(
+            cid_or_path, data_stream_or_path, validate_until=validate_until, jobs=jobs,
+            checkpoint_path=checkpoint_path) as reader:
         rows_to_validate = reader.rows()
         if validate_until is not None:
             rows_to_validate = itertools.islice(rows_to_validate, validate_until)
         for _ in rows_to_validate:
             pass
+
+
+def async_rows(cid_or_path, source, on_error='raise', validate_until=None, buffer_size=None):
+    """
+    Rows read from the :py:class:`asyncio.StreamReader` or asynchronous
+    iterable ``source`` and validated against ``cid_or_path``, which have
+    to be iterated using ``async for``. This only supports delimited data
+    and requires Python 3.6 or later.
+
+    :param str on_error: same as ``on_error`` for :py:class:`cutplace.Reader`
+    :param validate_until: same as ``validate_until`` for \
+      :py:class:`cutplace.Reader`
+    :param buffer_size: same as ``buffer_size`` for \
+      :py:class:`cutplace.aio.AsyncReader`
+    :raises cutplace.errors.DataError: on broken data but only in case \
+      ``on_error='raise'`` (the default)
+    :raises NotImplementedError: if the data format is not delimited
+    """
+    # Import here because `cutplace.aio` requires Python 3.6 and most validations do not use asyncio.
+    from cutplace import aio
+
+    return aio.async_rows(cid_or_path, source, on_error, validate_until, buffer_size)
@@ -0,0 +1,535 @@
+#!/usr/bin/env python
+"""
+Benchmarks for reading and validating data in all formats and for the
+building blocks used during validation such as field formats, ranges and
+checks.
+
+The results are written as JSON so they can be compared across releases.
+To run the benchmarks, use for example::
+
+    python -m tests.benchmark --rows 100000 --output build/benchmark.json
+"""
+# Copyright (C) 2009-2015 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import argparse
+import io
+import json
+import logging
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from xml.sax.saxutils import escape
+
+import six
+
+from cutplace import __version__
+from cutplace import checks
+from cutplace import data
+from cutplace import errors
+from cutplace import fields
+from cutplace import interface
+from cutplace import ranges
+from cutplace import rowio
+from cutplace import validio
+from cutplace import _tools
+from tests import dev_test
+
+try:
+    import tracemalloc
+except ImportError:  # pragma: no cover
+    # Python 2 has no tracemalloc, so peak memory is reported as ``None``.
+    tracemalloc = None
+
+_log = logging.getLogger("cutplace.benchmark")
+
+#: Data format to benchmark reading and validation of delimited data.
+FORMAT_DELIMITED = data.FORMAT_DELIMITED
+#: Data format to benchmark reading and validation of Excel data.
+FORMAT_EXCEL = data.FORMAT_EXCEL
+#: Data format to benchmark reading and validation of fixed data.
+FORMAT_FIXED = data.FORMAT_FIXED
+#: Data format to benchmark reading and validation of ODS data.
+FORMAT_ODS = data.FORMAT_ODS
+#: All data formats that can be benchmarked.
+FORMATS = [FORMAT_DELIMITED, FORMAT_EXCEL, FORMAT_FIXED, FORMAT_ODS]
+
+#: Default number of rows to validate per data format.
+DEFAULT_ROW_COUNT = 10000
+#: Default seed for the random number generator used to build test data.
+DEFAULT_SEED = 0
+
+# Benchmark kinds as stored in the JSON results.
+_KIND_CHECK = 'check'
+_KIND_FIELD_FORMAT = 'field_format'
+_KIND_RANGE = 'range'
+_KIND_ROWS = 'rows'
+
+# Use the most precise timer available; Python 2 only has ``time.time()``.
+_timer = getattr(time, 'perf_counter', time.time)
+
+_BRANCH_IDS = ['38000', '38053', '38111']
+
+# Number of choices for the benchmark of a Choice field with a large vocabulary.
+_MANY_CHOICES_COUNT = 10000
+
+# Field names and lengths used for the customers data; the lengths are only
+# relevant for fixed data.
+_CUSTOMER_FIELD_NAMES_AND_LENGTHS = [
+    ('branch_id', 5),
+    ('customer_id', 9),
+    ('first_name', 12),
+    ('surname', 12),
+    ('gender', 1),
+    ('date_of_birth', 10),
+]
+
+_CUSTOMER_FIELD_TYPES_AND_RULES = [
+    ('Choice', ', '.join(_BRANCH_IDS)),
+    ('Integer', '0:999999999'),
+    ('Text', ''),
+    ('Text', ''),
+    ('Choice', 'F, M, X'),
+    ('DateTime', 'DD.MM.YYYY'),
+]
+
+_ODS_CONTENT_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<office:document-content'
+    ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+    ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+    ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0" office:version="1.2">'
+    '<office:body><office:spreadsheet><table:table table:name="customers">%s</table:table>'
+    '</office:spreadsheet></office:body></office:document-content>')
+
+
+def customer_rows(row_count, seed=DEFAULT_SEED):
+    """
+    Rows of random customers; the same ``seed`` yields the same rows every
+    time.
+    """
+    assert row_count >= 0
+
+    random_generator = random.Random(seed)
+    for customer_id in range(row_count):
+        # Reuse the names from `dev_test` but draw from our own generator so
+        # that other users of `random` cannot change the data.
+        gender = random_generator.choice('FFFFFFFFFMMMMMMMMMMX')
+        if gender == 'M':
+            first_name = random_generator.choice(dev_test._MALE_NAMES)
+        else:
+            first_name = random_generator.choice(dev_test._FEMALE_NAMES)
+        yield [
+            random_generator.choice(_BRANCH_IDS),
+            six.text_type(customer_id),
+            first_name,
+            random_generator.choice(dev_test._SURNAMES),
+            gender,
+            '%02d.%02d.%04d' % (
+                random_generator.randint(1, 28), random_generator.randint(1, 12),
+                random_generator.randint(1930, 2010)),
+        ]
+
+
+def customers_cid_text(format_name, branch_ids=None):
+    """
+    Text of a CID in CSV format describing the customers data yielded by
+    :py:func:`customer_rows` for ``format_name``. To reject the rows of some
+    branches, specify the accepted ``branch_ids``.
+    """
+    assert format_name in FORMATS
+
+    cid_lines = ['d,format,%s' % format_name]
+    if format_name == FORMAT_FIXED:
+        cid_lines.append('d,line delimiter,lf')
+    if format_name in (FORMAT_DELIMITED, FORMAT_FIXED):
+        cid_lines.append('d,encoding,utf-8')
+    for (field_name, field_length), (field_type, field_rule) in zip(
+            _CUSTOMER_FIELD_NAMES_AND_LENGTHS, _CUSTOMER_FIELD_TYPES_AND_RULES):
+        length_text = six.text_type(field_length) if format_name == FORMAT_FIXED else ''
+        if (field_name == 'branch_id') and (branch_ids is not None):
+            field_rule = ', '.join(branch_ids)
+        cid_lines.append('f,%s,,,%s,%s,"%s"' % (field_name, length_text, field_type, field_rule))
+    cid_lines.append('c,customer must be unique,IsUnique,customer_id')
+    cid_lines.append('c,branches must be limited,DistinctCount,branch_id <= %d' % len(_BRANCH_IDS))
+    return '\n'.join(cid_lines)
+
+
+def _fixed_row(row):
+    result = []
+    for (_, field_length), field_value in zip(_CUSTOMER_FIELD_NAMES_AND_LENGTHS, row):
+        if field_value.isdigit():
+            # HACK: Pad numbers with leading zeros so they remain valid integers.
+            result.append(field_value.rjust(field_length, '0'))
+        else:
+            result.append(field_value.ljust(field_length))
+    return result
+
+
+def write_ods(target_path, rows):
+    """
+    Write ``rows`` of strings to a minimal ODS document in ``target_path``.
+    """
+    assert target_path is not None
+    assert rows is not None
+
+    row_xmls = []
+    for row in rows:
+        cell_xmls = [
+            '<table:table-cell office:value-type="string"><text:p>%s</text:p></table:table-cell>' % escape(cell)
+            for cell in row]
+        row_xmls.append('<table:table-row>%s</table:table-row>' % ''.join(cell_xmls))
+    with zipfile.ZipFile(target_path, 'w', zipfile.ZIP_DEFLATED) as ods_zip:
+        ods_zip.writestr('mimetype', 'application/vnd.oasis.opendocument.spreadsheet')
+        ods_zip.writestr('content.xml', (_ODS_CONTENT_TEMPLATE % ''.join(row_xmls)).encode('utf-8'))
+
+
+def write_customers(target_folder, format_name, row_count, seed=DEFAULT_SEED):
+    """
+    Write ``row_count`` customers in ``format_name`` to a file in
+    ``target_folder`` and return its path.
+    """
+    assert target_folder is not None
+    assert format_name in FORMATS
+
+    suffix = {
+        FORMAT_DELIMITED: 'csv',
+        FORMAT_EXCEL: 'xlsx',
+        FORMAT_FIXED: 'txt',
+        FORMAT_ODS: 'ods',
+    }[format_name]
+    result = os.path.join(target_folder, 'customers_%d.%s' % (row_count, suffix))
+    rows = customer_rows(row_count, seed)
+    if format_name == FORMAT_DELIMITED:
+        data_format = data.DataFormat(FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ENCODING, 'utf-8')
+        data_format.validate()
+        with rowio.DelimitedRowWriter(result, data_format) as delimited_writer:
+            delimited_writer.write_rows(rows)
+    elif format_name == FORMAT_EXCEL:
+        with rowio.XlsxRowWriter(result) as excel_writer:
+            # NOTE: XlsxRowWriter has no target stream, so write_rows() cannot be used.
+            for row in rows:
+                excel_writer.write_row(row)
+    elif format_name == FORMAT_FIXED:
+        data_format = data.DataFormat(FORMAT_FIXED)
+        data_format.set_property(data.KEY_ENCODING, 'utf-8')
+        data_format.set_property(data.KEY_LINE_DELIMITER, 'lf')
+        data_format.validate()
+        with rowio.FixedRowWriter(result, data_format, _CUSTOMER_FIELD_NAMES_AND_LENGTHS) as fixed_writer:
+            fixed_writer.write_rows(_fixed_row(row) for row in rows)
+    else:
+        assert format_name == FORMAT_ODS
+        write_ods(result, rows)
+    return result
+
+
+def _measured(function_to_measure, measure_memory):
+    """
+    Tuple ``(seconds, peak_memory_bytes)`` to call ``function_to_measure``.
+    The peak memory is determined in a separate call so tracing does not
+    distort the time; it is ``None`` if ``measure_memory`` is ``False`` or
+    tracing is unavailable.
+    """
+    start_time = _timer()
+    function_to_measure()
+    seconds = max(_timer() - start_time, 1e-9)
+    peak_memory_bytes = None
+    if measure_memory and tracemalloc is not None:
+        tracemalloc.start()
+        try:
+            function_to_measure()
+            _, peak_memory_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    return seconds, peak_memory_bytes
+
+
+def _result(name, kind, item_count, function_to_measure, measure_memory):
+    seconds, peak_memory_bytes = _measured(function_to_measure, measure_memory)
+    result = {
+        'name': name,
+        'kind': kind,
+        'items': item_count,
+        'seconds': seconds,
+        'items_per_second': item_count / seconds,
+        'peak_memory_bytes': peak_memory_bytes,
+    }
+    _log.info('  %s: %.0f items/s', name, result['items_per_second'])
+    return result
+
+
+def rows_results(format_names, row_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for reading and validating ``row_count`` customers in each of
+    ``format_names``.
+    """
+    result = []
+    target_folder = tempfile.mkdtemp(prefix='cutplace_benchmark_')
+    try:
+        for format_name in format_names:
+            cid = interface.create_cid_from_string(customers_cid_text(format_name))
+            data_path = write_customers(target_folder, format_name, row_count, seed)
+
+            for benchmark_suffix, batch_size in (('', 1), ('_batched', validio.DEFAULT_BATCH_SIZE)):
+                def validate_customers():
+                    with validio.Reader(cid, data_path, batch_size=batch_size) as reader:
+                        reader.validate_rows()
+
+                result.append(_result(
+                    'validate_' + format_name + benchmark_suffix, _KIND_ROWS, row_count, validate_customers,
+                    measure_memory))
+    finally:
+        shutil.rmtree(target_folder)
+    return result
+
+
+def rejected_rows_results(row_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for reading ``row_count`` delimited customers of which about a
+    third is rejected for each ``on_error`` that does not raise.
+    """
+    result = []
+    target_folder = tempfile.mkdtemp(prefix='cutplace_benchmark_')
+    try:
+        cid = interface.create_cid_from_string(customers_cid_text(FORMAT_DELIMITED, _BRANCH_IDS[:-1]))
+        data_path = write_customers(target_folder, FORMAT_DELIMITED, row_count, seed)
+        for on_error in ('continue', 'record', 'yield'):
+            def read_customers():
+                with validio.Reader(cid, data_path, on_error) as reader:
+                    for _ in reader.rows():
+                        pass
+
+            result.append(_result(
+                'validate_' + FORMAT_DELIMITED + '_rejected_' + on_error, _KIND_ROWS, row_count, read_customers,
+                measure_memory))
+    finally:
+        shutil.rmtree(target_folder)
+    return result
+
+
+def write_rows_results(format_names, row_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for validating and writing ``row_count`` customers in each of
+    ``format_names`` that :py:class:`cutplace.validio.Writer` supports, one
+    row at a time and in blocks of
+    :py:data:`cutplace.rowio.DEFAULT_WRITE_BUFFER_SIZE` rows.
+    """
+    result = []
+    for format_name in format_names:
+        if format_name not in (FORMAT_DELIMITED, FORMAT_FIXED):
+            continue
+        cid_text = customers_cid_text(format_name)
+        rows = list(customer_rows(row_count, seed))
+        if format_name == FORMAT_FIXED:
+            rows = [_fixed_row(row) for row in rows]
+
+        def write_customers_row_by_row():
+            with validio.Writer(interface.create_cid_from_string(cid_text), io.StringIO()) as writer:
+                for row in rows:
+                    writer.write_row(row)
+
+        def write_customers_buffered():
+            with validio.Writer(interface.create_cid_from_string(cid_text), io.StringIO()) as writer:
+                writer.write_rows(rows)
+
+        result.append(_result(
+            'write_' + format_name, _KIND_ROWS, row_count, write_customers_row_by_row, measure_memory))
+        result.append(_result(
+            'write_' + format_name + '_buffered', _KIND_ROWS, row_count, write_customers_buffered, measure_memory))
+    return result
+
+
+def _field_formats_and_values(item_count, seed):
+    delimited_format = data.DataFormat(FORMAT_DELIMITED)
+    delimited_format.validate()
+    rows = list(customer_rows(item_count, seed))
+    random_generator = random.Random(seed)
+    many_choices = ['P%05d' % choice_index for choice_index in range(_MANY_CHOICES_COUNT)]
+    return [
+        (fields.ChoiceFieldFormat('branch_id', False, '', ', '.join(_BRANCH_IDS), delimited_format),
+         [row[0] for row in rows]),
+        (fields.ChoiceFieldFormat('product_id', False, '', ', '.join(many_choices), delimited_format),
+         [random_generator.choice(many_choices) for _ in range(item_count)]),
+        (fields.ConstantFieldFormat('x', False, '', 'x', delimited_format), ['x'] * item_count),
+        (fields.DateTimeFieldFormat('date_of_birth', False, '', 'DD.MM.YYYY', delimited_format),
+         [row[5] for row in rows]),
+        (fields.DecimalFieldFormat('amount', False, '', '', delimited_format),
+         ['%d.%02d' % (random_generator.randint(0, 99999), random_generator.randint(0, 99))
+          for _ in range(item_count)]),
+        (fields.IntegerFieldFormat('customer_id', False, '', '0:999999999', delimited_format),
+         [row[1] for row in rows]),
+        (fields.PatternFieldFormat('surname', False, '', '?*', delimited_format), [row[3] for row in rows]),
+        (fields.RegExFieldFormat('first_name', False, '', '^[A-Z][a-z]+$', delimited_format),
+         [row[2] for row in rows]),
+        (fields.TextFieldFormat('surname', False, '', '', delimited_format), [row[3] for row in rows]),
+    ]
+
+
+def field_format_results(item_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for :py:meth:`cutplace.fields.AbstractFieldFormat.validated`
+    and :py:meth:`cutplace.fields.AbstractFieldFormat.validated_column`
+    with ``item_count`` values for each kind of field format.
+    """
+    result = []
+    for field_format, values in _field_formats_and_values(item_count, seed):
+        def validate_values():
+            validated = field_format.validated
+            for value in values:
+                validated(value)
+
+        def validate_column():
+            field_format.validated_column(values)
+
+        benchmark_name = type(field_format).__name__
+        if isinstance(field_format, fields.ChoiceFieldFormat):
+            benchmark_name += '_%d' % len(field_format.choices)
+        result.append(_result(benchmark_name, _KIND_FIELD_FORMAT, item_count, validate_values, measure_memory))
+        result.append(_result(
+            benchmark_name + '_column', _KIND_FIELD_FORMAT, item_count, validate_column, measure_memory))
+    return result
+
+
+def range_results(item_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for :py:meth:`cutplace.ranges.Range.validate` with
+    ``item_count`` values for ranges of increasing complexity.
+    """
+    result = []
+    random_generator = random.Random(seed)
+    for range_name, range_description in [
+            ('single_range', '1:999999'),
+            ('many_ranges', ', '.join('%d:%d' % (lower, lower + 9) for lower in range(0, 1000, 10))),
+            ('many_values', ', '.join(six.text_type(value) for value in range(0, 1000, 3)))]:
+        range_to_validate = ranges.Range(range_description)
+        values = [random_generator.randrange(3, 1000, 3) for _ in range(item_count)]
+
+        def validate_values():
+            validate = range_to_validate.validate
+            for value in values:
+                validate('x', value)
+
+        result.append(_result(range_name, _KIND_RANGE, item_count, validate_values, measure_memory))
+    return result
+
+
+def check_results(item_count, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    Results for :py:meth:`cutplace.checks.AbstractCheck.check_row` and
+    :py:meth:`~cutplace.checks.AbstractCheck.check_at_end` with
+    ``item_count`` rows for each kind of check.
+    """
+    result = []
+    field_names = [field_name for field_name, _ in _CUSTOMER_FIELD_NAMES_AND_LENGTHS]
+    field_name_to_value_maps = [dict(zip(field_names, row)) for row in customer_rows(item_count, seed)]
+    branch_count = len(_BRANCH_IDS)
+    for check_name, create_check in [
+            ('IsUniqueCheck', lambda: checks.IsUniqueCheck(
+                'customer must be unique', 'customer_id', field_names)),
+            ('DistinctCountCheck', lambda: checks.DistinctCountCheck(
+                'branches must be limited', 'branch_id <= %d' % branch_count, field_names)),
+            ('DistinctCountCheck_hashed', lambda: checks.DistinctCountCheck(
+                'branches must be limited', 'hashed branch_id <= %d' % branch_count, field_names)),
+            ('DistinctCountCheck_approximate', lambda: checks.DistinctCountCheck(
+                'branches must be limited', 'approximate branch_id <= %d' % branch_count, field_names))]:
+        def check_rows():
+            check = create_check()
+            location = errors.Location('<benchmark>', has_cell=True)
+            try:
+                for field_name_to_value_map in field_name_to_value_maps:
+                    check.check_row(field_name_to_value_map, location)
+                    location.advance_line()
+                check.check_at_end(location)
+            finally:
+                check.cleanup()
+
+        result.append(_result(check_name, _KIND_CHECK, item_count, check_rows, measure_memory))
+    return result
+
+
+def benchmark(format_names=None, row_count=DEFAULT_ROW_COUNT, seed=DEFAULT_SEED, measure_memory=True):
+    """
+    A JSON compatible ``dict`` with the results of all benchmarks.
+    """
+    actual_format_names = format_names if format_names is not None else FORMATS
+    assert row_count >= 1
+    assert set(actual_format_names) <= set(FORMATS)
+
+    _log.info('benchmark with %d rows and seed %d', row_count, seed)
+    results = []
+    results.extend(rows_results(actual_format_names, row_count, seed, measure_memory))
+    results.extend(rejected_rows_results(row_count, seed, measure_memory))
+    results.extend(write_rows_results(actual_format_names, row_count, seed, measure_memory))
+    results.extend(field_format_results(row_count, seed, measure_memory))
+    results.extend(range_results(row_count, seed, measure_memory))
+    results.extend(check_results(row_count, seed, measure_memory))
+    return {
+        'cutplace_version': __version__,
+        'python_version': platform.python_version(),
+        'platform': platform.platform(),
+        'seed': seed,
+        'rows': row_count,
+        'results': results,
+    }
+
+
+def main(arguments):
+    assert arguments is not None
+
+    parser = argparse.ArgumentParser(description='benchmark cutplace and write the results as JSON')
+    parser.add_argument(
+        '-f', '--format', metavar='FORMAT', action='append', choices=FORMATS, dest='formats',
+        help='data format to validate, can be specified multiple times: %s (default: all)'
+        % _tools.human_readable_list(FORMATS))
+    parser.add_argument(
+        '-n', '--rows', metavar='COUNT', type=int, default=DEFAULT_ROW_COUNT, dest='rows',
+        help='number of rows and values to benchmark (default: %d)' % DEFAULT_ROW_COUNT)
+    parser.add_argument(
+        '-s', '--seed', metavar='SEED', type=int, default=DEFAULT_SEED, dest='seed',
+        help='seed for the random test data (default: %d)' % DEFAULT_SEED)
+    parser.add_argument(
+        '--skip-memory', action='store_false', dest='measure_memory',
+        help='skip measuring the peak memory, which takes about the same time as the benchmarks themselves')
+    parser.add_argument(
+        '-o', '--output', metavar='FILE', dest='output_path',
+        help='JSON file to store the results in (default: write to standard output)')
+    args = parser.parse_args(arguments)
+    if args.rows < 1:
+        parser.error('--rows is %d but must be at least 1' % args.rows)
+
+    results = benchmark(args.formats, args.rows, args.seed, args.measure_memory)
+    results_json = six.text_type(json.dumps(results, indent=2, sort_keys=True))
+    if args.output_path is None:
+        print(results_json)
+    else:
+        _log.info('write benchmark results to "%s"', args.output_path)
+        with io.open(args.output_path, 'w', encoding='utf-8') as output_file:
+            output_file.write(results_json)
+            output_file.write('\n')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    logging.basicConfig(level=logging.INFO)
+    main(sys.argv[1:])
@@ -0,0 +1,264 @@
+"""
+Tests for validated input and output using asyncio.
+"""
+# Copyright (C) 2009-2015 Thomas Aglassinger
+#
+# This program is free software: you can redistribute it and/or modify it
+# under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or (at your
+# option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT
+# ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or
+# FITNESS FOR A PARTICULAR PURPOSE.  See the GNU Lesser General Public License
+# for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import sys
+import unittest
+
+import cutplace
+from cutplace import errors
+from cutplace import interface
+from cutplace import validio
+from tests import dev_test
+
+if sys.version_info >= (3, 6):
+    import asyncio
+
+    from cutplace import aio
+
+_NOTE_CID = interface.create_cid_from_string('\n'.join([
+    'd,format,delimited',
+    'd,encoding,utf-8',
+    'f,id,,,,Integer',
+    'f,note,,X',
+]))
+
+_NOTE_DATA = '1,simple\n2,"quoted, with ""quotes"""\n3,"two\nlines"\n4,\n5,"a\n""b""\nc"\n'
+
+
+class _ChunkIterable(object):
+    """
+    Asynchronous iterable producing ``chunks``.
+    """
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    def __anext__(self):
+        result = asyncio.get_event_loop().create_future()
+        try:
+            result.set_result(next(self._chunks))
+        except StopIteration:
+            result.set_exception(StopAsyncIteration())
+        return result
+
+
+class _DrainTarget(object):
+    """
+    Target for :py:class:`cutplace.aio.AsyncWriter` remembering the data
+    written to it.
+    """
+    def __init__(self):
+        self.data = b''
+        self.drain_count = 0
+
+    def write(self, data):
+        self.data += data
+
+    def drain(self):
+        self.drain_count += 1
+        return asyncio.sleep(0)
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'asyncio support requires Python 3.6 or later')
+class AsyncRowsTest(unittest.TestCase):
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self._loop.close()
+
+    def _stream_reader(self, data_to_read):
+        result = asyncio.StreamReader()
+        result.feed_data(data_to_read)
+        result.feed_eof()
+        return result
+
+    def _collected_rows(self, async_rows):
+        result = []
+        row_iterator = async_rows.__aiter__()
+        while True:
+            try:
+                result.append(self._loop.run_until_complete(row_iterator.__anext__()))
+            except StopAsyncIteration:
+                return result
+
+    def test_can_read_rows_from_stream_reader(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('icd_customers.xls'))
+        data_path = dev_test.path_to_test_data('valid_customers.csv')
+        with io.open(data_path, 'rb') as data_stream:
+            data_to_read = data_stream.read()
+        expected_rows = list(validio.rows(cid, data_path))
+        for buffer_size in (None, 1, 7, 100):
+            actual_rows = self._collected_rows(
+                cutplace.async_rows(cid, self._stream_reader(data_to_read), buffer_size=buffer_size))
+            self.assertEqual(expected_rows, actual_rows)
+
+    def test_can_read_rows_split_at_any_position(self):
+        expected_rows = list(validio.rows(_NOTE_CID, io.StringIO(_NOTE_DATA)))
+        self.assertEqual(5, len(expected_rows))
+        for chunk_size in range(1, len(_NOTE_DATA) + 1):
+            chunks = [_NOTE_DATA[start:start + chunk_size] for start in range(0, len(_NOTE_DATA), chunk_size)]
+            actual_rows = self._collected_rows(aio.async_rows(_NOTE_CID, _ChunkIterable(chunks)))
+            self.assertEqual(expected_rows, actual_rows, 'chunk_size=%d' % chunk_size)
+
+    def test_can_read_large_chunks_in_parts(self):
+        data_to_read = _NOTE_DATA.encode('utf-8')
+        with aio.AsyncReader(_NOTE_CID, _ChunkIterable([data_to_read]), buffer_size=3) as reader:
+            actual_rows = self._collected_rows(reader.rows())
+        self.assertEqual(list(validio.rows(_NOTE_CID, io.StringIO(_NOTE_DATA))), actual_rows)
+
+    def test_can_decode_characters_split_across_chunks(self):
+        data_to_read = '1,ä€\n2,ö\n'.encode('utf-8')
+        chunks = [data_to_read[start:start + 1] for start in range(len(data_to_read))]
+        actual_rows = self._collected_rows(aio.async_rows(_NOTE_CID, _ChunkIterable(chunks)))
+        self.assertEqual([['1', 'ä€'], ['2', 'ö']], actual_rows)
+
+    def test_can_read_rows_before_end_of_data(self):
+        stream_reader = asyncio.StreamReader()
+        stream_reader.feed_data(b'1,first\n2,sec')
+        row_iterator = aio.async_rows(_NOTE_CID, stream_reader).__aiter__()
+        self.assertEqual(['1', 'first'], self._loop.run_until_complete(row_iterator.__anext__()))
+        stream_reader.feed_data(b'ond\n')
+        stream_reader.feed_eof()
+        self.assertEqual(['2', 'second'], self._loop.run_until_complete(row_iterator.__anext__()))
+        self.assertRaises(StopAsyncIteration, self._loop.run_until_complete, row_iterator.__anext__())
+
+    def test_can_yield_same_errors_as_reader(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('icd_customers.xls'))
+        data_path = dev_test.path_to_test_data('broken_customers.csv')
+        with io.open(data_path, 'rb') as data_stream:
+            data_to_read = data_stream.read()
+        for on_error in ('yield', 'record'):
+            expected_rows = [
+                str(row) for row in validio.rows(cid, io.StringIO(data_to_read.decode('cp1252')), on_error=on_error)]
+            with aio.AsyncReader(cid, self._stream_reader(data_to_read), on_error=on_error, buffer_size=50) as reader:
+                actual_rows = [str(row) for row in self._collected_rows(reader.rows())]
+            self.assertEqual(expected_rows, actual_rows)
+            self.assertNotEqual(0, reader.rejected_rows_count)
+
+    def test_fails_on_broken_field(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('icd_customers.xls'))
+        data_path = dev_test.path_to_test_data('broken_customers.csv')
+        with io.open(data_path, 'rb') as data_stream:
+            data_to_read = data_stream.read()
+        try:
+            list(validio.rows(cid, io.StringIO(data_to_read.decode('cp1252'))))
+            self.fail('broken data must cause error')
+        except errors.FieldValueError as error:
+            expected_message = str(error)
+        try:
+            self._collected_rows(aio.async_rows(cid, self._stream_reader(data_to_read), buffer_size=10))
+            self.fail('broken data must cause error')
+        except errors.FieldValueError as error:
+            self.assertEqual(expected_message, str(error))
+
+    def test_fails_on_unterminated_quote_at_same_location_as_reader(self):
+        data_to_read = '1,one\n2,"two\nlines"\n3,"three\n4,four\n'
+        try:
+            list(validio.rows(_NOTE_CID, io.StringIO(data_to_read)))
+            self.fail('broken data must cause error')
+        except errors.DataFormatError as error:
+            expected_message = str(error)
+        try:
+            self._collected_rows(aio.async_rows(_NOTE_CID, _ChunkIterable([data_to_read[:9], data_to_read[9:]])))
+            self.fail('broken data must cause error')
+        except errors.DataFormatError as error:
+            self.assertEqual(expected_message, str(error))
+
+    def test_fails_on_broken_encoding(self):
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, '* (4): cannot decode delimited data: *',
+            self._collected_rows, aio.async_rows(_NOTE_CID, _ChunkIterable([b'1,one\n2,"two\nlines"\n3,\xff\n'])))
+
+    def test_fails_on_check_at_end(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('icd_customers.xls'))
+        data_path = dev_test.path_to_test_data('broken_customers_with_too_many_branches.csv')
+        with io.open(data_path, 'rb') as data_stream:
+            data_to_read = data_stream.read()
+        self.assertRaises(errors.CheckError, list, validio.rows(cid, data_path))
+        self.assertRaises(
+            errors.CheckError, self._collected_rows, aio.async_rows(cid, self._stream_reader(data_to_read)))
+
+    def test_fails_on_fixed_data(self):
+        cid = interface.Cid(dev_test.path_to_test_cid('customers_fixed.xls'))
+        self.assertRaises(NotImplementedError, aio.AsyncReader, cid, _ChunkIterable([]))
+
+
+@unittest.skipIf(sys.version_info < (3, 6), 'asyncio support requires Python 3.6 or later')
+class AsyncWriterTest(unittest.TestCase):
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self._loop.close()
+
+    def _expected_data(self, cid, rows_to_write):
+        with io.StringIO(newline='') as expected_stream:
+            with validio.Writer(cid, expected_stream) as writer:
+                writer.write_rows(rows_to_write)
+            return expected_stream.getvalue().encode(cid.data_format.encoding)
+
+    def test_can_write_same_data_as_writer(self):
+        rows_to_write = list(validio.rows(_NOTE_CID, io.StringIO(_NOTE_DATA)))
+        for cid in (_NOTE_CID, interface.Cid(dev_test.path_to_test_cid('customers_fixed.xls'))):
+            if cid is not _NOTE_CID:
+                rows_to_write = [
+                    dev_test.create_test_customer_row(customer_id) for customer_id in range(10)]
+            target = _DrainTarget()
+            async_writer = aio.AsyncWriter(cid, target)
+            self._loop.run_until_complete(async_writer.write_rows(rows_to_write))
+            self.assertEqual(b'', target.data)
+            self._loop.run_until_complete(async_writer.close())
+            self.assertEqual(self._expected_data(cid, rows_to_write), target.data)
+            self.assertEqual(1, target.drain_count)
+
+    def test_can_drain_target_once_buffer_is_full(self):
+        rows_to_write = [[str(row_index), 'note %d' % row_index] for row_index in range(100)]
+        target = _DrainTarget()
+        async_writer = aio.AsyncWriter(_NOTE_CID, target, buffer_size=1)
+        self._loop.run_until_complete(async_writer.write_row(rows_to_write[0]))
+        self.assertEqual(b'0,note 0\r\n', target.data)
+        self._loop.run_until_complete(async_writer.write_rows(rows_to_write[1:]))
+        self._loop.run_until_complete(async_writer.close())
+        self.assertEqual(self._expected_data(_NOTE_CID, rows_to_write), target.data)
+        self.assertLess(1, target.drain_count)
+
+    def test_fails_on_broken_field(self):
+        target = _DrainTarget()
+        async_writer = aio.AsyncWriter(_NOTE_CID, target)
+        self._loop.run_until_complete(async_writer.write_row(['1', 'one']))
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "*(R2C1): cannot accept field 'id': *",
+            self._loop.run_until_complete, async_writer.write_row(['x', 'broken']))
+        self._loop.run_until_complete(async_writer.close())
+        self.assertEqual(b'1,one\r\n', target.data)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -22,6 +22,7 @@ from __future__ import unicode_literals
 
 import logging
 import os
+import shutil
 import unittest
 
 import six
@@ -60,6 +61,52 @@ class CutplaceAppTest(unittest.TestCase):
         self._cutplace_app.validate(self._valid_customers_csv_path)
         self.assertFalse(self._cutplace_app.all_validations_were_ok)
 
+    def _data_paths_to_validate_all(self):
+        return [
+            self._valid_customers_csv_path,
+            dev_test.path_to_test_data('broken_customers.csv'),
+            self._valid_customers_csv_path,
+            self._broken_customers_non_csv_path,
+        ]
+
+    def test_can_validate_all_in_parallel(self):
+        data_paths = self._data_paths_to_validate_all()
+        self._cutplace_app.validate_all(data_paths)
+        expected_validation_results = self._cutplace_app.validation_results
+        self.assertEqual(len(data_paths), len(expected_validation_results))
+        self.assertFalse(self._cutplace_app.all_validations_were_ok)
+
+        parallel_cutplace_app = applications.CutplaceApp()
+        parallel_cutplace_app.set_cid_from_path(dev_test.path_to_test_cid('customers.ods'))
+        parallel_cutplace_app.jobs = 3
+        parallel_cutplace_app.validate_all(data_paths)
+        self.assertEqual(expected_validation_results, parallel_cutplace_app.validation_results)
+        self.assertFalse(parallel_cutplace_app.all_validations_were_ok)
+
+    def test_can_group_log_of_validate_all_in_parallel(self):
+        log_messages = []
+
+        class _MessageCollector(logging.Handler):
+            def emit(self, record):
+                log_messages.append(record.getMessage())
+
+        data_paths = self._data_paths_to_validate_all()
+        message_collector = _MessageCollector()
+        old_log_level = _log.level
+        _log.addHandler(message_collector)
+        _log.setLevel(logging.INFO)
+        try:
+            self._cutplace_app.jobs = 2
+            self._cutplace_app.validate_all(data_paths)
+        finally:
+            _log.setLevel(old_log_level)
+            _log.removeHandler(message_collector)
+        validate_messages = [message for message in log_messages if message.startswith('validate "')]
+        self.assertEqual(['validate "%s"' % data_path for data_path in data_paths], validate_messages)
+        for data_path_index in range(len(data_paths)):
+            validate_message_index = log_messages.index(validate_messages[data_path_index])
+            self.assertTrue(log_messages[validate_message_index + 1].startswith('  '))
+
 
 class CutplaceProcessTest(unittest.TestCase):
     """
@@ -106,6 +153,82 @@ class CutplaceProcessTest(unittest.TestCase):
         exit_code = applications.process(['test_can_validate_proper_csv', cid_path, csv_path])
         self.assertEqual(0, exit_code)
 
+    def test_can_validate_proper_csv_with_jobs(self):
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        exit_code = applications.process(['test_can_validate_proper_csv_with_jobs', '--jobs', '2', cid_path, csv_path])
+        self.assertEqual(0, exit_code)
+
+    def test_can_validate_proper_csv_with_cid_cache(self):
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        cache_folder = dev_test.path_to_test_result('test_can_validate_proper_csv_with_cid_cache')
+        for _ in range(2):
+            exit_code = applications.process(
+                ['test_can_validate_proper_csv_with_cid_cache', '--cid-cache-folder', cache_folder, cid_path, csv_path])
+            self.assertEqual(0, exit_code)
+        self.assertEqual(1, len(os.listdir(cache_folder)))
+
+    def test_can_set_cid_cache_before_cid_path(self):
+        # Copy the CID so the cache next to it ends up in the test results.
+        cid_path = dev_test.path_to_test_result('test_can_set_cid_cache_before_cid_path.ods')
+        shutil.copy(dev_test.path_to_test_cid('customers.ods'), cid_path)
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        cutplace_app = applications.CutplaceApp()
+        cutplace_app.set_options(['test_can_set_cid_cache_before_cid_path', '--cid-cache', cid_path, csv_path])
+        self.assertTrue(cutplace_app.is_cid_cached)
+        self.assertIsNone(cutplace_app.cid_cache_folder)
+        self.assertEqual(cid_path, cutplace_app.cid_path)
+        self.assertEqual([csv_path], cutplace_app.data_paths)
+        self.assertTrue(os.path.exists(cid_path + '.cidcache'))
+
+    def test_can_validate_multiple_files_with_jobs(self):
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        broken_csv_path = dev_test.path_to_test_data('broken_customers.csv')
+        exit_code = applications.process(
+            ['test_can_validate_multiple_files_with_jobs', '--jobs', '2', cid_path, csv_path, csv_path, csv_path])
+        self.assertEqual(0, exit_code)
+        exit_code = applications.process(
+            ['test_can_validate_multiple_files_with_jobs', '--jobs', '2', cid_path, csv_path, broken_csv_path])
+        self.assertEqual(1, exit_code)
+
+    def test_can_log_summary_of_multiple_files_only_with_jobs(self):
+        log_messages = []
+
+        class _MessageCollector(logging.Handler):
+            def emit(self, record):
+                log_messages.append(record.getMessage())
+
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        message_collector = _MessageCollector()
+        old_log_level = _log.level
+        _log.addHandler(message_collector)
+        _log.setLevel(logging.INFO)
+        try:
+            for jobs, expected_summary_count in ((1, 0), (2, 1)):
+                del log_messages[:]
+                applications.process(
+                    ['test_can_log_summary_of_multiple_files_only_with_jobs', '--jobs', '%d' % jobs,
+                     cid_path, csv_path, csv_path])
+                summary_messages = [message for message in log_messages if message.startswith('validated ')]
+                self.assertEqual(expected_summary_count, len(summary_messages), 'jobs=%d' % jobs)
+        finally:
+            _log.setLevel(old_log_level)
+            _log.removeHandler(message_collector)
+
+    def test_fails_on_non_existent_data_with_jobs(self):
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        csv_path = dev_test.path_to_test_data('valid_customers.csv')
+        self.assertRaises(
+            EnvironmentError, applications.process,
+            ['test_fails_on_non_existent_data_with_jobs', '--jobs', '2', cid_path, csv_path, 'no_such_data.csv'])
+
+    def test_fails_on_jobs_less_than_1(self):
+        cid_path = dev_test.path_to_test_cid('customers.ods')
+        self._test_process_exits_with(['--jobs', '0', cid_path], 2)
+
     def test_can_read_cid_with_plugins(self):
         cid_path = dev_test.path_to_test_cid('customers_with_plugins.ods')
         exit_code = applications.process(['test_can_read_cid_with_plugins', '--plugins', dev_test.path_to_test_plugins(),
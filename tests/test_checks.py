@@ -20,11 +20,17 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import copy
+import io
 import logging
+import os
 import unittest
 
 from cutplace import checks
 from cutplace import errors
+from cutplace import interface
+from cutplace import validio
+from tests import dev_test
 
 _TEST_FIELD_NAMES = 'branch_id customer_id first_name surname gender date_of_birth'.split()
 
@@ -92,6 +98,159 @@ class IsUniqueCheckTest(_AbstractCheckTest):
         check.check_at_end(location)
         check.cleanup()
 
+    def test_fails_on_duplicate_in_merged_state(self):
+        field_names = _TEST_FIELD_NAMES
+        location = errors.Location(self.test_fails_on_duplicate_in_merged_state, has_cell=True)
+        check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        first_location = copy.copy(location)
+        location.advance_line()
+        check.check_row(_create_field_map(field_names, [38000, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        location.advance_line()
+
+        other_check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        other_check.check_row(
+            _create_field_map(field_names, [38000, 17, "Mike", "Webster", "male", "23.12.1974"]), location)
+        location.advance_line()
+        other_check.check_row(
+            _create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        duplicate_location = copy.copy(location)
+        try:
+            check.merge_state(other_check.snapshot_state(), location)
+            self.fail("duplicate row in merged state must cause CheckError")
+        except errors.CheckError as error:
+            self.assertEqual(duplicate_location.line, error.location.line)
+            self.assertEqual(first_location.line, error.see_also_location.line)
+            self.assertEqual("values for ['branch_id', 'customer_id'] must be unique", error.message)
+
+    def test_fails_on_duplicate_in_merged_state_with_any_memory_budget(self):
+        field_names = _TEST_FIELD_NAMES
+        rows = [
+            [38000, 23, "John", "Doe", "male", "08.03.1957"],
+            [38000, 59, "Jane", "Miller", "female", "04.10.1946"],
+            [38000, 17, "Mike", "Webster", "male", "23.12.1974"],
+            [38000, 23, "John", "Doe", "male", "08.03.1957"],
+        ]
+        location = errors.Location(
+            self.test_fails_on_duplicate_in_merged_state_with_any_memory_budget, has_cell=True)
+        sequential_check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+        try:
+            for row in rows:
+                sequential_check.check_row(_create_field_map(field_names, row), location)
+                location.advance_line()
+            self.fail("duplicate row must cause CheckError")
+        except errors.CheckError as error:
+            expected_line = error.location.line
+            expected_see_also_line = error.see_also_location.line
+        for memory_budget in (None, 0):
+            location.set_line(0)
+            check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names)
+            other_check = checks.IsUniqueCheck(
+                "test check", "branch_id, customer_id", field_names, memory_budget=memory_budget)
+            for row_index, row in enumerate(rows):
+                (check if row_index < 2 else other_check).check_row(_create_field_map(field_names, row), location)
+                location.advance_line()
+            try:
+                check.merge_state(other_check.snapshot_state(), location)
+                self.fail("duplicate row in merged state must cause CheckError")
+            except errors.CheckError as error:
+                self.assertEqual(expected_line, error.location.line)
+                self.assertEqual(expected_see_also_line, error.see_also_location.line)
+            check.cleanup()
+            other_check.cleanup()
+
+    def test_can_merge_state_parts_on_disk(self):
+        field_names = _TEST_FIELD_NAMES
+        location = errors.Location(self.test_can_merge_state_parts_on_disk, has_cell=True)
+        other_check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names, memory_budget=0)
+        for customer_id in range(25):
+            other_check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            location.advance_line()
+        self.assertTrue(other_check._row_key_store.is_on_disk)
+        state_parts = list(other_check.snapshot_state_parts())
+        self.assertEqual(0, state_parts[0].line)
+        self.assertEqual(25, sum(len(state_part) for state_part in state_parts[1:]))
+
+        check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names, memory_budget=0)
+        check.merge_state_parts(state_parts)
+        self.assertTrue(check._row_key_store.is_on_disk)
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError,
+            "* (R26C1): values for *'branch_id', 'customer_id'* must be unique: (38000, 7) (see also: * (R8C1): *)",
+            check.check_row, _create_field_map(field_names, [38000, 7, "Jane", "Miller", "female", "04.10.1946"]),
+            location)
+        check.cleanup()
+        other_check.cleanup()
+
+    def test_fails_on_duplicate_on_disk(self):
+        field_names = _TEST_FIELD_NAMES
+        # Use a memory budget so small that all keys have to be moved to disk.
+        check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names, memory_budget=0)
+        location = errors.Location(self.test_fails_on_duplicate_on_disk, has_cell=True)
+        for customer_id in range(10):
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            location.advance_line()
+        self.assertTrue(check._row_key_store.is_on_disk)
+        self.assertEqual(10, len(check.snapshot_state()[1]))
+        try:
+            check.check_row(_create_field_map(field_names, [38000, 3, "Jane", "Miller", "female", "04.10.1946"]),
+                            location)
+            self.fail("duplicate row must cause CheckError")
+        except errors.CheckError as error:
+            self.assertEqual(3, error.see_also_location.line)
+            self.assertEqual(10, error.location.line)
+        database_path = check._row_key_store._database_path
+        self.assertTrue(os.path.exists(database_path))
+        check.cleanup()
+        self.assertFalse(os.path.exists(database_path))
+
+    def test_can_look_up_keys_without_digests_until_moved_to_disk(self):
+        field_names = _TEST_FIELD_NAMES
+        location = errors.Location(self.test_can_look_up_keys_without_digests_until_moved_to_disk, has_cell=True)
+        check = checks.IsUniqueCheck("test check", "branch_id, customer_id", field_names, memory_budget=2000)
+        for customer_id in range(5):
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            location.advance_line()
+        self.assertFalse(check._row_key_store.has_digests)
+        self.assertEqual(5, len(check.snapshot_state()[1]))
+        for customer_id in range(5, 100):
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            location.advance_line()
+        self.assertTrue(check._row_key_store.is_on_disk)
+        self.assertTrue(check._row_key_store.has_digests)
+        self.assertLessEqual(check._row_key_store._bytes_in_memory, 2000)
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError,
+            "* (R101C1): values for *'branch_id', 'customer_id'* must be unique: (38000, 3) (see also: * (R4C1): *)",
+            check.check_row, _create_field_map(field_names, [38000, 3, "Jane", "Miller", "female", "04.10.1946"]),
+            location)
+        check.cleanup()
+
+    def test_can_set_memory_budget_in_rule(self):
+        field_names = _TEST_FIELD_NAMES
+        check = checks.IsUniqueCheck("test check", "memory(64) branch_id, customer_id", field_names)
+        self.assertEqual(64 * 1024 * 1024, check.memory_budget)
+        self.assertEqual(['branch_id', 'customer_id'], check._field_names_to_check)
+        check = checks.IsUniqueCheck("test check", "memory(0) customer_id", field_names, memory_budget=1024)
+        self.assertEqual(0, check.memory_budget)
+        self.assertIsNone(checks.IsUniqueCheck("test check", "customer_id", field_names).memory_budget)
+
+    def test_can_use_memory_keyword_as_field_name(self):
+        check = checks.IsUniqueCheck("test check", "memory, other", ['memory', 'other'])
+        self.assertEqual(['memory', 'other'], check._field_names_to_check)
+        self.assertIsNone(check.memory_budget)
+
+    def test_fails_on_broken_memory_budget_in_rule(self):
+        field_names = _TEST_FIELD_NAMES
+        for broken_rule in ("memory(x) customer_id", "memory() customer_id", "memory(1.5) customer_id"):
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.InterfaceError, "*memory for unique keys must be a number of megabytes*",
+                checks.IsUniqueCheck, "test check", broken_rule, field_names)
+
     def test_fails_on_rule_without_fields(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.IsUniqueCheck, "test check", "", field_names)
@@ -139,6 +298,119 @@ class DistinctCountCheckTest(unittest.TestCase):
         check.check_row(_create_field_map(field_names, [38003, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
         self.assertRaises(errors.CheckError, check.check_at_end, location)
 
+    def test_fails_on_too_many_distinct_values_in_merged_state(self):
+        field_names = _TEST_FIELD_NAMES
+        location = errors.Location(self.test_fails_on_too_many_distinct_values_in_merged_state, has_cell=True)
+        check = checks.DistinctCountCheck("test check", "branch_id < 3", field_names)
+        check.check_row(_create_field_map(field_names, [38000, 23, "John", "Doe", "male", "08.03.1957"]), location)
+        location.advance_line()
+        check.check_row(_create_field_map(field_names, [38001, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        location.advance_line()
+        other_check = checks.DistinctCountCheck("test check", "branch_id < 3", field_names)
+        other_check.check_row(
+            _create_field_map(field_names, [38001, 17, "Mike", "Webster", "male", "23.12.1974"]), location)
+        check.merge_state(other_check.snapshot_state(), location)
+        check.check_at_end(location)
+
+        location.advance_line()
+        other_check.check_row(
+            _create_field_map(field_names, [38003, 59, "Jane", "Miller", "female", "04.10.1946"]), location)
+        check.merge_state(other_check.snapshot_state(), location)
+        self.assertRaises(errors.CheckError, check.check_at_end, location)
+
+    def _test_can_count_distinct_values(self, rule, value_count, expected_mode):
+        field_names = _TEST_FIELD_NAMES
+        check = checks.DistinctCountCheck("test check", rule, field_names)
+        self.assertEqual(expected_mode, check.mode)
+        location = errors.Location(self._test_can_count_distinct_values, has_cell=True)
+        for customer_id in range(value_count):
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            # Add every value twice to make sure duplicates are not counted.
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            location.advance_line()
+        return check._distinct_count()
+
+    def test_can_count_distinct_values_exactly(self):
+        self.assertEqual(1000, self._test_can_count_distinct_values(
+            "customer_id == 1000", 1000, checks.DISTINCT_COUNT_EXACT))
+
+    def test_can_count_distinct_values_hashed(self):
+        self.assertEqual(1000, self._test_can_count_distinct_values(
+            "hashed customer_id == 1000", 1000, checks.DISTINCT_COUNT_HASHED))
+
+    def test_can_count_distinct_values_approximately(self):
+        for value_count in (10, 1000, 20000):
+            distinct_count = self._test_can_count_distinct_values(
+                "approximate customer_id > 0", value_count, checks.DISTINCT_COUNT_APPROXIMATE)
+            self.assertTrue(
+                abs(distinct_count - value_count) <= 0.05 * value_count,
+                "distinct_count=%d, value_count=%d" % (distinct_count, value_count))
+
+    def test_can_use_mode_keyword_as_field_name(self):
+        field_names = ['approximate']
+        check = checks.DistinctCountCheck("test check", "approximate < 3", field_names)
+        self.assertEqual(checks.DISTINCT_COUNT_EXACT, check.mode)
+
+    def test_can_set_error_rate_in_rule(self):
+        field_names = _TEST_FIELD_NAMES
+        check = checks.DistinctCountCheck("test check", "approximate(0.05) customer_id > 0", field_names)
+        self.assertEqual(checks.DISTINCT_COUNT_APPROXIMATE, check.mode)
+        self.assertEqual(0.05, check.error_rate)
+        default_check = checks.DistinctCountCheck("test check", "approximate customer_id > 0", field_names)
+        self.assertEqual(checks.DEFAULT_DISTINCT_COUNT_ERROR_RATE, default_check.error_rate)
+        self.assertLess(check._distinct_counter._register_count, default_check._distinct_counter._register_count)
+
+    def test_fails_on_broken_error_rate_in_rule(self):
+        field_names = _TEST_FIELD_NAMES
+        for broken_rule in (
+                "approximate(2) customer_id > 0", "approximate(0) customer_id > 0",
+                "approximate(x) customer_id > 0", "approximate() customer_id > 0"):
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.InterfaceError, "*error rate must be a number between 0 and 1*",
+                checks.DistinctCountCheck, "test check", broken_rule, field_names)
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.InterfaceError, "*only mode 'approximate' can have an error rate but found: 'hashed'",
+            checks.DistinctCountCheck, "test check", "hashed(0.1) customer_id > 0", field_names)
+
+    def test_can_set_mode_and_error_rate_in_cid(self):
+        cid = interface.create_cid_from_string('\n'.join([
+            'd,format,delimited',
+            'f,customer_id,,,,Integer',
+            'c,few hashed customers,DistinctCount,hashed customer_id < 3',
+            'c,few approximate customers,DistinctCount,approximate(0.05) customer_id < 3',
+        ]))
+        hashed_check = cid.check_map['few hashed customers']
+        self.assertEqual(checks.DISTINCT_COUNT_HASHED, hashed_check.mode)
+        approximate_check = cid.check_map['few approximate customers']
+        self.assertEqual(checks.DISTINCT_COUNT_APPROXIMATE, approximate_check.mode)
+        self.assertEqual(0.05, approximate_check.error_rate)
+        with io.StringIO('1\n2\n1\n') as data_stream:
+            self.assertEqual([['1'], ['2'], ['1']], list(validio.rows(cid, data_stream)))
+        with io.StringIO('1\n2\n3\n') as data_stream:
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.CheckError, "*distinct count is 3 but check requires: 'count < 3'",
+                list, validio.rows(cid, data_stream))
+
+    def test_can_merge_approximate_state(self):
+        field_names = _TEST_FIELD_NAMES
+        location = errors.Location(self.test_can_merge_approximate_state, has_cell=True)
+        check = checks.DistinctCountCheck(
+            "test check", "customer_id < 10", field_names, mode=checks.DISTINCT_COUNT_APPROXIMATE)
+        other_check = checks.DistinctCountCheck(
+            "test check", "customer_id < 10", field_names, mode=checks.DISTINCT_COUNT_APPROXIMATE)
+        for customer_id in range(8):
+            check.check_row(
+                _create_field_map(field_names, [38000, customer_id, "John", "Doe", "male", "08.03.1957"]), location)
+            other_check.check_row(
+                _create_field_map(field_names, [38000, customer_id + 4, "John", "Doe", "male", "08.03.1957"]),
+                location)
+        check.check_at_end(location)
+        check.merge_state(other_check.snapshot_state(), location)
+        self.assertEqual(12, check._distinct_count())
+        self.assertRaises(errors.CheckError, check.check_at_end, location)
+
     def test_fails_on_broken_check_rule(self):
         field_names = _TEST_FIELD_NAMES
         self.assertRaises(errors.InterfaceError, checks.DistinctCountCheck, "broken", "", field_names)
@@ -140,6 +140,10 @@ class DataFormatTest(unittest.TestCase):
         self.assertEqual([(97, 122)], delimited_format.allowed_characters.items)
         delimited_format.allowed_characters.validate('x', ord('a'))
         self.assertRaises(errors.RangeValueError, delimited_format.allowed_characters.validate, 'x', ord('*'))
+        self.assertIsNone(delimited_format.invalid_character_regex.search('abc'))
+        self.assertEqual('*', delimited_format.invalid_character_regex.search('ab*c').group())
+        delimited_format.allowed_characters = None
+        self.assertIsNone(delimited_format.invalid_character_regex)
 
     def test_fails_on_invalid_allowed_characters(self):
         delimited_format = data.DataFormat(data.FORMAT_DELIMITED)
@@ -229,6 +233,8 @@ class DataFormatTest(unittest.TestCase):
         excel_format = data.DataFormat(data.FORMAT_EXCEL)
         excel_format.set_property(data.KEY_SHEET, '1')
         self.assertEqual(excel_format.sheet, 1)
+        excel_format.set_property(data.KEY_SHEET, '2')
+        self.assertEqual(excel_format.sheet, 2)
 
     def test_fails_on_non_numeric_sheet(self):
         excel_format = data.DataFormat(data.FORMAT_EXCEL)
@@ -20,10 +20,13 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import copy
 import io
+import pickle
 import unittest
 
 from cutplace import errors
+from cutplace import fields
 from tests import dev_test
 
 
@@ -76,6 +79,24 @@ class LocationTest(unittest.TestCase):
         location = errors.create_caller_location()
         dev_test.assert_fnmatches(self, str(location), 'test_errors.py ([1-9]*)')
 
+    def test_can_copy_location_at_other_position(self):
+        location = errors.Location("eggs.ods", has_cell=True, has_sheet=True)
+        location.advance_sheet()
+        location_copy = location.copy_at(3, cell=4)
+        self.assertEqual(str(location_copy), "eggs.ods (Sheet2!R4C5)")
+        self.assertEqual(str(location), "eggs.ods (Sheet2!R1C1)")
+
+    def test_can_copy_and_pickle_location(self):
+        location = errors.Location("eggs.txt", has_column=True)
+        location.advance_line(2)
+        location.advance_column(3)
+        self.assertFalse(hasattr(location, '__dict__'))
+        for location_copy in (copy.copy(location), pickle.loads(pickle.dumps(location, pickle.HIGHEST_PROTOCOL))):
+            self.assertEqual(location, location_copy)
+            self.assertEqual(str(location_copy), "eggs.txt (3;4)")
+            location_copy.advance_line()
+            self.assertEqual(str(location), "eggs.txt (3;4)")
+
 
 class CutplaceErrorTest(unittest.TestCase):
     def test_can_create_simple_cutplace_error(self):
@@ -100,5 +121,38 @@ class CutplaceErrorTest(unittest.TestCase):
             + '(see also: spam.ods (Sheet1!R1C1): something must be something else)')
 
 
+class DataErrorRecordTest(unittest.TestCase):
+    def test_can_complete_field_error_when_needed(self):
+        field_error = errors.FieldValueError('value must be an integer number: \'x\'')
+        error_record = errors.DataErrorRecord('eggs.csv', 3, 2, 'customer_id', 'x', field_error)
+        self.assertEqual(3, error_record.line)
+        self.assertEqual(2, error_record.field_index)
+        self.assertEqual('customer_id', error_record.field_name)
+        self.assertEqual('x', error_record.value)
+        expected_message = "cannot accept field 'customer_id': value must be an integer number: 'x'"
+        self.assertEqual('eggs.csv (R4C3): ' + expected_message, '%s' % error_record)
+        # Make sure the message is only prepended once.
+        self.assertEqual(expected_message, error_record.message)
+        self.assertIs(field_error, error_record.error)
+        self.assertEqual(3, error_record.location.line)
+        self.assertEqual(2, error_record.location.cell)
+
+    def test_can_build_field_error_from_error_code_when_needed(self):
+        error_record = errors.DataErrorRecord(
+            'eggs.csv', 3, 2, 'customer_id', 'x', (fields.FIELD_ERROR_INTEGER, ('x',)))
+        expected_message = "cannot accept field 'customer_id': value must be an integer number: 'x'"
+        self.assertEqual('eggs.csv (R4C3): ' + expected_message, '%s' % error_record)
+        self.assertIsInstance(error_record.error, errors.FieldValueError)
+        self.assertEqual(expected_message, error_record.message)
+
+    def test_can_keep_complete_error(self):
+        location = errors.Location('eggs.csv', has_cell=True)
+        location.advance_line(3)
+        error = errors.DataError('row must contain 3 fields but only has 2', location)
+        error_record = errors.DataErrorRecord('eggs.csv', 3, None, None, None, error)
+        self.assertIsNone(error_record.field_index)
+        self.assertEqual('eggs.csv (R4C1): row must contain 3 fields but only has 2', '%s' % error_record)
+
+
 if __name__ == '__main__':
     unittest.main()
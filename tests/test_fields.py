@@ -21,8 +21,11 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import datetime
 import decimal
+import io
 import logging
+import time
 import unittest
 
 import six
@@ -30,6 +33,7 @@ import six
 from cutplace import data
 from cutplace import errors
 from cutplace import fields
+from cutplace import interface
 
 from tests import dev_test
 
@@ -121,6 +125,30 @@ class DateTimeFieldFormatTest(unittest.TestCase):
         field_format = fields.DateTimeFieldFormat("x", False, None, "%YYYY-MM-DD", _ANY_FORMAT)
         field_format.validated("%2000-01-01")
 
+    def test_can_parse_same_as_strptime(self):
+        for rule, value in [
+                ("YYYY-MM-DD", "2015-04-01"),
+                ("DD.MM.YYYY hh:mm:ss", "1.4.2015   17:03:59"),
+                ("DD.MM.YY", "01.04.15"),
+                ("DD.MM.YY", "01.04.69"),
+                ("MM-DD", "02-29"),
+                ("hh:mm:ss", "23:59:60"),
+                ("YYYY-MM-DDThh:mm", "2015-04-01t17:03")]:
+            field_format = fields.DateTimeFieldFormat("x", False, None, rule, _ANY_FORMAT)
+            self.assertEqual(time.strptime(value, field_format.strptimeFormat), field_format.validated(value))
+
+    def test_can_validate_as_datetime(self):
+        field_format = fields.DateTimeFieldFormat("x", True, None, "DD.MM.YYYY hh:mm", _ANY_FORMAT, as_datetime=True)
+        self.assertTrue(field_format.as_datetime)
+        self.assertEqual(datetime.datetime(2015, 4, 1, 17, 3), field_format.validated("01.04.2015 17:03"))
+        self.assertEqual(None, field_format.validated(""))
+        self.assertRaises(errors.FieldValueError, field_format.validated, "29.02.2015 17:03")
+
+    def test_fails_on_leap_second_as_datetime(self):
+        field_format = fields.DateTimeFieldFormat("x", False, None, "hh:mm:ss", _ANY_FORMAT, as_datetime=True)
+        self.assertEqual(datetime.datetime(1900, 1, 1, 23, 59, 59), field_format.validated("23:59:59"))
+        self.assertRaises(errors.FieldValueError, field_format.validated, "23:59:60")
+
 
 class DecimalFieldFormatTest(unittest.TestCase):
     """
@@ -180,6 +208,65 @@ class DecimalFieldFormatTest(unittest.TestCase):
         field_format.decimal_separator = ","
         self.assertRaises(errors.FieldValueError, field_format.validated, "3000,300.234")
 
+    def test_fails_on_first_of_several_broken_separators(self):
+        german_decimal_field_format = _create_german_decimal_format()
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "decimal field must contain only one decimal separator (',')*",
+            german_decimal_field_format.validated, "1,2,3.4")
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "decimal field must contain thousands separator ('.') only before*",
+            german_decimal_field_format.validated, "1,2.3,4")
+
+    def test_can_validate_as_float(self):
+        field_format = fields.DecimalFieldFormat(
+            "x", False, None, "0.00...99999.99", _ANY_FORMAT, result_type=fields.DECIMAL_RESULT_FLOAT)
+        self.assertEqual(fields.DECIMAL_RESULT_FLOAT, field_format.result_type)
+        self.assertEqual(17.23, field_format.validated("17.23"))
+        self.assertEqual(float, type(field_format.validated("17")))
+
+    def test_fails_on_float_for_range_with_too_many_digits(self):
+        self.assertRaises(
+            errors.InterfaceError, fields.DecimalFieldFormat, "x", False, None, "", _ANY_FORMAT,
+            result_type=fields.DECIMAL_RESULT_FLOAT)
+
+    def test_can_validate_as_scaled_integer(self):
+        field_format = fields.DecimalFieldFormat(
+            "x", False, None, "-99.99...99.99", _ANY_FORMAT, result_type=fields.DECIMAL_RESULT_SCALED_INTEGER)
+        self.assertEqual(1723, field_format.validated("17.23"))
+        self.assertEqual(1720, field_format.validated("17.2"))
+        self.assertEqual(-1700, field_format.validated("-17"))
+        self.assertEqual(1723, field_format.validated("17.2300"))
+        self.assertRaises(errors.FieldValueError, field_format.validated, "17.234")
+
+    def test_can_set_result_type_in_rule(self):
+        field_format = fields.DecimalFieldFormat("x", False, None, "scaled_integer -99.99...99.99", _ANY_FORMAT)
+        self.assertEqual(fields.DECIMAL_RESULT_SCALED_INTEGER, field_format.result_type)
+        self.assertEqual(decimal.Decimal('99.99'), field_format.valid_range.upper_limit)
+        field_format = fields.DecimalFieldFormat(
+            "x", False, None, "decimal", _ANY_FORMAT, result_type=fields.DECIMAL_RESULT_SCALED_INTEGER)
+        self.assertEqual(fields.DECIMAL_RESULT_DECIMAL, field_format.result_type)
+        self.assertEqual(decimal.Decimal('9999999999999999999.999999999999'), field_format.valid_range.upper_limit)
+
+    def test_can_set_result_type_in_cid(self):
+        cid = interface.create_cid_from_string('\n'.join([
+            'd,format,delimited',
+            'f,price,,,,Decimal,float 0.00...99999.99',
+            'f,balance,,,,Decimal,scaled_integer -99.99...99.99',
+            'f,total,,,,Decimal,0.00...99.99',
+        ]))
+        price_format, balance_format, total_format = cid.field_formats
+        self.assertEqual(fields.DECIMAL_RESULT_FLOAT, price_format.result_type)
+        self.assertEqual(17.23, price_format.validated("17.23"))
+        self.assertEqual(fields.DECIMAL_RESULT_SCALED_INTEGER, balance_format.result_type)
+        self.assertEqual(-1723, balance_format.validated("-17.23"))
+        self.assertEqual(fields.DECIMAL_RESULT_DECIMAL, total_format.result_type)
+        self.assertEqual(decimal.Decimal('17.23'), total_format.validated("17.23"))
+
+    def test_fails_on_float_in_cid_for_range_with_too_many_digits(self):
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.InterfaceError, "*to validate decimal field 'price' as float, the range must have at most*",
+            interface.create_cid_from_string, 'd,format,delimited\nf,price,,,,Decimal,float')
+
     def test_can_use_default_rule(self):
         field_format = fields.DecimalFieldFormat("x", False, None, "", _ANY_FORMAT)
         self.assertEqual(field_format.valid_range.upper_limit, decimal.Decimal('9999999999999999999.999999999999'))
@@ -383,6 +470,49 @@ class ChoiceFieldFormatTest(unittest.TestCase):
         self.assertRaises(errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, ",red", _ANY_FORMAT)
         self.assertRaises(errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, "red,,green", _ANY_FORMAT)
 
+    def test_can_match_choice_ignoring_case(self):
+        field_format = fields.ChoiceFieldFormat("color", False, None, "ignorecase red, grEEn", _ANY_FORMAT)
+        self.assertTrue(field_format.ignore_case)
+        self.assertEqual(["red", "grEEn"], field_format.choices)
+        self.assertEqual(field_format.validated("RED"), "RED")
+        self.assertEqual(field_format.validated("green"), "green")
+        self.assertRaises(errors.FieldValueError, field_format.validated, "blue")
+
+    def test_can_match_keywords_as_choices(self):
+        field_format = fields.ChoiceFieldFormat("option", False, None, "file, ignorecase", _ANY_FORMAT)
+        self.assertFalse(field_format.ignore_case)
+        self.assertEqual(["file", "ignorecase"], field_format.choices)
+        field_format = fields.ChoiceFieldFormat("option", False, None, "ignorecase", _ANY_FORMAT)
+        self.assertEqual(["ignorecase"], field_format.choices)
+
+    def _write_choices(self, choices_text):
+        result = dev_test.path_to_test_result('choices.txt')
+        with io.open(result, 'w', encoding='utf-8') as choices_file:
+            choices_file.write(choices_text)
+        return result
+
+    def test_can_match_choice_from_file(self):
+        choices_path = self._write_choices('red\n  grEEn \n\nblue\n')
+        field_format = fields.ChoiceFieldFormat("color", False, None, 'file "%s"' % choices_path, _ANY_FORMAT)
+        self.assertEqual(choices_path, field_format.choices_path)
+        self.assertEqual(["red", "grEEn", "blue"], field_format.choices)
+        self.assertEqual(field_format.validated("grEEn"), "grEEn")
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "value is 'green' but must be one of the 3 choices in: '*choices.txt'",
+            field_format.validated, "green")
+        field_format = fields.ChoiceFieldFormat(
+            "color", False, None, 'ignorecase file "%s"' % choices_path, _ANY_FORMAT)
+        self.assertEqual(field_format.validated("green"), "green")
+
+    def test_fails_on_broken_choice_file(self):
+        self.assertRaises(
+            errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, 'file "no_such_choices.txt"',
+            _ANY_FORMAT)
+        choices_path = self._write_choices('red\n')
+        self.assertRaises(
+            errors.InterfaceError, fields.ChoiceFieldFormat, "color", False, None, 'file "%s", blue' % choices_path,
+            _ANY_FORMAT)
+
 
 class ConstantFieldFormatTest(unittest.TestCase):
     """
@@ -461,6 +591,97 @@ class PatternFieldFormatTest(unittest.TestCase):
         self.assertRaises(errors.FieldValueError, field_format.validated, "hang")
 
 
+class ValidatedColumnTest(unittest.TestCase):
+    """
+    Tests for `AbstractFieldFormat.validated_column()`.
+    """
+    def _assert_same_as_validated(self, field_format, values):
+        validated_values, index_to_error_map = field_format.validated_column(values)
+        index_to_broken_value_map = field_format.broken_column(values)
+        self.assertEqual(len(values), len(validated_values))
+        for index, value in enumerate(values):
+            try:
+                self.assertEqual(field_format.validated(value), validated_values[index])
+                self.assertNotIn(index, index_to_error_map)
+                self.assertNotIn(index, index_to_broken_value_map)
+                self.assertIsNone(field_format.broken_value(value))
+            except errors.FieldValueError as error:
+                self.assertIsNone(validated_values[index])
+                self.assertEqual(error.message, index_to_error_map[index].message)
+                self.assertEqual(error.message, fields.field_value_error(*index_to_broken_value_map[index]).message)
+                self.assertEqual(error.message, fields.field_value_error(*field_format.broken_value(value)).message)
+
+    def test_can_validate_integer_column(self):
+        field_format = fields.IntegerFieldFormat('x', True, '1...3', '-5...5, 100...200', _ANY_FORMAT)
+        self.assertEqual(
+            ([1, None, -5, None, 150], {}), field_format.validated_column(['1', '', '-5', '', '150']))
+        validated_values, index_to_error_map = field_format.validated_column(['1', 'x', '6', '', '150'])
+        self.assertEqual([1, None, None, None, 150], validated_values)
+        self.assertEqual([1, 2], sorted(index_to_error_map.keys()))
+        dev_test.assert_error_fnmatches(self, index_to_error_map[2], 'value is 6 but must be within range: *')
+        self._assert_same_as_validated(field_format, ['1', 'x', '6', '', '150', '1000', ' 7', '+3'])
+
+    def test_can_validate_decimal_column(self):
+        self._assert_same_as_validated(
+            _create_german_decimal_format(), ['1,5', '1.234,5', '1,2,3', '1,2.3', 'x', '', '-0,0'])
+        field_format = fields.DecimalFieldFormat(
+            'x', False, '', '0.00...9.99', _ANY_FORMAT, result_type=fields.DECIMAL_RESULT_SCALED_INTEGER)
+        validated_values, index_to_error_map = field_format.validated_column(['1.5', '1.234', '12'])
+        self.assertEqual([150, None, None], validated_values)
+        self.assertEqual([1, 2], sorted(index_to_error_map.keys()))
+
+    def test_can_validate_choice_column(self):
+        field_format = fields.ChoiceFieldFormat('x', True, '', 'ignorecase red, green', _ANY_FORMAT)
+        validated_values, index_to_error_map = field_format.validated_column(['Red', 'blue', '', 'GREEN'])
+        self.assertEqual(['Red', None, '', 'GREEN'], validated_values)
+        self.assertEqual([1], list(index_to_error_map.keys()))
+
+    def test_can_validate_constant_column(self):
+        field_format = fields.ConstantFieldFormat('x', False, '', '"x"', _ANY_FORMAT)
+        self._assert_same_as_validated(field_format, ['x', 'y', '', 'x'])
+
+    def test_can_validate_pattern_and_regex_column(self):
+        self._assert_same_as_validated(
+            fields.PatternFieldFormat('x', False, '2...4', 'h*g?', _ANY_FORMAT), ['hgo', 'hugo', 'hang', 'hugoooo', ''])
+        self._assert_same_as_validated(
+            fields.RegExFieldFormat('x', True, '', r'\d+$', _ANY_FORMAT), ['12', '1a', '', '7'])
+
+    def test_can_validate_fixed_column(self):
+        fixed_format = data.DataFormat(data.FORMAT_FIXED)
+        fixed_format.set_property(data.KEY_ALLOWED_CHARACTERS, '32...126')
+        field_format = fields.IntegerFieldFormat('x', True, '3', '', fixed_format)
+        self._assert_same_as_validated(field_format, ['  1', '12 ', '   ', '1234', '1\t2', ' x '])
+
+    def test_can_validate_column_without_batch_support(self):
+        field_format = fields.DateTimeFieldFormat('x', True, '', 'YYYY-MM-DD', _ANY_FORMAT)
+        self._assert_same_as_validated(field_format, ['2015-04-01', '2015-02-30', ''])
+
+
+class BrokenValueTest(unittest.TestCase):
+    """
+    Tests for `AbstractFieldFormat.broken_value()`.
+    """
+    def test_can_describe_valid_value(self):
+        field_format = fields.IntegerFieldFormat('x', False, '', '1...10', _ANY_FORMAT)
+        self.assertIsNone(field_format.broken_value('7'))
+
+    def test_can_describe_broken_value_without_error(self):
+        field_format = fields.IntegerFieldFormat('x', False, '1...2', '1...10', _ANY_FORMAT)
+        self.assertEqual((fields.FIELD_ERROR_EMPTY, ()), field_format.broken_value(''))
+        self.assertEqual(fields.FIELD_ERROR_LENGTH, field_format.broken_value('123')[0])
+        self.assertEqual((fields.FIELD_ERROR_INTEGER, ('x',)), field_format.broken_value('x'))
+        error_code, error_args = field_format.broken_value('11')
+        self.assertEqual(fields.FIELD_ERROR_RANGE, error_code)
+        dev_test.assert_error_fnmatches(
+            self, fields.field_value_error(error_code, error_args), 'value is 11 but must be within range: *')
+
+    def test_can_describe_broken_value_of_format_without_error_codes(self):
+        field_format = fields.DateTimeFieldFormat('x', False, '', 'YYYY-MM-DD', _ANY_FORMAT)
+        error_code, error_args = field_format.broken_value('2015-02-30')
+        self.assertEqual(fields.FIELD_ERROR_OTHER, error_code)
+        self.assertIs(error_args[0], fields.field_value_error(error_code, error_args))
+
+
 if __name__ == '__main__':  # pragma: no cover
     logging.basicConfig()
     logging.getLogger("cutplace").setLevel(logging.INFO)
@@ -22,6 +22,7 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import fnmatch
+import io
 import os.path
 import unittest
 
@@ -448,5 +449,80 @@ class CidTest(unittest.TestCase):
             cid_text, "*check description must be used only once: 'duplicate_check' (see also: *: first declaration)")
 
 
+class CachedCidTest(unittest.TestCase):
+    """
+    Tests for `interface.cached_cid()`.
+    """
+    def _write_cid(self, cid_path, field_names):
+        with io.open(cid_path, 'w', encoding='utf-8') as cid_file:
+            cid_file.write('d,format,delimited\n')
+            for field_name in field_names:
+                cid_file.write('f,%s,,,,Integer\n' % field_name)
+            cid_file.write('c,unique id,IsUnique,%s\n' % field_names[0])
+
+    def _cid_path_without_cache(self, cid_name):
+        result = dev_test.path_to_test_result(cid_name)
+        cache_path = result + interface.CID_CACHE_SUFFIX
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+        return result
+
+    def test_can_cache_cid_next_to_cid(self):
+        cid_path = self._cid_path_without_cache('test_can_cache_cid_next_to_cid.csv')
+        self._write_cid(cid_path, ['id', 'size'])
+        cid = interface.cached_cid(cid_path)
+        self.assertEqual(['id', 'size'], cid.field_names)
+        self.assertTrue(os.path.exists(cid_path + interface.CID_CACHE_SUFFIX))
+        cached_cid = interface.cached_cid(cid_path)
+        self.assertEqual(['id', 'size'], cached_cid.field_names)
+        self.assertEqual(['unique id'], cached_cid.check_names)
+        self.assertEqual(
+            cid.field_format_for('size').valid_range.items, cached_cid.field_format_for('size').valid_range.items)
+
+    def test_can_cache_cid_in_folder(self):
+        cid_path = self._cid_path_without_cache('test_can_cache_cid_in_folder.csv')
+        cache_folder = dev_test.path_to_test_result('test_can_cache_cid_in_folder')
+        self._write_cid(cid_path, ['id'])
+        for _ in range(2):
+            self.assertEqual(['id'], interface.cached_cid(cid_path, cache_folder).field_names)
+        cache_names = os.listdir(cache_folder)
+        self.assertEqual(1, len(cache_names))
+        dev_test.assert_fnmatches(self, cache_names[0], 'test_can_cache_cid_in_folder.csv_*' + interface.CID_CACHE_SUFFIX)
+
+    def test_can_renew_outdated_cache(self):
+        cid_path = self._cid_path_without_cache('test_can_renew_outdated_cache.csv')
+        self._write_cid(cid_path, ['id'])
+        self.assertEqual(['id'], interface.cached_cid(cid_path).field_names)
+        self._write_cid(cid_path, ['id', 'size'])
+        self.assertEqual(['id', 'size'], interface.cached_cid(cid_path).field_names)
+
+    def test_can_renew_cache_with_outdated_choices(self):
+        cid_path = self._cid_path_without_cache('test_can_renew_cache_with_outdated_choices.csv')
+        choices_path = dev_test.path_to_test_result('test_can_renew_cache_with_outdated_choices.txt')
+        with io.open(cid_path, 'w', encoding='utf-8') as cid_file:
+            cid_file.write('d,format,delimited\n')
+            cid_file.write('f,color,,,,Choice,"file ""%s"""\n' % choices_path.replace('\\', '/'))
+        for choices in (['red', 'green'], ['red', 'green', 'blue'], ['red', 'green', 'blue', 'yellow']):
+            with io.open(choices_path, 'w', encoding='utf-8') as choices_file:
+                choices_file.write('\n'.join(choices))
+            for _ in range(2):
+                self.assertEqual(choices, interface.cached_cid(cid_path).field_format_for('color').choices)
+
+    def test_can_ignore_broken_cache(self):
+        cid_path = self._cid_path_without_cache('test_can_ignore_broken_cache.csv')
+        self._write_cid(cid_path, ['id'])
+        with io.open(cid_path + interface.CID_CACHE_SUFFIX, 'wb') as broken_cache_file:
+            broken_cache_file.write(b'broken')
+        self.assertEqual(['id'], interface.cached_cid(cid_path).field_names)
+        self.assertEqual(['id'], interface.cached_cid(cid_path).field_names)
+
+    def test_fails_on_broken_cached_cid(self):
+        cid_path = self._cid_path_without_cache('test_fails_on_broken_cached_cid.csv')
+        with io.open(cid_path, 'w', encoding='utf-8') as cid_file:
+            cid_file.write('f,id\n')
+        self.assertRaises(errors.InterfaceError, interface.cached_cid, cid_path)
+        self.assertFalse(os.path.exists(cid_path + interface.CID_CACHE_SUFFIX))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -21,21 +21,42 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import io
+import json
 import logging
 import os.path
 import pstats
+import random
+import re
+import subprocess
+import sys
+import time
 import unittest
 
 import six
 
+import cutplace
+from cutplace import errors
 from cutplace import interface
+from cutplace import rowio
 from cutplace import validio
 from cutplace import _compat
 from cutplace import applications
 from cutplace import _tools
+from tests import benchmark
 from tests import dev_test
 
 _log = logging.getLogger("cutplace.dev_reports")
+
+#: Maximum number of seconds ``import cutplace`` may take.
+IMPORT_TIME_BUDGET = 0.1
+
+#: Environment variable that has to be set to ``1`` to test
+#: :py:data:`IMPORT_TIME_BUDGET`, which depends on the speed of the machine.
+IMPORT_TIME_BUDGET_ENVIRONMENT_VARIABLE = 'CUTPLACE_TEST_IMPORT_TIME_BUDGET'
+
+# Modules that must only be imported once they are actually needed.
+_LAZILY_IMPORTED_MODULES = (
+    'multiprocessing', 'numpy', 'tkinter', 'Tkinter', 'xlrd', 'xlsxwriter', 'xml.etree.ElementTree', 'zipfile')
 # Import "best" profiler available.
 try:
     import cProfile as profile
@@ -45,10 +66,11 @@ except ImportError:
 
 
 def _build_lots_of_customers_csv(target_csv_path, customer_count=1000):
-    # TODO: Use a random seed to generate the same data every time.
     assert target_csv_path is not None
 
     _log.info('write lots of customers to "%s"', target_csv_path)
+    # Use a fixed seed to generate the same data every time.
+    random.seed(0)
     with io.open(target_csv_path, "w", newline='', encoding='cp1252') as target_csv_file:
         csv_writer = _compat.csv_writer(target_csv_file)
         for customerId in range(customer_count):
@@ -73,6 +95,41 @@ def _build_and_validate_many_customers():
         raise ValueError("exit code of performance test must be 0 but is %d" % exit_code)
 
 
+def _legacy_validate_row(cid, row, location):
+    """
+    Validate ``row`` the way :py:meth:`cutplace.validio.BaseValidator.validate_row`
+    did before it used a compiled validator: resolve field formats and checks
+    through ``cid`` for every single row. This serves as baseline for
+    benchmarks.
+    """
+    for field_index, field_value in enumerate(row):
+        location.set_cell(field_index)
+        field_to_validate = cid.field_formats[field_index]
+        if not isinstance(field_value, six.text_type):
+            raise errors.FieldValueError('type must be %s' % six.text_type.__name__)
+        field_to_validate.validated(field_value)
+    location.set_cell(0)
+    field_map = dict(zip(cid.field_names, row))
+    for check_name in cid.check_names:
+        cid.check_map[check_name].check_row(field_map, location)
+
+
+def _rows_per_second(cid, rows_to_validate, validate_row):
+    """
+    Number of ``rows_to_validate`` per second that ``validate_row(row, location)``
+    can process.
+    """
+    for check in cid.check_map.values():
+        check.reset()
+    location = errors.Location('<benchmark>', has_cell=True)
+    start_time = time.time()
+    for row in rows_to_validate:
+        validate_row(row, location)
+        location.advance_line()
+    duration = max(time.time() - start_time, 1e-6)
+    return len(rows_to_validate) / duration
+
+
 class PerformanceTest(unittest.TestCase):
     """
     Test case for performance profiling.
@@ -92,6 +149,113 @@ class PerformanceTest(unittest.TestCase):
             if not six.PY2:
                 stats.sort_stats("cumulative").print_stats("cutplace", 20)
 
+    def test_can_benchmark_compiled_row_validator(self):
+        customers_cid = interface.Cid(dev_test.path_to_test_cid("customers.ods"))
+        random.seed(0)
+        rows_to_validate = [dev_test.create_test_customer_row(customer_id) for customer_id in range(2000)]
+
+        legacy_rows_per_second = _rows_per_second(
+            customers_cid, rows_to_validate,
+            lambda row, location: _legacy_validate_row(customers_cid, row, location))
+        with validio.Reader(customers_cid, io.StringIO()) as reader:
+            compiled_row_validator = reader._compiled_row_validator
+            compiled_rows_per_second = _rows_per_second(
+                customers_cid, rows_to_validate, compiled_row_validator.validate_row)
+        _log.info(
+            'validated customers: legacy=%.0f rows/s, compiled=%.0f rows/s (%.2fx)',
+            legacy_rows_per_second, compiled_rows_per_second, compiled_rows_per_second / legacy_rows_per_second)
+        self.assertGreater(compiled_rows_per_second, 0)
+
+    def test_can_benchmark_fixed_rows(self):
+        field_names_and_lengths = [('field_%d' % field_index, 1 + field_index % 7) for field_index in range(60)]
+        record_length = sum(field_length for _, field_length in field_names_and_lengths)
+        random.seed(0)
+        fixed_text = ''.join(
+            ''.join(random.choice('abcdefghij0123456789') for _ in range(record_length)) + '\n'
+            for _ in range(2000))
+
+        def fixed_rows_per_second(fixed_rows_to_read):
+            start_time = time.time()
+            with io.StringIO(fixed_text) as fixed_file:
+                location = errors.Location(fixed_file, has_column=True)
+                row_count = len(list(fixed_rows_to_read(fixed_file, False, field_names_and_lengths, '\n', location)))
+            duration = max(time.time() - start_time, 1e-6)
+            self.assertEqual(2000, row_count)
+            return row_count / duration
+
+        by_field_rows_per_second = fixed_rows_per_second(rowio._fixed_rows_by_field)
+        by_block_rows_per_second = fixed_rows_per_second(rowio._fixed_rows_by_block)
+        _log.info(
+            'read fixed rows: by field=%.0f rows/s, by block=%.0f rows/s (%.2fx)',
+            by_field_rows_per_second, by_block_rows_per_second, by_block_rows_per_second / by_field_rows_per_second)
+        self.assertGreater(by_block_rows_per_second, 0)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), 'python -X importtime requires Python 3.7 or later')
+class ImportTimeTest(unittest.TestCase):
+    """
+    Test case for the time needed to ``import cutplace``.
+    """
+    def _module_to_import_time_map(self, module_name):
+        """
+        Map of the names of all modules imported by ``import module_name``
+        to their cumulative import time in seconds as reported by
+        ``python -X importtime``.
+        """
+        cutplace_base_folder = os.path.dirname(os.path.dirname(os.path.abspath(cutplace.__file__)))
+        import_time_output = subprocess.check_output(
+            [sys.executable, '-X', 'importtime', '-c', 'import ' + module_name],
+            cwd=cutplace_base_folder, stderr=subprocess.STDOUT, universal_newlines=True)
+        result = {}
+        for line in import_time_output.splitlines():
+            import_time_match = re.match(r'import time:\s+\d+\s+\|\s+(\d+)\s+\|\s*(\S+)$', line)
+            if import_time_match is not None:
+                result[import_time_match.group(2)] = int(import_time_match.group(1)) / 1000000
+        return result
+
+    @unittest.skipUnless(
+        os.environ.get(IMPORT_TIME_BUDGET_ENVIRONMENT_VARIABLE) == '1',
+        'set %s=1 to test the import time budget' % IMPORT_TIME_BUDGET_ENVIRONMENT_VARIABLE)
+    def test_can_import_cutplace_within_budget(self):
+        # Use the fastest of several runs to reduce the influence of other processes.
+        import_time = min(self._module_to_import_time_map('cutplace')['cutplace'] for _ in range(3))
+        _log.info('import cutplace: %.3f s (budget: %.3f s)', import_time, IMPORT_TIME_BUDGET)
+        self.assertLessEqual(import_time, IMPORT_TIME_BUDGET)
+
+    def test_can_import_without_heavy_modules(self):
+        for module_name in ('cutplace', 'cutplace.applications'):
+            imported_module_names = self._module_to_import_time_map(module_name).keys()
+            for lazily_imported_module_name in _LAZILY_IMPORTED_MODULES:
+                self.assertNotIn(
+                    lazily_imported_module_name, imported_module_names,
+                    'import %s must not import %s' % (module_name, lazily_imported_module_name))
+
+
+class BenchmarkTest(unittest.TestCase):
+    """
+    Test case for the benchmarks in :py:mod:`tests.benchmark`.
+    """
+    def test_can_generate_same_customers_for_same_seed(self):
+        self.assertEqual(list(benchmark.customer_rows(20, 1)), list(benchmark.customer_rows(20, 1)))
+        self.assertNotEqual(list(benchmark.customer_rows(20, 1)), list(benchmark.customer_rows(20, 2)))
+
+    def test_can_write_benchmark_json(self):
+        benchmark_json_path = dev_test.path_to_test_result('test_can_write_benchmark_json.json')
+        benchmark.main(['--rows', '20', '--output', benchmark_json_path])
+        with io.open(benchmark_json_path, encoding='utf-8') as benchmark_json_file:
+            benchmark_results = json.load(benchmark_json_file)
+        self.assertEqual(20, benchmark_results['rows'])
+        result_names = set(result['name'] for result in benchmark_results['results'])
+        for format_name in benchmark.FORMATS:
+            self.assertIn('validate_' + format_name, result_names)
+        self.assertIn('validate_delimited_rejected_record', result_names)
+        self.assertIn('write_fixed_buffered', result_names)
+        for result_name in ['ChoiceFieldFormat_3', 'ChoiceFieldFormat_10000', 'IntegerFieldFormat', 'many_ranges', 'IsUniqueCheck', 'DistinctCountCheck_approximate']:
+            self.assertIn(result_name, result_names)
+        for result in benchmark_results['results']:
+            self.assertEqual(20, result['items'])
+            self.assertGreater(result['items_per_second'], 0)
+
 
 if __name__ == '__main__':  # pragma: no cover
     logging.basicConfig(level=logging.INFO)
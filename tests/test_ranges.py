@@ -180,6 +180,58 @@ class RangeTest(unittest.TestCase):
         self.assertRaises(errors.RangeValueError, multi_range.validate, "x", 10)
         self.assertRaises(errors.RangeValueError, multi_range.validate, "x", 723)
 
+    def test_can_validate_with_many_unsorted_items(self):
+        many_range = ranges.Range(', '.join('%d...%d' % (lower, lower + 1) for lower in range(2997, -1, -3)))
+        many_range.validate("x", 0)
+        many_range.validate("x", 1)
+        many_range.validate("x", 2998)
+        for value in (-1, 2, 1502, 2999):
+            dev_test.assert_raises_and_fnmatches(
+                self, errors.RangeValueError, "x is %d but must be within range: 2997...2998, 2994...2995, *" % value,
+                many_range.validate, "x", value)
+
+    def test_can_validate_with_adjacent_and_open_items(self):
+        adjacent_range = ranges.Range("3, 1...2, 4...5")
+        for value in range(1, 6):
+            adjacent_range.validate("x", value)
+        self.assertRaises(errors.RangeValueError, adjacent_range.validate, "x", 6)
+        open_range = ranges.Range("...3, ...5, 10...")
+        open_range.validate("x", -1000)
+        open_range.validate("x", 5)
+        open_range.validate("x", 10)
+        self.assertRaises(errors.RangeValueError, open_range.validate, "x", 6)
+
+    def test_can_find_out_of_range_indices(self):
+        values = [-1000, -1, 0, 3, 4, 5, 6, 9, 10, 2 ** 70]
+        for description in ['', '1...3', '...3, ...5, 10...', '3, 1...2, 4...5', '0, %d' % (2 ** 70)]:
+            range_to_validate = ranges.Range(description)
+            expected_indices = []
+            for index, value in enumerate(values):
+                try:
+                    range_to_validate.validate('x', value)
+                except errors.RangeValueError:
+                    expected_indices.append(index)
+            self.assertEqual(
+                expected_indices, range_to_validate.out_of_range_indices(values), 'description=%r' % description)
+        self.assertEqual([], ranges.Range('1...3').out_of_range_indices([]))
+
+    @unittest.skipUnless(ranges.has_numpy(), 'NumPy must be installed')
+    def test_can_find_out_of_range_indices_using_numpy(self):
+        numpy = ranges._numpy()
+        int64_values = [-2 ** 63, -1000, -1, 0, 1, 2, 3, 4, 5, 6, 9, 10, 11, 99, 2 ** 63 - 1]
+        huge_values = [0, 1, 2 ** 70]
+        for description in ['1...3', '...3', '3...', '...3, ...5, 10...', '3, 1...2, 4...5', '-1, 5...9, 99...']:
+            range_to_validate = ranges.Range(description)
+            is_within_intervals = range_to_validate._is_within_intervals
+            expected_indices = [
+                index for index, value in enumerate(int64_values) if not is_within_intervals(value)]
+            self.assertEqual(
+                expected_indices, range_to_validate._out_of_range_indices_using_numpy(numpy, int64_values),
+                'description=%r' % description)
+            # Values that do not fit into 64 bit integers fall back to pure Python.
+            self.assertIsNone(range_to_validate._out_of_range_indices_using_numpy(numpy, huge_values))
+        self.assertIsNone(ranges.Range('0, %d' % (2 ** 70))._out_of_range_indices_using_numpy(numpy, int64_values))
+
     def test_can_create_range_from_length(self):
         self.assertEqual(ranges.create_range_from_length(ranges.Range("1...")).items, None)
         self.assertEqual(ranges.create_range_from_length(ranges.Range("1...1")).items, [(0, 9)])
@@ -205,6 +257,30 @@ class RangeTest(unittest.TestCase):
         self.assertRaises(errors.RangeValueError, ranges.create_range_from_length, ranges.Range("-1...0"))
         self.assertRaises(errors.RangeValueError, ranges.create_range_from_length, ranges.Range("0...0"))
 
+    def _assert_invalid_character_regex_matches_range(self, description, text):
+        character_range = ranges.Range(description)
+        invalid_character_regex = ranges.create_invalid_character_regex(character_range)
+        invalid_character_match = invalid_character_regex.search(text)
+        expected_invalid_characters = []
+        for character in text:
+            try:
+                character_range.validate('character', ord(character))
+            except errors.RangeValueError:
+                expected_invalid_characters.append(character)
+        if expected_invalid_characters:
+            self.assertIsNotNone(invalid_character_match, 'description=%r, text=%r' % (description, text))
+            self.assertEqual(expected_invalid_characters[0], invalid_character_match.group())
+        else:
+            self.assertIsNone(invalid_character_match, 'description=%r, text=%r' % (description, text))
+
+    def test_can_create_invalid_character_regex(self):
+        self.assertIsNone(ranges.create_invalid_character_regex(ranges.Range('')))
+        for description in [
+                '"a"..."c"', '"a"...', '..."c"', '"a", "c", "b"', '"a"..."b", "c"...', 'tab, 32...126',
+                '93, 94, 45, 92', '0x10000...', '-10...0', '...-1', '0x110000...']:
+            for text in ['', 'abc', 'a-b', 'x', '^]', '\\', '\t\x00', 'a\U0001f600b']:
+                self._assert_invalid_character_regex_matches_range(description, text)
+
 
 class DecimalRangeTest(unittest.TestCase):
 
@@ -271,6 +347,11 @@ class DecimalRangeTest(unittest.TestCase):
         multi_range.validate("x", '7.1')
         multi_range.validate("x", 9)
 
+    def test_fails_on_value_between_adjacent_integer_items(self):
+        adjacent_range = ranges.DecimalRange("1, 2")
+        adjacent_range.validate("x", decimal.Decimal('2'))
+        self.assertRaises(errors.RangeValueError, adjacent_range.validate, "x", decimal.Decimal('1.5'))
+
     def test_fails_on_value_out_of_range(self):
         lower_and_upper_range = ranges.DecimalRange("-1.2...1.5")
         dev_test.assert_raises_and_fnmatches(
@@ -20,11 +20,15 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import datetime
 import io
 import os
 import unittest
+import zipfile
 
 import six
+import xlsxwriter
+from contextlib import closing
 
 from cutplace import data
 from cutplace import interface
@@ -61,6 +65,15 @@ class ExcelRowsTest(_BaseRowsTest):
                 _, excel_value, cutplace_value = row
                 self.assertEqual(cutplace_value, excel_value)
 
+    def test_fails_on_non_existent_excel_sheet(self):
+        excel_path = dev_test.path_to_test_data('valid_customers.xls')
+        try:
+            list(rowio.excel_rows(excel_path, 123))
+            self.fail()
+        except errors.DataFormatError as anticipated_error:
+            dev_test.assert_fnmatches(
+                self, str(anticipated_error), '* (R1C1): Excel must contain at least 123 sheet(s) instead of just *')
+
     def test_fails_on_excel_from_csv(self):
         csv_path = dev_test.path_to_test_data('valid_customers.csv')
         try:
@@ -78,11 +91,152 @@ class ExcelRowsTest(_BaseRowsTest):
             dev_test.assert_fnmatches(self, str(anticipated_error), '* (R1C1): cannot read Excel file: *')
 
 
+class XlsxRowsTest(unittest.TestCase):
+    def _write_xlsx(self, xlsx_path):
+        with closing(xlsxwriter.Workbook(xlsx_path)) as workbook:
+            workbook.add_worksheet('ignored').write_string(0, 0, 'x')
+            worksheet = workbook.add_worksheet('data')
+            date_format = workbook.add_format({'num_format': 'yyyy-mm-dd'})
+            time_format = workbook.add_format({'num_format': 'hh:mm:ss'})
+            text_format = workbook.add_format({'num_format': '"days:" 0'})
+            worksheet.write_string(0, 0, 'text')
+            worksheet.write_number(0, 1, 17)
+            worksheet.write_number(0, 2, 1.5)
+            worksheet.write_boolean(0, 3, True)
+            worksheet.write_datetime(1, 0, datetime.datetime(2015, 4, 1), date_format)
+            worksheet.write_datetime(1, 1, datetime.time(13, 14, 15), time_format)
+            worksheet.write_number(1, 2, 3, text_format)
+            worksheet.write_formula(1, 3, '=B1+1', None, 18)
+            worksheet.write_string(3, 1, 'after gap')
+
+    def test_can_read_xlsx_rows(self):
+        xlsx_path = dev_test.path_to_test_result('test_can_read_xlsx_rows.xlsx')
+        self._write_xlsx(xlsx_path)
+        self.assertEqual([['x']], list(rowio.xlsx_rows(xlsx_path)))
+        self.assertEqual([
+            ['text', '17', '1.5', '1'],
+            ['2015-04-01 00:00:00', '13:14:15', '3', '18'],
+            ['', '', '', ''],
+            ['', 'after gap', '', ''],
+        ], list(rowio.excel_rows(xlsx_path, 2)))
+
+    def _write_broken_xlsx(self, xlsx_path, sheet_xml_to_replace, broken_sheet_xml):
+        """
+        Write the XLSX from :py:meth:`_write_xlsx` to ``xlsx_path`` with
+        ``sheet_xml_to_replace`` in the data sheet replaced by
+        ``broken_sheet_xml``.
+        """
+        valid_xlsx_path = xlsx_path + '.valid.xlsx'
+        self._write_xlsx(valid_xlsx_path)
+        with zipfile.ZipFile(valid_xlsx_path, 'r') as valid_xlsx_zip:
+            with zipfile.ZipFile(xlsx_path, 'w', zipfile.ZIP_DEFLATED) as xlsx_zip:
+                for name in valid_xlsx_zip.namelist():
+                    content = valid_xlsx_zip.read(name)
+                    if name == 'xl/worksheets/sheet2.xml':
+                        sheet_xml = content.decode('utf-8')
+                        self.assertIn(sheet_xml_to_replace, sheet_xml)
+                        content = sheet_xml.replace(sheet_xml_to_replace, broken_sheet_xml).encode('utf-8')
+                    xlsx_zip.writestr(name, content)
+
+    def test_fails_on_xlsx_with_broken_shared_string_index(self):
+        xlsx_path = dev_test.path_to_test_result('test_fails_on_xlsx_with_broken_shared_string_index.xlsx')
+        self._write_broken_xlsx(xlsx_path, '<c r="B4" t="s"><v>2</v></c>', '<c r="B4" t="s"><v>99</v></c>')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError,
+            "* (R4C2): index of shared string must be a number between 0 and 2 but is: '99'",
+            list, rowio.xlsx_rows(xlsx_path, 2))
+
+    def test_fails_on_xlsx_with_broken_number(self):
+        xlsx_path = dev_test.path_to_test_result('test_fails_on_xlsx_with_broken_number.xlsx')
+        self._write_broken_xlsx(xlsx_path, '<c r="C1"><v>1.5</v></c>', '<c r="C1"><v>x</v></c>')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "* (R1C3): value of numeric cell must be a number but is: 'x'",
+            list, rowio.xlsx_rows(xlsx_path, 2))
+
+    def test_fails_on_xlsx_with_broken_row_reference(self):
+        xlsx_path = dev_test.path_to_test_result('test_fails_on_xlsx_with_broken_row_reference.xlsx')
+        self._write_broken_xlsx(xlsx_path, '<row r="4" ', '<row r="x" ')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "* (R3C1): reference of row must be a number greater than 0 but is: 'x'",
+            list, rowio.xlsx_rows(xlsx_path, 2))
+
+    def test_fails_on_xlsx_with_broken_cell_reference(self):
+        xlsx_path = dev_test.path_to_test_result('test_fails_on_xlsx_with_broken_cell_reference.xlsx')
+        self._write_broken_xlsx(xlsx_path, '<c r="B4" ', '<c r="4" ')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError, "* (R4C1): reference of cell must start with a column such as A1 but is: '4'",
+            list, rowio.xlsx_rows(xlsx_path, 2))
+
+    def test_fails_on_non_existent_xlsx_sheet(self):
+        xlsx_path = dev_test.path_to_test_result('test_fails_on_non_existent_xlsx_sheet.xlsx')
+        self._write_xlsx(xlsx_path)
+        try:
+            list(rowio.xlsx_rows(xlsx_path, 3))
+            self.fail()
+        except errors.DataFormatError as anticipated_error:
+            dev_test.assert_fnmatches(
+                self, str(anticipated_error), '* (R1C1): Excel must contain at least 3 sheet(s) instead of just 2')
+
+
 class OdsRowsTest(_BaseRowsTest):
     def test_can_read_ods_rows(self):
         ods_path = dev_test.path_to_test_data('valid_customers.ods')
         self._assert_rows_contain_data(rowio.ods_rows(ods_path))
 
+    def _write_ods(self, ods_path, tables_xml):
+        content_xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<office:document-content'
+            ' xmlns:office="urn:oasis:names:tc:opendocument:xmlns:office:1.0"'
+            ' xmlns:table="urn:oasis:names:tc:opendocument:xmlns:table:1.0"'
+            ' xmlns:text="urn:oasis:names:tc:opendocument:xmlns:text:1.0">'
+            '<office:body><office:spreadsheet>%s</office:spreadsheet></office:body>'
+            '</office:document-content>') % tables_xml
+        with zipfile.ZipFile(ods_path, 'w') as ods_zip:
+            ods_zip.writestr('content.xml', content_xml.encode('utf-8'))
+
+    def test_can_read_ods_rows_with_repeated_cells_and_rows(self):
+        ods_path = dev_test.path_to_test_result('test_can_read_ods_rows_with_repeated_cells_and_rows.ods')
+        self._write_ods(ods_path, ''.join([
+            '<table:table table:name="ignored">',
+            '<table:table-row><table:table-cell><text:p>x</text:p></table:table-cell></table:table-row>',
+            '</table:table>',
+            '<table:table table:name="data">',
+            '<table:table-row>',
+            '<table:table-cell table:number-columns-repeated="2"><text:p>a</text:p></table:table-cell>',
+            '<table:table-cell/>',
+            '<table:table-cell><text:p>b</text:p></table:table-cell>',
+            '<table:table-cell table:number-columns-repeated="2"/>',
+            '<table:table-cell table:number-columns-repeated="16380"/>',
+            '</table:table-row>',
+            '<table:table-row table:number-rows-repeated="2">',
+            '<table:table-cell><text:p>c</text:p></table:table-cell>',
+            '</table:table-row>',
+            '<table:table-row table:number-rows-repeated="2"><table:table-cell/></table:table-row>',
+            '<table:table-row><table:table-cell><text:p>d</text:p></table:table-cell></table:table-row>',
+            '<table:table-row table:number-rows-repeated="1048570">',
+            '<table:table-cell table:number-columns-repeated="16384"/>',
+            '</table:table-row>',
+            '</table:table>',
+        ]))
+        self.assertEqual([['x']], list(rowio.ods_rows(ods_path)))
+        self.assertEqual(
+            [['a', 'a', '', 'b', '', ''], ['c'], ['c'], [''], [''], ['d']], list(rowio.ods_rows(ods_path, 2)))
+
+    def test_fails_on_ods_with_broken_repeated_cells(self):
+        ods_path = dev_test.path_to_test_result('test_fails_on_ods_with_broken_repeated_cells.ods')
+        self._write_ods(ods_path, ''.join([
+            '<table:table table:name="data">',
+            '<table:table-row><table:table-cell table:number-columns-repeated="x"/></table:table-row>',
+            '</table:table>',
+        ]))
+        try:
+            list(rowio.ods_rows(ods_path))
+            self.fail()
+        except errors.DataFormatError as anticipated_error:
+            dev_test.assert_fnmatches(
+                self, str(anticipated_error), "* (Sheet1!R1C1): table:number-columns-repeated is 'x' but must be *")
+
     def test_fails_on_ods_from_csv(self):
         broken_ods_path = dev_test.path_to_test_data('customers.csv')
         try:
@@ -152,6 +306,101 @@ class DelimitedRowsTest(_BaseRowsTest):
                 'cannot parse delimited file' in error_message, 'error_message=%r' % error_message)
 
 
+class DelimitedChunksTest(unittest.TestCase):
+    def _chunks_and_rows(self, delimited_text, chunk_size, encoding='utf-8'):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ENCODING, encoding)
+        data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_can_split_delimited_chunks.csv')
+        with io.open(delimited_path, 'w', newline='', encoding=encoding) as delimited_target_stream:
+            delimited_target_stream.write(delimited_text)
+        chunks = rowio.delimited_chunks(delimited_path, data_format, chunk_size)
+        rows = []
+        with io.open(delimited_path, 'rb') as delimited_source_stream:
+            for start, end in chunks:
+                delimited_source_stream.seek(start)
+                chunk_text = delimited_source_stream.read(end - start).decode(encoding)
+                with io.StringIO(chunk_text, newline='') as chunk_stream:
+                    rows.extend(rowio.delimited_rows(chunk_stream, data_format))
+        return chunks, rows
+
+    def test_can_split_delimited_chunks(self):
+        chunks, rows = self._chunks_and_rows('a,1\nb,2\nc,3\nd,4\n', 4)
+        self.assertEqual([(0, 4), (4, 8), (8, 12), (12, 16)], chunks)
+        self.assertEqual([['a', '1'], ['b', '2'], ['c', '3'], ['d', '4']], rows)
+
+    def test_can_split_delimited_chunks_without_final_line_delimiter(self):
+        chunks, rows = self._chunks_and_rows('a,1\r\nb,2', 2)
+        self.assertEqual([(0, 5), (5, 8)], chunks)
+        self.assertEqual([['a', '1'], ['b', '2']], rows)
+
+    def test_can_split_delimited_chunks_with_quoted_line_delimiters(self):
+        delimited_text = 'a,"x\ny"\nb,"""\n"""\nc,"\n\n"\nd,e\n'
+        _, expected_rows = self._chunks_and_rows(delimited_text, 1000)
+        for chunk_size in range(1, len(delimited_text)):
+            _, actual_rows = self._chunks_and_rows(delimited_text, chunk_size)
+            self.assertEqual(expected_rows, actual_rows, 'chunk_size=%d' % chunk_size)
+
+    def test_can_split_delimited_chunks_with_non_ascii_data(self):
+        chunks, rows = self._chunks_and_rows('%s,1\n%s,2\n' % (_EURO_SIGN, _EURO_SIGN), 1)
+        self.assertEqual(2, len(chunks))
+        self.assertEqual([[_EURO_SIGN, '1'], [_EURO_SIGN, '2']], rows)
+
+    def test_can_keep_delimited_chunk_with_unsplittable_encoding(self):
+        chunks, rows = self._chunks_and_rows('a\nb\n', 1, 'utf-16')
+        self.assertEqual(1, len(chunks))
+        self.assertEqual([['a'], ['b']], rows)
+
+
+class DelimitedRecordsEndTest(unittest.TestCase):
+    def _delimited_path_and_format(self, delimited_text, encoding='utf-8'):
+        data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        data_format.set_property(data.KEY_ENCODING, encoding)
+        data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_can_find_delimited_records_end.csv')
+        with io.open(delimited_path, 'w', newline='', encoding=encoding) as delimited_target_stream:
+            delimited_target_stream.write(delimited_text)
+        return delimited_path, data_format
+
+    def test_can_find_delimited_records_end(self):
+        delimited_path, data_format = self._delimited_path_and_format('a,1\nb,"x\ny"\nc,"3\n')
+        self.assertEqual((12, 3), rowio.delimited_records_end(delimited_path, data_format))
+        self.assertEqual((12, 2), rowio.delimited_records_end(delimited_path, data_format, 4))
+        self.assertEqual((12, 0), rowio.delimited_records_end(delimited_path, data_format, 12))
+
+    def test_can_keep_delimited_records_end_with_unsplittable_encoding(self):
+        delimited_path, data_format = self._delimited_path_and_format('a\nb\n', 'utf-16')
+        self.assertEqual((0, 0), rowio.delimited_records_end(delimited_path, data_format))
+
+    def test_can_read_delimited_rows_in_range(self):
+        delimited_path, data_format = self._delimited_path_and_format('a,1\nb,"x\ny"\nc,"3\n')
+        self.assertEqual([['b', 'x\ny']], list(rowio.delimited_rows_in_range(delimited_path, data_format, 4, 12, 1)))
+        self.assertEqual(
+            [['a', '1'], ['b', 'x\ny']], list(rowio.delimited_rows_in_range(delimited_path, data_format, 0, 12)))
+
+    def test_fails_on_broken_delimited_rows_in_range(self):
+        delimited_path, data_format = self._delimited_path_and_format('a,1\nb,"x\ny"\nc,"3\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.DataFormatError,
+            'test_can_find_delimited_records_end.csv (5): cannot parse delimited file: unexpected end of data',
+            list, rowio.delimited_rows_in_range(delimited_path, data_format, 12, None, 3))
+
+
+class _ShortReadStringIO(io.StringIO):
+    """
+    Same as `io.StringIO` but `read()` returns at most `max_read_size`
+    characters like a pipe or socket might do.
+    """
+    def __init__(self, text, max_read_size):
+        super(_ShortReadStringIO, self).__init__(text)
+        self._max_read_size = max_read_size
+
+    def read(self, size=-1):
+        if (size is None) or (size < 0) or (size > self._max_read_size):
+            size = self._max_read_size
+        return super(_ShortReadStringIO, self).read(size)
+
+
 class FixedRowsTest(_BaseRowsTest):
     @staticmethod
     def _create_fixed_data_format_and_fields_for_name_and_height(line_delimiter='any', validate=True):
@@ -217,6 +466,13 @@ class FixedRowsTest(_BaseRowsTest):
             data_text = base_data_text.replace('\n', line_delimiter)
             self._test_can_read_fixed_rows_from_stringio(data_text, data_format)
 
+    def test_can_read_fixed_file_with_crlf_line_delimiter(self):
+        fixed_path = dev_test.path_to_test_result('test_can_read_fixed_file_with_crlf_line_delimiter.txt')
+        with io.open(fixed_path, 'w', encoding='ascii', newline='') as fixed_file:
+            fixed_file.write('hugo172\r\nsepp163\r\n')
+        rows = list(rowio.fixed_rows(fixed_path, 'ascii', (('name', 4), ('size', 3)), '\r\n'))
+        self.assertEqual([['hugo', '172'], ['sepp', '163']], rows)
+
     def test_can_read_fixed_rows_with_missing_terminating_line_delimiter(self):
         data_format, field_names_and_lengths = FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height()
         with io.StringIO('hugo172\nsepp163') as data_io:
@@ -280,11 +536,124 @@ class FixedRowsTest(_BaseRowsTest):
         data_format.validate()
         self._test_can_read_fixed_rows_from_stringio('hugo172sepp163', data_format)
 
+    def test_can_read_fixed_rows_across_blocks(self):
+        data_format, field_names_and_lengths = \
+            FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height('lf')
+        original_fixed_read_block_size = rowio._FIXED_READ_BLOCK_SIZE
+        try:
+            for fixed_read_block_size in (1, 8, 12, 20):
+                rowio._FIXED_READ_BLOCK_SIZE = fixed_read_block_size
+                with io.StringIO('john172\nmary163\nbill167') as data_io:
+                    rows = list(rowio.fixed_rows(
+                        data_io, data_format.encoding, field_names_and_lengths, data_format.line_delimiter))
+                self.assertEqual([['john', '172'], ['mary', '163'], ['bill', '167']], rows)
+                self._fails_on_fixed_rows_from_stringio(
+                    'john172\nmary163\tbill167',
+                    r"* (2;8): line delimiter is '\t' but must be '\n'", data_format)
+                self._fails_on_fixed_rows_from_stringio(
+                    'john172\nmary163\nbi', "* (3;1): cannot read field 'name': need 4 characters but found only 2*",
+                    data_format)
+        finally:
+            rowio._FIXED_READ_BLOCK_SIZE = original_fixed_read_block_size
+
+    def test_can_read_fixed_rows_with_short_reads(self):
+        data_format, field_names_and_lengths = \
+            FixedRowsTest._create_fixed_data_format_and_fields_for_name_and_height('lf')
+        for max_read_size in range(1, 17):
+            with _ShortReadStringIO('john172\nmary163\nbill167\n', max_read_size) as data_io:
+                rows = list(rowio.fixed_rows(
+                    data_io, data_format.encoding, field_names_and_lengths, data_format.line_delimiter))
+            self.assertEqual(
+                [['john', '172'], ['mary', '163'], ['bill', '167']], rows, 'max_read_size=%d' % max_read_size)
+
     def test_can_auto_read_excel_rows(self):
         excel_path = dev_test.path_to_test_data('valid_customers.xls')
         self._assert_rows_contain_data(rowio.auto_rows(excel_path))
 
 
+class MappedFixedRowsTest(unittest.TestCase):
+    _FIELD_NAMES_AND_LENGTHS = (('name', 4), ('size', 3))
+
+    def _mapped_fixed_rows(self, data_text, line_delimiter='\n'):
+        fixed_path = dev_test.path_to_test_result('test_can_map_fixed_rows.txt')
+        with io.open(fixed_path, 'w', encoding='cp1252', newline='') as fixed_file:
+            fixed_file.write(data_text)
+        return rowio.MappedFixedRows(fixed_path, 'cp1252', MappedFixedRowsTest._FIELD_NAMES_AND_LENGTHS, line_delimiter)
+
+    def test_can_access_mapped_fixed_rows(self):
+        with self._mapped_fixed_rows('john172\nmary163\nbill167\nj\xe4ne184\n') as mapped_rows:
+            self.assertEqual(4, len(mapped_rows))
+            self.assertEqual(['mary', '163'], mapped_rows[1])
+            self.assertEqual(['j\xe4ne', '184'], mapped_rows[-1])
+            self.assertEqual([['mary', '163'], ['bill', '167']], mapped_rows[1:3])
+            self.assertEqual([['john', '172'], ['bill', '167']], mapped_rows[::2])
+            self.assertEqual(4, len(list(mapped_rows)))
+            self.assertRaises(IndexError, mapped_rows.__getitem__, 4)
+            self.assertRaises(IndexError, mapped_rows.__getitem__, -5)
+
+    def test_can_map_fixed_rows_with_missing_terminating_line_delimiter(self):
+        with self._mapped_fixed_rows('john172\r\nmary163', '\r\n') as mapped_rows:
+            self.assertEqual([['john', '172'], ['mary', '163']], list(mapped_rows))
+
+    def test_can_map_fixed_rows_without_line_delimiter(self):
+        with self._mapped_fixed_rows('john172mary163', None) as mapped_rows:
+            self.assertEqual([['john', '172'], ['mary', '163']], list(mapped_rows))
+
+    def _fixed_chunks_and_rows(self, data_text, chunk_size, line_delimiter='\n'):
+        with self._mapped_fixed_rows(data_text, line_delimiter) as mapped_rows:
+            chunks = rowio.fixed_chunks(
+                mapped_rows.fixed_path, 'cp1252', MappedFixedRowsTest._FIELD_NAMES_AND_LENGTHS, line_delimiter,
+                chunk_size)
+            rows = []
+            for start, end in chunks:
+                self.assertEqual(0, start % mapped_rows.record_length)
+                rows.extend(mapped_rows[start // mapped_rows.record_length:-(-end // mapped_rows.record_length)])
+        return chunks, rows
+
+    def test_can_split_fixed_chunks(self):
+        data_text = 'john172\r\nmary163\r\nbill167\r\nj\xe4ne184'
+        chunks, rows = self._fixed_chunks_and_rows(data_text, 10, '\r\n')
+        self.assertEqual([(0, 18), (18, 34)], chunks)
+        self.assertEqual([['john', '172'], ['mary', '163'], ['bill', '167'], ['j\xe4ne', '184']], rows)
+        for chunk_size in range(1, len(data_text) + 1):
+            _, actual_rows = self._fixed_chunks_and_rows(data_text, chunk_size, '\r\n')
+            self.assertEqual(rows, actual_rows, 'chunk_size=%d' % chunk_size)
+
+    def test_can_keep_fixed_chunk_with_any_line_delimiter(self):
+        fixed_path = dev_test.path_to_test_result('test_can_keep_fixed_chunk_with_any_line_delimiter.txt')
+        with io.open(fixed_path, 'w', encoding='ascii', newline='') as fixed_file:
+            fixed_file.write('john172\nmary163\r\n')
+        self.assertEqual(
+            [(0, 17)], rowio.fixed_chunks(fixed_path, 'ascii', MappedFixedRowsTest._FIELD_NAMES_AND_LENGTHS, 'any', 1))
+
+    def test_can_map_empty_fixed_rows(self):
+        with self._mapped_fixed_rows('') as mapped_rows:
+            self.assertEqual(0, len(mapped_rows))
+            self.assertEqual([], list(mapped_rows))
+
+    def test_fails_on_broken_mapped_fixed_row(self):
+        with self._mapped_fixed_rows('john172\nmary163\tbill167\nji') as mapped_rows:
+            self.assertEqual(['bill', '167'], mapped_rows[2])
+            try:
+                mapped_rows[1]
+                self.fail()
+            except errors.DataFormatError as anticipated_error:
+                dev_test.assert_error_fnmatches(
+                    self, anticipated_error, r"* (2;8): line delimiter is '\t' but must be '\n'")
+            try:
+                mapped_rows[3]
+                self.fail()
+            except errors.DataFormatError as anticipated_error:
+                dev_test.assert_error_fnmatches(
+                    self, anticipated_error, "* (4;1): cannot read field 'name': need 4 characters but found only 2*")
+
+    def test_can_detect_single_byte_encoding(self):
+        for encoding in ('ascii', 'cp1252', 'iso-8859-15', 'cp500'):
+            self.assertTrue(rowio.is_single_byte_encoding(encoding), encoding)
+        for encoding in ('utf-8', 'utf-16', 'utf-32', 'shift_jis', 'gbk'):
+            self.assertFalse(rowio.is_single_byte_encoding(encoding), encoding)
+
+
 class AutoRowsTest(_BaseRowsTest):
     def test_can_auto_read_ods_rows(self):
         ods_path = dev_test.path_to_test_data('valid_customers.ods')
@@ -318,6 +687,22 @@ class DelimitedRowWriterTest(unittest.TestCase):
             data_written = delimited_source_stream.read()
         self.assertEqual('%r' % data_written, '%r' % 'a,b,\u20ac\n\n1,2,end\n')
 
+    def test_can_write_same_delimited_data_in_blocks(self):
+        delimited_data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        delimited_data_format.validate()
+        rows_to_write = [['a', 'b,c', _EURO_SIGN], [], ['"quoted"', 'two\nlines']] * 5
+        with io.StringIO() as expected_target:
+            with rowio.DelimitedRowWriter(expected_target, delimited_data_format) as delimited_writer:
+                for row_to_write in rows_to_write:
+                    delimited_writer.write_row(row_to_write)
+            expected_data = expected_target.getvalue()
+        for buffer_size in (1, 4, 1000):
+            with io.StringIO() as target:
+                with rowio.DelimitedRowWriter(target, delimited_data_format, buffer_size) as delimited_writer:
+                    delimited_writer.write_rows(iter(rows_to_write))
+                    self.assertEqual(len(rows_to_write), delimited_writer.location.line)
+                self.assertEqual(expected_data, target.getvalue())
+
     def test_fails_on_unicode_error_during_delimited_write(self):
         delimited_data_format = data.DataFormat(data.FORMAT_DELIMITED)
         delimited_data_format.set_property(data.KEY_ENCODING, 'ascii')
@@ -334,6 +719,19 @@ class DelimitedRowWriterTest(unittest.TestCase):
                     dev_test.assert_fnmatches(
                         self, anticipated_error_message, "*.csv (R2C1): cannot write data row: *; row=*'b', *")
 
+    def test_fails_on_unicode_error_during_delimited_block_write(self):
+        delimited_data_format = data.DataFormat(data.FORMAT_DELIMITED)
+        delimited_data_format.set_property(data.KEY_ENCODING, 'ascii')
+        delimited_data_format.validate()
+        delimited_path = dev_test.path_to_test_result('test_fails_on_unicode_error_during_delimited_block_write.csv')
+        with io.open(delimited_path, 'w', newline='', encoding=delimited_data_format.encoding) as delimited_target_stream:
+            with rowio.DelimitedRowWriter(delimited_target_stream, delimited_data_format) as delimited_writer:
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.DataFormatError, "*.csv (R2C1): cannot write data row: *; row=*'b', *",
+                    delimited_writer.write_rows, [['a'], ['b', _EURO_SIGN], ['c']])
+        with io.open(delimited_path, 'r', encoding=delimited_data_format.encoding) as delimited_source_stream:
+            self.assertEqual('a\n', delimited_source_stream.read())
+
 
 class FixedRowWriterTest(unittest.TestCase):
     def test_can_write_fixed_data_to_string(self):
@@ -358,6 +756,18 @@ class FixedRowWriterTest(unittest.TestCase):
             data_written = target.getvalue()
         self.assertEqual(data_written, '123')
 
+    def test_can_write_same_fixed_data_in_blocks(self):
+        fixed_data_format = data.DataFormat(data.FORMAT_FIXED)
+        fixed_data_format.set_property(data.KEY_LINE_DELIMITER, 'lf')
+        fixed_data_format.validate()
+        rows_to_write = [['a', 'b%c'], [_EURO_SIGN, '   ']] * 5
+        for buffer_size in (1, 3, 1000):
+            with io.StringIO() as target:
+                with rowio.FixedRowWriter(target, fixed_data_format, [('a', 1), ('b', 3)], buffer_size) as fixed_writer:
+                    fixed_writer.write_rows(iter(rows_to_write))
+                    self.assertEqual(len(rows_to_write), fixed_writer.location.line)
+                self.assertEqual('ab%c\n\u20ac   \n' * 5, target.getvalue())
+
     def test_fails_on_unicode_error_during_fixed_write(self):
         fixed_data_format = data.DataFormat(data.FORMAT_FIXED)
         fixed_data_format.set_property(data.KEY_ENCODING, 'ascii')
@@ -21,10 +21,14 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import io
+import multiprocessing.pool
+import os
 import unittest
 
 from cutplace import interface
+from cutplace import ranges
 from cutplace import errors
+from cutplace import rowio
 from cutplace import validio
 from tests import dev_test
 
@@ -196,6 +200,471 @@ class ReaderTest(unittest.TestCase):
                         "* (R3C1): cannot accept field 'digit': value must be an integer number: 'a'")
 
 
+class ParallelReaderTest(unittest.TestCase):
+    _CID_TEXT = '\n'.join([
+        'd,format,delimited',
+        'd,encoding,utf-8',
+        'd,header,1',
+        'f,customer_id,,,,Integer',
+        'f,name',
+        'c,customer must be unique,IsUnique,customer_id',
+        'c,few names,DistinctCount,name < 100',
+    ])
+
+    def setUp(self):
+        self._data_path = dev_test.path_to_test_result('test_can_read_rows_in_parallel.csv')
+        with io.open(self._data_path, 'w', newline='', encoding='utf-8') as data_stream:
+            data_stream.write('customer_id,name\n')
+            for customer_id in range(200):
+                if customer_id % 37 == 5:
+                    data_stream.write('x%d,broken\n' % customer_id)
+                elif customer_id % 41 == 7:
+                    data_stream.write('3,"duplicate\nwith line break"\n')
+                else:
+                    data_stream.write('%d,name %d\n' % (customer_id, customer_id % 17))
+        self._original_chunk_size = rowio.DEFAULT_CHUNK_SIZE
+        rowio.DEFAULT_CHUNK_SIZE = 200
+
+    def tearDown(self):
+        rowio.DEFAULT_CHUNK_SIZE = self._original_chunk_size
+
+    def _rows_as_text(self, on_error, jobs):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with validio.Reader(cid, self._data_path, on_error, jobs=jobs) as reader:
+            result = ['%s' % row for row in reader.rows()]
+            counts = (reader.accepted_rows_count, reader.rejected_rows_count)
+        return result, counts
+
+    def test_can_read_rows_in_parallel(self):
+        sequential_rows, sequential_counts = self._rows_as_text('yield', 1)
+        parallel_rows, parallel_counts = self._rows_as_text('yield', 3)
+        self.assertEqual(sequential_rows, parallel_rows)
+        self.assertEqual(sequential_counts, parallel_counts)
+        self.assertTrue(any('R7C1' in row for row in parallel_rows), parallel_rows)
+
+    def test_can_record_errors_in_parallel(self):
+        self.assertEqual(self._rows_as_text('yield', 1), self._rows_as_text('record', 3))
+        self.assertEqual(self._rows_as_text('continue', 1), self._rows_as_text('continue', 3))
+
+    def test_fails_on_first_broken_row_in_parallel(self):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with validio.Reader(cid, self._data_path, jobs=2) as reader:
+            try:
+                reader.validate_rows()
+                self.fail('broken data must cause FieldValueError')
+            except errors.FieldValueError as error:
+                dev_test.assert_error_fnmatches(
+                    self, error, "* (R7C1): cannot accept field 'customer_id': value must be an integer number: 'x5'")
+
+    def _validated_counts(self, on_error, jobs, validate_until=None):
+        cid_text_without_checks = '\n'.join(
+            line for line in self._CID_TEXT.split('\n') if not line.startswith('c,'))
+        cid = interface.create_cid_from_string(cid_text_without_checks)
+        with validio.Reader(cid, self._data_path, on_error, validate_until, jobs=jobs) as reader:
+            try:
+                reader.validate_rows()
+                error_text = None
+            except errors.DataError as error:
+                error_text = '%s' % error
+            result = (reader.accepted_rows_count, reader.rejected_rows_count, error_text, reader.location.line)
+        return result
+
+    def test_can_validate_rows_in_parallel_without_passing_rows(self):
+        for on_error in ('continue', 'raise', 'record', 'yield'):
+            self.assertEqual(self._validated_counts(on_error, 1), self._validated_counts(on_error, 3))
+        self.assertEqual(self._validated_counts('continue', 1, 100), self._validated_counts('continue', 3, 100))
+        _, _, error_text, _ = self._validated_counts('raise', 3)
+        dev_test.assert_fnmatches(
+            self, error_text, "* (R7C1): cannot accept field 'customer_id': value must be an integer number: 'x5'")
+
+    def test_can_limit_chunks_in_flight(self):
+        pulled_items = []
+
+        def items():
+            for item in range(20):
+                pulled_items.append(item)
+                yield item
+
+        pool = multiprocessing.pool.ThreadPool(2)
+        try:
+            results = []
+            for result in validio._limited_imap(pool, abs, items(), 3):
+                # Besides the current item, at most 3 further items must have been submitted.
+                self.assertLessEqual(len(pulled_items), result + 4)
+                results.append(result)
+        finally:
+            pool.terminate()
+            pool.join()
+        self.assertEqual(list(range(20)), results)
+
+
+class ParallelFixedReaderTest(unittest.TestCase):
+    _CID_TEXT = '\n'.join([
+        'd,format,fixed',
+        'd,encoding,ascii',
+        'd,line delimiter,crlf',
+        'd,header,1',
+        'f,customer_id,,,4,Integer',
+        'f,name,,,8',
+        'c,customer must be unique,IsUnique,customer_id',
+        'c,few names,DistinctCount,name < 100',
+    ])
+
+    def setUp(self):
+        self._data_path = dev_test.path_to_test_result('test_can_read_fixed_rows_in_parallel.txt')
+        with io.open(self._data_path, 'w', newline='', encoding='ascii') as data_stream:
+            data_stream.write('id  name    \r\n')
+            for customer_id in range(200):
+                if customer_id % 37 == 5:
+                    data_stream.write('x%-3dbroken  \r\n' % customer_id)
+                elif customer_id % 41 == 7:
+                    data_stream.write('3   dupe    \r\n')
+                else:
+                    data_stream.write('%-4dname %-3d\r\n' % (customer_id, customer_id % 17))
+        self._original_chunk_size = rowio.DEFAULT_CHUNK_SIZE
+        rowio.DEFAULT_CHUNK_SIZE = 200
+
+    def tearDown(self):
+        rowio.DEFAULT_CHUNK_SIZE = self._original_chunk_size
+
+    def _rows_as_text(self, on_error, jobs):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with validio.Reader(cid, self._data_path, on_error, jobs=jobs) as reader:
+            result = ['%s' % row for row in reader.rows()]
+            counts = (reader.accepted_rows_count, reader.rejected_rows_count)
+        return result, counts
+
+    def test_can_read_fixed_rows_in_parallel(self):
+        for on_error in ('continue', 'record', 'yield'):
+            sequential_rows_and_counts = self._rows_as_text(on_error, 1)
+            self.assertEqual(sequential_rows_and_counts, self._rows_as_text(on_error, 3))
+        parallel_rows, _ = self._rows_as_text('yield', 3)
+        dev_test.assert_fnmatches(
+            self, parallel_rows[6], "* (R7C1): cannot accept field 'customer_id': value must be an integer number: 'x5'")
+
+    def test_fails_on_broken_fixed_record_in_parallel(self):
+        with io.open(self._data_path, 'a', newline='', encoding='ascii') as data_stream:
+            data_stream.write('999 broken  \n')
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with validio.Reader(cid, self._data_path, 'continue', jobs=3) as reader:
+            try:
+                reader.validate_rows()
+                self.fail('broken data must cause DataFormatError')
+            except errors.DataFormatError as error:
+                dev_test.assert_error_fnmatches(self, error, "* (202;13): line delimiter is '\\n' but must be '\\r\\n'")
+
+
+class BatchReaderTest(unittest.TestCase):
+    _CID_TEXT = '\n'.join([
+        'd,format,delimited',
+        'd,header,1',
+        'f,customer_id,,,,Integer',
+        'f,gender,,,,Choice,female,male',
+        'f,name,,,1...10',
+        'c,customer must be unique,IsUnique,customer_id',
+    ])
+    _DATA_TEXT = '\n'.join([
+        'customer_id,gender,name',
+        '1,female,alice',
+        'x2,male,bob',
+        '3,other,carol',
+        '4,male',
+        '1,male,dave',
+        '5,female,a very long name',
+        '6,male,frank',
+    ])
+
+    def _rows_as_text(self, on_error, batch_size, validate_until=None):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO(self._DATA_TEXT) as data_stream:
+            with validio.Reader(cid, data_stream, on_error, validate_until, batch_size=batch_size) as reader:
+                result = ['%s' % row for row in reader.rows()]
+                counts = (reader.accepted_rows_count, reader.rejected_rows_count)
+        return result, counts
+
+    def test_can_read_rows_in_batches(self):
+        for on_error in ('continue', 'yield'):
+            for validate_until in (None, 4):
+                rows_and_counts = self._rows_as_text(on_error, 1, validate_until)
+                for batch_size in (2, 3, 1000):
+                    self.assertEqual(rows_and_counts, self._rows_as_text(on_error, batch_size, validate_until))
+        rows, _ = self._rows_as_text('yield', 3)
+        dev_test.assert_fnmatches(
+            self, rows[2], "* (R3C1): cannot accept field 'customer_id': value must be an integer number: 'x2'")
+        dev_test.assert_fnmatches(self, rows[4], '* (R5C1): row must contain 3 fields but only has 2: *')
+
+    @unittest.skipUnless(ranges.has_numpy(), 'NumPy must be installed')
+    def test_can_read_rows_in_batches_using_numpy(self):
+        for on_error in ('continue', 'yield', 'record'):
+            self.assertEqual(
+                self._rows_as_text(on_error, 1), self._rows_as_text(on_error, validio.DEFAULT_BATCH_SIZE))
+
+    def test_can_read_one_row_after_another_by_default(self):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO(self._DATA_TEXT) as data_stream:
+            with validio.Reader(cid, data_stream) as reader:
+                self.assertEqual(1, reader.batch_size)
+
+    def test_can_record_errors(self):
+        for validate_until in (None, 4):
+            expected_rows_and_counts = self._rows_as_text('yield', 1, validate_until)
+            for batch_size in (1, 3, 1000):
+                self.assertEqual(expected_rows_and_counts, self._rows_as_text('record', batch_size, validate_until))
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO(self._DATA_TEXT) as data_stream:
+            error_records = [
+                row_or_error_record for row_or_error_record in validio.rows(cid, data_stream, 'record')
+                if isinstance(row_or_error_record, errors.DataErrorRecord)]
+        self.assertEqual(
+            [(2, 0, 'customer_id', 'x2'), (3, 1, 'gender', 'other'), (4, None, None, None),
+             (5, 1, 'gender', 'male'), (6, 2, 'name', 'a very long name'), (7, 1, 'gender', 'male')],
+            [(error_record.line, error_record.field_index, error_record.field_name, error_record.value)
+             for error_record in error_records])
+        self.assertIsInstance(error_records[0].error, errors.FieldValueError)
+        dev_test.assert_fnmatches(
+            self, '%s' % error_records[2], '* (R5C1): row must contain 3 fields but only has 2: *')
+
+    def test_fails_on_first_broken_row_in_batch(self):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO(self._DATA_TEXT) as data_stream:
+            with validio.Reader(cid, data_stream, batch_size=1000) as reader:
+                try:
+                    reader.validate_rows()
+                    self.fail('broken data must cause FieldValueError')
+                except errors.FieldValueError as error:
+                    dev_test.assert_error_fnmatches(
+                        self, error,
+                        "* (R3C1): cannot accept field 'customer_id': value must be an integer number: 'x2'")
+
+    def test_fails_on_broken_data_format_after_rows_read_in_batch(self):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO('customer_id,gender,name\n1,female,alice\n2,male,"bob\n') as data_stream:
+            with validio.Reader(cid, data_stream, batch_size=1000) as reader:
+                rows = reader.rows()
+                self.assertEqual(['customer_id', 'gender', 'name'], next(rows))
+                self.assertEqual(['1', 'female', 'alice'], next(rows))
+                self.assertRaises(errors.DataFormatError, next, rows)
+
+
+class RowRangeTest(unittest.TestCase):
+    def _fixed_cid_and_path(self, data_text):
+        cid = interface.create_cid_from_string('\n'.join([
+            'd,format,fixed',
+            'd,line delimiter,lf',
+            'd,encoding,cp1252',
+            'f,name,,,4',
+            'f,size,,,3,Integer',
+        ]))
+        fixed_path = dev_test.path_to_test_result('test_can_read_row_range.txt')
+        with io.open(fixed_path, 'w', encoding='cp1252', newline='') as fixed_file:
+            fixed_file.write(data_text)
+        return cid, fixed_path
+
+    def test_can_read_row_range_of_fixed_file(self):
+        cid, fixed_path = self._fixed_cid_and_path('john172\nmary163\nbill167\njane184\n')
+        self.assertEqual([['mary', '163'], ['bill', '167']], list(validio.rows(cid, fixed_path, row_range=(1, 3))))
+        self.assertEqual([['jane', '184']], list(validio.rows(cid, fixed_path, row_range=(3, None))))
+        self.assertEqual([], list(validio.rows(cid, fixed_path, row_range=(7, 9))))
+
+    def test_can_read_row_range_of_delimited_data(self):
+        cid = interface.create_cid_from_string('\n'.join([
+            'd,format,delimited',
+            'f,name',
+            'f,size,,,,Integer',
+        ]))
+        with io.StringIO('john,172\nmary,163\nbill,167\n') as delimited_stream:
+            self.assertEqual(
+                [['mary', '163'], ['bill', '167']], list(validio.rows(cid, delimited_stream, row_range=(1, None))))
+
+    def test_fails_on_broken_row_in_row_range(self):
+        cid, fixed_path = self._fixed_cid_and_path('john172\nmary163\nbill1x7\njane184\n')
+        self.assertEqual([['john', '172'], ['mary', '163']], list(validio.rows(cid, fixed_path, row_range=(0, 2))))
+        with validio.Reader(cid, fixed_path, row_range=(1, 4)) as reader:
+            try:
+                reader.validate_rows()
+                self.fail('broken data must cause FieldValueError')
+            except errors.FieldValueError as error:
+                dev_test.assert_error_fnmatches(
+                    self, error, "* (R3C2): cannot accept field 'size': value must be an integer number: '1x7'")
+
+
+class MergeCheckStatesTest(unittest.TestCase):
+    _CID_TEXT = '\n'.join([
+        'd,format,delimited',
+        'f,customer_id,,,,Integer',
+        'f,name',
+        'c,customer must be unique,IsUnique,customer_id',
+        'c,few names,DistinctCount,name < 3',
+    ])
+
+    def _shard_check_states(self, data_text):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        with io.StringIO(data_text) as shard_stream:
+            with validio.Reader(cid, shard_stream) as reader:
+                reader.validate_rows()
+                result = reader.check_states()
+                reader.close(check_at_end=False)
+        return result
+
+    def _merge_and_close(self, *data_texts):
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        validator = validio.BaseValidator(cid)
+        for data_text in data_texts:
+            validator.merge_check_states(self._shard_check_states(data_text))
+        validator.close()
+
+    def test_can_merge_check_states(self):
+        self._merge_and_close('1,a\n2,b\n', '3,a\n4,b\n')
+
+    def test_fails_on_duplicate_in_merged_check_states(self):
+        self.assertRaises(errors.CheckError, self._merge_and_close, '1,a\n2,b\n', '3,a\n1,b\n')
+
+    def test_fails_on_distinct_count_in_merged_check_states(self):
+        self.assertRaises(errors.CheckError, self._merge_and_close, '1,a\n2,b\n', '3,c\n4,b\n')
+
+
+class CheckpointTest(unittest.TestCase):
+    _CID_TEXT = '\n'.join([
+        'd,format,delimited',
+        'd,encoding,utf-8',
+        'd,header,1',
+        'f,customer_id,,,,Integer',
+        'f,name',
+        'c,customer must be unique,IsUnique,customer_id',
+        'c,few names,DistinctCount,name < 6',
+    ])
+
+    _FIXED_CID_TEXT = '\n'.join([
+        'd,format,fixed',
+        'd,encoding,ascii',
+        'd,line delimiter,lf',
+        'f,customer_id,,,4,Integer',
+        'f,name,,,6',
+        'c,customer must be unique,IsUnique,customer_id',
+    ])
+
+    def setUp(self):
+        self._data_path = dev_test.path_to_test_result('test_can_resume_from_checkpoint.csv')
+        self._checkpoint_path = self._data_path + '.checkpoint'
+        if os.path.exists(self._checkpoint_path):
+            os.remove(self._checkpoint_path)
+        self._write_data('customer_id,name\n1,a\n2,"b\nc"\n', 'w')
+
+    def _write_data(self, data_text, mode='a'):
+        with io.open(self._data_path, mode, newline='', encoding='utf-8') as data_stream:
+            data_stream.write(data_text)
+
+    def _resumed_rows(self, cid_text=_CID_TEXT):
+        cid = interface.create_cid_from_string(cid_text)
+        return list(validio.rows(cid, self._data_path, checkpoint_path=self._checkpoint_path))
+
+    def test_can_resume_from_checkpoint(self):
+        self.assertEqual([['customer_id', 'name'], ['1', 'a'], ['2', 'b\nc']], self._resumed_rows())
+        self.assertTrue(os.path.exists(self._checkpoint_path))
+        self.assertEqual([], self._resumed_rows())
+        self._write_data('3,"d, e"\n4,a\n')
+        self.assertEqual([['3', 'd, e'], ['4', 'a']], self._resumed_rows())
+        self._write_data('5,b\n')
+        self.assertEqual([['5', 'b']], self._resumed_rows())
+
+    def test_can_read_incomplete_record_again(self):
+        self._write_data('3,"d')
+        self.assertRaises(errors.DataFormatError, self._resumed_rows)
+        self._write_data('"\n4,e')
+        self.assertEqual([['3', 'd'], ['4', 'e']], self._resumed_rows())
+        self._write_data('f\n')
+        self.assertEqual([['4', 'ef']], self._resumed_rows())
+
+    def test_can_ignore_checkpoint_of_changed_data(self):
+        self._resumed_rows()
+        self._write_data('customer_id,name\n1,x\n2,"b\nc"\n3,d\n', 'w')
+        self.assertEqual(4, len(self._resumed_rows()))
+        self._write_data('customer_id,name\n1,x\n', 'w')
+        self.assertEqual(2, len(self._resumed_rows()))
+
+    def test_can_ignore_checkpoint_of_changed_large_data(self):
+        data_lines = ['customer_id,name\n'] + ['%d,name\n' % customer_id for customer_id in range(10000)]
+        self._write_data(''.join(data_lines), 'w')
+        self.assertEqual(10001, len(self._resumed_rows()))
+        self.assertEqual(0, len(self._resumed_rows()))
+        self._write_data(''.join(data_lines).replace('0,name', '0,NAME', 1), 'w')
+        self.assertEqual(10001, len(self._resumed_rows()))
+
+    def test_can_ignore_checkpoint_of_changed_cid(self):
+        self._resumed_rows()
+        self.assertEqual(3, len(self._resumed_rows(self._CID_TEXT.replace('name < 6', 'name < 7'))))
+
+    def test_can_ignore_broken_checkpoint(self):
+        with io.open(self._checkpoint_path, 'wb') as checkpoint_file:
+            checkpoint_file.write(b'broken')
+        self.assertEqual(3, len(self._resumed_rows()))
+
+    def test_can_resume_fixed_data_from_checkpoint(self):
+        self._write_data('1   a     \n2   b     \n', 'w')
+        self.assertEqual([['1   ', 'a     '], ['2   ', 'b     ']], self._resumed_rows(self._FIXED_CID_TEXT))
+        self._write_data('3   c     \n4   d')
+        self.assertRaises(errors.DataFormatError, self._resumed_rows, self._FIXED_CID_TEXT)
+        self._write_data('     \n')
+        self.assertEqual([['4   ', 'd     ']], self._resumed_rows(self._FIXED_CID_TEXT))
+        self._write_data('2   e     \n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError, "* (R5C1): values for *'customer_id'* must be unique: ('2   ',) (see also: * (R2C1): *)",
+            self._resumed_rows, self._FIXED_CID_TEXT)
+
+    def test_fails_on_broken_appended_data_at_same_location_as_without_checkpoint(self):
+        self._resumed_rows()
+        self._write_data('3,d\nx,e\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.FieldValueError, "* (R5C1): cannot accept field 'customer_id': *", self._resumed_rows)
+        self._write_data('customer_id,name\n1,a\n2,"b\nc"\n3,d\n4,"e\n', 'w')
+        cid = interface.create_cid_from_string(self._CID_TEXT)
+        try:
+            list(validio.rows(cid, self._data_path))
+            self.fail('broken data must cause DataFormatError')
+        except errors.DataFormatError as error:
+            expected_message = str(error)
+        for _ in range(2):
+            try:
+                self._resumed_rows()
+                self.fail('broken data must cause DataFormatError')
+            except errors.DataFormatError as error:
+                self.assertEqual(expected_message, str(error))
+
+    def test_can_resume_from_checkpoint_with_unique_keys_on_disk(self):
+        def resumed_unique_check_and_rows():
+            # Use a memory budget so small that all keys have to be moved to disk.
+            cid = interface.create_cid_from_string(self._CID_TEXT.replace(
+                'IsUnique,customer_id', 'IsUnique,memory(0) customer_id'))
+            unique_check = cid.check_map['customer must be unique']
+            with validio.Reader(cid, self._data_path, checkpoint_path=self._checkpoint_path) as reader:
+                rows = list(reader.rows())
+                self.assertTrue(unique_check._row_key_store.is_on_disk)
+            return rows
+
+        self._write_data(''.join('%d,a\n' % customer_id for customer_id in range(3, 30)))
+        self.assertEqual(30, len(resumed_unique_check_and_rows()))
+        self._write_data('30,b\n')
+        self.assertEqual([['30', 'b']], resumed_unique_check_and_rows())
+        self._write_data('31,c\n17,d\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError,
+            "* (R33C1): values for *'customer_id'* must be unique: ('17',) (see also: * (R18C1): *)",
+            resumed_unique_check_and_rows)
+
+    def test_fails_on_checks_with_rows_before_checkpoint(self):
+        self._resumed_rows()
+        self._write_data('3,d\n1,e\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError,
+            "* (R5C1): values for *'customer_id'* must be unique: ('1',) (see also: * (R2C1): location of first occurrence)",
+            self._resumed_rows)
+        self._write_data('customer_id,name\n1,a\n2,"b\nc"\n3,d\n4,e\n5,f\n', 'w')
+        self._resumed_rows()
+        self._write_data('6,g\n')
+        dev_test.assert_raises_and_fnmatches(
+            self, errors.CheckError, "* distinct count is 6 but check requires: 'count < 6'", self._resumed_rows)
+
+
 class WriterTest(unittest.TestCase):
     def setUp(self):
         standard_delimited_cid_text = '\n'.join([
@@ -265,6 +734,51 @@ class WriterTest(unittest.TestCase):
                 delimited_writer.write_row(['height'])
                 self.assertRaises(errors.FieldValueError, delimited_writer.write_row, ['abc'])
 
+    def test_can_write_same_data_in_blocks(self):
+        rows_to_write = [['Miller', '173', '1967-05-23'], ['Webster', '167', '1983-11-02']] * 5
+        for cid in (self._standard_delimited_cid, self._standard_fixed_cid):
+            with io.StringIO() as expected_stream:
+                with validio.Writer(cid, expected_stream) as writer:
+                    for row_to_write in rows_to_write:
+                        writer.write_row(row_to_write)
+                expected_data = expected_stream.getvalue()
+            for buffer_size in (1, 3, 1000):
+                with io.StringIO() as stream:
+                    with validio.Writer(cid, stream, buffer_size) as writer:
+                        self.assertEqual(buffer_size, writer.buffer_size)
+                        writer.write_rows(iter(rows_to_write))
+                    self.assertEqual(expected_data, stream.getvalue())
+
+    def test_can_write_header_in_blocks(self):
+        cid_with_header_text = '\n'.join([
+            'd,format,delimited',
+            'd,header,2',
+            ' ,name   ,,empty,length,type,rule',
+            'f,height ,,     ,      ,Integer',
+        ])
+        cid_with_header = interface.create_cid_from_string(cid_with_header_text)
+        with io.StringIO() as delimited_stream:
+            with validio.Writer(cid_with_header, delimited_stream, 2) as delimited_writer:
+                delimited_writer.write_row(['some', 'header', 'columns'])
+                delimited_writer.write_rows([['height'], ['173'], ['167']])
+            data_written = dev_test.unified_newlines(delimited_stream.getvalue())
+        self.assertEqual('some,header,columns\nheight\n173\n167\n', data_written)
+
+    def test_fails_on_broken_row_in_block_after_writing_rows_before_it(self):
+        with io.StringIO() as delimited_stream:
+            with validio.Writer(self._standard_delimited_cid, delimited_stream) as delimited_writer:
+                dev_test.assert_raises_and_fnmatches(
+                    self, errors.FieldValueError, "* (R3C2): cannot accept field 'height': *",
+                    delimited_writer.write_rows, [
+                        ['Miller', '173', '1967-05-23'],
+                        ['Webster', '167', '1983-11-02'],
+                        ['Baker', 'not_a_number', '1983-11-02'],
+                        ['Smith', '180', '1979-01-03']])
+                self.assertEqual(2, delimited_writer.location.line)
+                self.assertEqual(1, delimited_writer.location.cell)
+            data_written = dev_test.unified_newlines(delimited_stream.getvalue())
+        self.assertEqual('Miller,173,1967-05-23\nWebster,167,1983-11-02\n', data_written)
+
     def test_can_write_fixed_multiple_rows(self):
         with io.StringIO() as fixed_stream:
             with validio.Writer(self._standard_fixed_cid, fixed_stream) as fixed_writer: